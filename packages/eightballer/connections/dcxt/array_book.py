@@ -0,0 +1,167 @@
+"""
+Order books held in NumPy arrays, for pricing sizes against the book.
+"""
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from packages.eightballer.connections.dcxt.order_book_engine import L2OrderBook, get_field
+from packages.eightballer.protocols.order_book.custom_types import OrderBook
+
+
+def _to_levels(levels: Iterable[Sequence[Any]]) -> np.ndarray:
+    """Convert levels to an (n, 2) array of prices and sizes."""
+    array = np.array([level[:2] for level in levels], dtype=np.float64)
+    return array.reshape(-1, 2)
+
+
+class ArrayBookSide:
+    """
+    One side of a book, as contiguous price and size arrays sorted best first.
+
+    The cumulative sizes and notionals are computed once, so that every query is a
+    binary search over them rather than a walk of the levels.
+    """
+
+    def __init__(self, prices: np.ndarray, sizes: np.ndarray, descending: bool) -> None:
+        """Initialise the side."""
+        self.prices = np.ascontiguousarray(prices, dtype=np.float64)
+        self.sizes = np.ascontiguousarray(sizes, dtype=np.float64)
+        self.descending = descending
+        self.cumulative_sizes = np.cumsum(self.sizes)
+        self.cumulative_notionals = np.cumsum(self.prices * self.sizes)
+
+    @classmethod
+    def from_levels(cls, levels: Iterable[Sequence[Any]], descending: bool) -> "ArrayBookSide":
+        """Build a side from its levels, in any order."""
+        array = _to_levels(levels)
+        array = array[array[:, 1] > 0]
+        order = np.argsort(-array[:, 0] if descending else array[:, 0], kind="stable")
+        return cls(array[order, 0], array[order, 1], descending)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    @property
+    def total_size(self) -> float:
+        """Get the size of the whole side."""
+        return float(self.cumulative_sizes[-1]) if len(self) else 0.0
+
+    def _count_through(self, price: float) -> int:
+        """Get the number of levels priced at or better than a price."""
+        if self.descending:
+            return int(np.searchsorted(-self.prices, -price, side="right"))
+        return int(np.searchsorted(self.prices, price, side="right"))
+
+    def vwap(self, size: float) -> Optional[float]:
+        """Get the average price of filling a size against the side, or None if the side is too thin."""
+        if size <= 0 or size > self.total_size:
+            return None
+        index = int(np.searchsorted(self.cumulative_sizes, size, side="left"))
+        filled = self.cumulative_sizes[index - 1] if index else 0.0
+        notional = self.cumulative_notionals[index - 1] if index else 0.0
+        return float((notional + (size - filled) * self.prices[index]) / size)
+
+    def depth_at_price(self, price: float) -> float:
+        """Get the size available at a price or better."""
+        count = self._count_through(price)
+        return float(self.cumulative_sizes[count - 1]) if count else 0.0
+
+    def cumulative_depth(self) -> np.ndarray:
+        """Get the prices of the side, with the size available at each of them or better."""
+        return np.column_stack((self.prices, self.cumulative_sizes))
+
+    def top(self, depth: int) -> np.ndarray:
+        """Get the best levels of the side, as an (n, 2) array of prices and sizes."""
+        return np.column_stack((self.prices[:depth], self.sizes[:depth]))
+
+    def to_levels(self) -> list:
+        """Get the levels of the side, best first."""
+        return np.column_stack((self.prices, self.sizes)).tolist()
+
+
+class ArrayOrderBook:
+    """
+    Order book of a symbol held in NumPy arrays.
+
+    Buying a size is priced against the asks and selling against the bids, i.e.
+    `book.asks.vwap(size)` is the average price paid to buy `size`.
+    """
+
+    def __init__(
+        self,
+        exchange_id: str,
+        symbol: str,
+        bids: ArrayBookSide,
+        asks: ArrayBookSide,
+        timestamp: Optional[int] = None,
+        nonce: Optional[int] = None,
+    ) -> None:
+        """Initialise the book."""
+        self.exchange_id = exchange_id
+        self.symbol = symbol
+        self.bids = bids
+        self.asks = asks
+        self.timestamp = timestamp
+        self.nonce = nonce
+
+    @classmethod
+    def from_levels(
+        cls,
+        exchange_id: str,
+        symbol: str,
+        bids: Iterable[Sequence[Any]],
+        asks: Iterable[Sequence[Any]],
+        **kwargs: Any,
+    ) -> "ArrayOrderBook":
+        """Build a book from its bid and ask levels."""
+        return cls(
+            exchange_id,
+            symbol,
+            ArrayBookSide.from_levels(bids, descending=True),
+            ArrayBookSide.from_levels(asks, descending=False),
+            **kwargs,
+        )
+
+    @classmethod
+    def from_order_book(cls, order_book: OrderBook) -> "ArrayOrderBook":
+        """Build a book from an order book of the protocol."""
+        return cls.from_levels(
+            get_field(order_book, "exchange_id"),
+            get_field(order_book, "symbol"),
+            get_field(order_book, "bids", []),
+            get_field(order_book, "asks", []),
+            timestamp=get_field(order_book, "timestamp"),
+            nonce=get_field(order_book, "nonce"),
+        )
+
+    @classmethod
+    def from_l2(cls, book: L2OrderBook) -> "ArrayOrderBook":
+        """Build a book from a local L2 book, whose levels are already sorted."""
+        sides = []
+        for side, descending in ((book.bids, True), (book.asks, False)):
+            levels = _to_levels(side.levels())
+            sides.append(ArrayBookSide(levels[:, 0], levels[:, 1], descending))
+        return cls(book.exchange_id, book.symbol, *sides, timestamp=book.timestamp, nonce=book.sequence)
+
+    def to_order_book(self) -> OrderBook:
+        """Get the book as an order book of the protocol."""
+        return OrderBook(
+            exchange_id=self.exchange_id,
+            symbol=self.symbol,
+            bids=self.bids.to_levels(),
+            asks=self.asks.to_levels(),
+            timestamp=self.timestamp,
+            nonce=self.nonce,
+        )
+
+    @property
+    def mid_price(self) -> Optional[float]:
+        """Get the mid price, if both sides have levels."""
+        if not len(self.bids) or not len(self.asks):
+            return None
+        return float((self.bids.prices[0] + self.asks.prices[0]) / 2)
+
+    def quote(self, size: float) -> Tuple[Optional[float], Optional[float]]:
+        """Get the average prices of selling and of buying a size."""
+        return self.bids.vwap(size), self.asks.vwap(size)
@@ -0,0 +1,83 @@
+"""
+Throttling of the order books pushed to a subscription.
+"""
+import asyncio
+import time
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from packages.eightballer.connections.dcxt.order_book_engine import L2OrderBook, Level
+
+TRUE_VALUES = {"1", "true", "yes"}
+
+
+def is_true(value: Optional[bytes]) -> bool:
+    """Check whether a flag of the params of a message is set."""
+    return value is not None and value.decode().lower() in TRUE_VALUES
+
+
+def _top_of_book(book: L2OrderBook) -> Tuple[Optional[Level], Optional[Level]]:
+    return book.best_bid(), book.best_ask()
+
+
+class BookThrottle:
+    """
+    Limits the rate at which the books of a subscription are pushed.
+
+    Books are pushed as soon as the stream changes them, at most once every
+    `min_interval` seconds, and with `top_of_book_only` only when the best bid or ask
+    moved. The stream is read while a push waits on the interval, so the book pushed
+    at the end of the interval is always the latest one.
+    """
+
+    def __init__(self, min_interval: float = 0.0, max_rate: Optional[float] = None, top_of_book_only: bool = False):
+        """Initialise the throttle."""
+        if max_rate:
+            min_interval = max(min_interval, 1 / max_rate)
+        self.min_interval = min_interval
+        self.top_of_book_only = top_of_book_only
+        self._last_top: Optional[Tuple[Optional[Level], Optional[Level]]] = None
+
+    @classmethod
+    def from_params(cls, params: Optional[Dict[str, bytes]]) -> "BookThrottle":
+        """Build a throttle from the params of a subscribe message."""
+        params = params or {}
+        return cls(
+            min_interval=float(params.get("min_interval", b"0")),
+            max_rate=float(params["max_rate"]) if "max_rate" in params else None,
+            top_of_book_only=is_true(params.get("top_of_book_only")),
+        )
+
+    def _is_due(self, book: L2OrderBook) -> bool:
+        return not self.top_of_book_only or _top_of_book(book) != self._last_top
+
+    async def throttle(self, updates: AsyncIterator[L2OrderBook]) -> AsyncIterator[L2OrderBook]:
+        """Yield the updates of a book stream which are due to be pushed."""
+        changed = asyncio.Event()
+        book: Optional[L2OrderBook] = None
+
+        async def read() -> None:
+            nonlocal book
+            async for book in updates:
+                if self._is_due(book):
+                    changed.set()
+
+        reader = asyncio.ensure_future(read())
+        try:
+            while True:
+                waiter = asyncio.ensure_future(changed.wait())
+                await asyncio.wait({waiter, reader}, return_when=asyncio.FIRST_COMPLETED)
+                if not changed.is_set():
+                    waiter.cancel()
+                    reader.result()
+                    return
+                changed.clear()
+                if not self._is_due(book):
+                    continue
+                self._last_top = _top_of_book(book)
+                pushed_at = time.monotonic()
+                yield book
+                delay = self.min_interval - (time.monotonic() - pushed_at)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        finally:
+            reader.cancel()
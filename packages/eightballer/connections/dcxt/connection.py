@@ -6,22 +6,32 @@ import traceback
 from asyncio import Task
 from collections import deque
 from enum import Enum
-from typing import Any, Deque, Dict, List, Optional, cast
+from typing import Any, Deque, Dict, List, Optional, Tuple, cast
 
 from aea.connections.base import Connection, ConnectionStates
 from aea.mail.base import Envelope
 from aea.protocols.base import Message
 from aea.protocols.dialogue.base import Dialogue
+from ccxt import DDoSProtection
 
 from packages.eightballer.connections.dcxt import PUBLIC_ID, dcxt
-from packages.eightballer.connections.dcxt.interfaces.interface import ConnectionProtocolInterface
+from packages.eightballer.connections.dcxt.delivery_queue import DEFAULT_MAX_QUEUE_SIZE, ConflatingQueue
+from packages.eightballer.connections.dcxt.interfaces.interface import ConnectionProtocolInterface, get_exchange_id
+from packages.eightballer.connections.dcxt.market_cache import DEFAULT_MARKET_CACHE_TTL
+from packages.eightballer.connections.dcxt.metrics import MetricsServer
+from packages.eightballer.connections.dcxt.recorder import DEFAULT_DEPTH, MarketDataRecorder
+from packages.eightballer.connections.dcxt.scheduler import RequestScheduler
+from packages.eightballer.connections.dcxt.subscriptions import DEFAULT_STALE_AFTER
+from packages.eightballer.connections.dcxt.tasks import DEFAULT_MAX_IN_FLIGHT, TaskRegistry
 from packages.eightballer.protocols.default import DefaultMessage
 from packages.eightballer.protocols.default.custom_types import ErrorCode
 from packages.eightballer.protocols.markets.custom_types import Market
+from packages.eightballer.protocols.markets.message import MarketsMessage
 
 POLL_INTERVAL_MS = 50
 RETRY_DELAY = POLL_INTERVAL_MS * 2
 RETRY_BACKOFF = 2
+DEFAULT_METRICS_HOST = "0.0.0.0"  # nosec
 
 
 class Environment(Enum):
@@ -31,6 +41,14 @@ class Environment(Enum):
     TEST = "test"
 
 
+class ExchangeState(Enum):
+    """Readiness of an exchange client."""
+
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+
+
 class DcxtConnection(Connection):  # pylint: disable=too-many-instance-attributes
     """Ccxt connection class."""
 
@@ -45,19 +63,40 @@ class DcxtConnection(Connection):  # pylint: disable=too-many-instance-attribute
         """
         super().__init__(**kwargs)  # pragma: no cover
         self.exchange_configs = self.configuration.config.get("exchanges")
+        max_in_flight = self.configuration.config.get("max_in_flight", DEFAULT_MAX_IN_FLIGHT)
+        self.market_cache_ttl = self.configuration.config.get("market_cache_ttl", DEFAULT_MARKET_CACHE_TTL)
+        self.max_queue_size = self.configuration.config.get("max_queue_size", DEFAULT_MAX_QUEUE_SIZE)
+        self.metrics_host = self.configuration.config.get("metrics_host", DEFAULT_METRICS_HOST)
+        self.metrics_port = self.configuration.config.get("metrics_port")
+        self.metrics_server: Optional[MetricsServer] = None
+        record_dir = self.configuration.config.get("record_dir")
+        self.recorder: Optional[MarketDataRecorder] = (
+            MarketDataRecorder(record_dir, depth=self.configuration.config.get("record_depth", DEFAULT_DEPTH))
+            if record_dir
+            else None
+        )
 
         self._balances = None
 
         self._exchanges: Dict[str, Any] = {}
+        self.exchange_states: Dict[str, ExchangeState] = {}
         self._markets: Dict[str, Market]
         self._orders: asyncio.Queue = asyncio.Queue()
 
         self.done_task_checker: Optional[Task] = None
         self.task_to_request: Dict[Task, Envelope] = {}
-        self.executing_tasks: List[Task] = []
+        self.executing_tasks = TaskRegistry(
+            max_in_flight={
+                exchange_config["name"]: exchange_config["max_in_flight"]
+                for exchange_config in self.exchange_configs
+                if exchange_config.get("max_in_flight") is not None
+            },
+            default_max_in_flight=max_in_flight,
+        )
         self.done_tasks: Deque[Task] = deque()
         self.polling_tasks: List[Task] = []
-        self.queue: Optional[asyncio.Queue] = None
+        self.scheduler: Optional[RequestScheduler] = None
+        self.queue: Optional[ConflatingQueue] = None
         self.exchange_to_orders = {}
 
     async def connect(self) -> None:
@@ -66,7 +105,16 @@ class DcxtConnection(Connection):  # pylint: disable=too-many-instance-attribute
 
         :return:
         """
-        self.queue = asyncio.Queue()
+        self.queue = ConflatingQueue(maxsize=self.max_queue_size)
+        self.scheduler = RequestScheduler(
+            dispatch=self._dispatch,
+            registry=self.executing_tasks,
+            rate_limits={
+                exchange_config["name"]: exchange_config["rate_limit"]
+                for exchange_config in self.exchange_configs
+                if exchange_config.get("rate_limit") is not None
+            },
+        )
         self.protocol_interface = ConnectionProtocolInterface(
             loop=self.loop,
             logger=self.logger,
@@ -75,46 +123,97 @@ class DcxtConnection(Connection):  # pylint: disable=too-many-instance-attribute
             queue=self.queue,
             exchanges=self._exchanges,
             done_callback=self._handle_done_task,
+            scheduler=self.scheduler,
+            market_cache_ttl=self.market_cache_ttl,
+            order_book_stale_after=self.configuration.config.get("order_book_stale_after", DEFAULT_STALE_AFTER),
+            order_book_max_reconnects=self.configuration.config.get("order_book_max_reconnects"),
+            recorder=self.recorder,
         )
 
-        for exchange_config in self.exchange_configs:
-            exchange_id = exchange_config["name"]
-            self.logger.info(f"Connecting to {exchange_id}")
-            key_path = exchange_config.get("key_path")
-            wallet = exchange_config.get("wallet")
-            subaccount_id = exchange_config.get("subaccount_id")
-            environment = exchange_config.get("environment")
-            auth = {
-                "logger": self.logger,
-            }
-
-            if key_path is not None:
-                with open(key_path, "r", encoding="utf8") as key_file:
-                    private_key = key_file.read()
-                    auth.update({"private_key": private_key})
-
-            if environment == Environment.PROD.value:
-                env = Environment.PROD
-            elif environment == Environment.TEST.value:
-                env = Environment.TEST
+        # exchanges are initialised concurrently, and a venue failing to do so leaves the others available.
+        exchanges = [self._get_exchange_params(exchange_config) for exchange_config in self.exchange_configs]
+        await asyncio.gather(*[self._connect_exchange(*exchange) for exchange in exchanges])
+        self.protocol_interface.supported_protocols[MarketsMessage.protocol_id].warm_cache(self.protocol_interface)
+        self.protocol_interface.market_cache.start()
+        self._add_gauges()
+        if self.recorder is not None:
+            self.recorder.start()
+            self.logger.info(f"Recording market data to {self.recorder.directory}")
+        if self.metrics_port is not None:
+            self.metrics_server = MetricsServer(self.protocol_interface.metrics, self.metrics_host, self.metrics_port)
+            await self.metrics_server.start()
+            self.logger.info(f"Serving metrics on {self.metrics_host}:{self.metrics_port}")
+        self.state = ConnectionStates.connected
+
+    def _add_gauges(self) -> None:
+        """Expose the in-flight requests and the depth of the queues as gauges."""
+        metrics = self.protocol_interface.metrics
+        metrics.add_gauge("in_flight_requests", lambda: self.executing_tasks.running_by_exchange)
+        metrics.add_gauge(
+            "pending_requests",
+            lambda: {str(exchange_id): count for exchange_id, count in self.scheduler.pending.items()},
+        )
+        metrics.add_gauge("outbound_queue_depth", lambda: {"": self.queue.qsize()}, label=None)
+        metrics.add_gauge("order_book_gaps", lambda: self.protocol_interface.order_book_subscriptions.gaps)
+        metrics.add_gauge("order_book_updates_conflated", lambda: {"": self.queue.conflated_total}, label=None)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get a snapshot of the metrics of the connection."""
+        return self.protocol_interface.metrics.snapshot()
+
+    def _get_exchange_params(self, exchange_config: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Get the id and params of a configured exchange."""
+        exchange_id = exchange_config["name"]
+        key_path = exchange_config.get("key_path")
+        wallet = exchange_config.get("wallet")
+        subaccount_id = exchange_config.get("subaccount_id")
+        environment = exchange_config.get("environment")
+        auth = {
+            "logger": self.logger,
+        }
+
+        if key_path is not None:
+            with open(key_path, "r", encoding="utf8") as key_file:
+                private_key = key_file.read()
+                auth.update({"private_key": private_key})
+
+        if environment == Environment.PROD.value:
+            env = Environment.PROD
+        elif environment == Environment.TEST.value:
+            env = Environment.TEST
+        else:
+            raise ValueError(f"Environment {environment} not found")
+
+        params = {
+            "auth": auth,
+            "env": env,
+            "subaccount_id": subaccount_id,
+            "wallet": wallet,
+        }
+        params['kwargs'] = exchange_config.get("kwargs", {})
+        if exchange_id not in dcxt.EXCHANGE_REGISTRY:
+            raise ValueError(f"Exchange {exchange_id} not found in dcxt")
+        return exchange_id, params
+
+    async def _connect_exchange(self, exchange_id: str, params: Dict[str, Any]) -> None:
+        """Initialise an exchange client, off the event loop if its set up is blocking."""
+        self.logger.info(f"Connecting to {exchange_id}")
+        self.exchange_states[exchange_id] = ExchangeState.PENDING
+        try:
+            # the client libraries of an exchange are only imported once it is configured.
+            exchange_class = await self.loop.run_in_executor(None, dcxt.get_exchange_class, exchange_id)
+            if getattr(exchange_class, "blocking_init", False):
+                exchange = await self.loop.run_in_executor(None, lambda: exchange_class(**params))
             else:
-                raise ValueError(f"Environment {environment} not found")
-
-            params = {
-                "auth": auth,
-                "env": env,
-                "subaccount_id": subaccount_id,
-                "wallet": wallet,
-            }
-            params['kwargs'] = exchange_config.get("kwargs", {})
-            try:
-                exchange_class = getattr(dcxt, exchange_id)
                 exchange = exchange_class(**params)
-            except AttributeError as exc:
-                raise ValueError(f"Exchange {exchange_id} not found in dcxt") from exc
-            self._exchanges.update({exchange_id: exchange})
-            self.logger.info(f"Successfully connected to {exchange_id}")
-        self.state = ConnectionStates.connected
+        except Exception as error:  # pylint: disable=broad-except
+            self.exchange_states[exchange_id] = ExchangeState.FAILED
+            self.logger.error(f"Failed to connect to {exchange_id}, e={error}")
+            return
+        self._exchanges.update({exchange_id: exchange})
+        self.exchange_states[exchange_id] = ExchangeState.READY
+        self.logger.info(f"Successfully connected to {exchange_id}")
 
     async def disconnect(self) -> None:
         """Tear down the connection."""
@@ -122,6 +221,15 @@ class DcxtConnection(Connection):  # pylint: disable=too-many-instance-attribute
             return
 
         self.state = ConnectionStates.disconnecting
+        if self.scheduler is not None:
+            self.scheduler.stop()
+        self.protocol_interface.market_cache.stop()
+        self.protocol_interface.order_book_subscriptions.stop()
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
+        if self.recorder is not None:
+            # the pending records are written out by the recorder thread.
+            await self.loop.run_in_executor(None, self.recorder.stop)
 
         tasks = [
             task
@@ -147,10 +255,23 @@ class DcxtConnection(Connection):  # pylint: disable=too-many-instance-attribute
         for exchange in self._exchanges.values():
             await exchange.close()
 
+    @property
+    def in_flight(self) -> Dict[str, Dict[str, int]]:
+        """Get the number of in-flight requests, by exchange and protocol."""
+        return self.executing_tasks.in_flight
+
+    def invalidate_markets(self, exchange_id: Optional[str] = None) -> None:
+        """Drop the cached markets of an exchange, or of every exchange."""
+        self.protocol_interface.market_cache.invalidate(exchange_id)
+
     async def send(self, envelope: Envelope) -> None:
-        task = self._handle_req(envelope)
+        self.scheduler.submit(envelope, get_exchange_id(envelope.message))
+
+    def _dispatch(self, envelope: Envelope, exchange_id: Optional[str], metered: bool = True) -> None:
+        """Start executing a request, once the scheduler has given it an in-flight slot."""
+        task = self._handle_req(envelope, exchange_id, metered)
         task.add_done_callback(self._handle_done_task)
-        self.executing_tasks.append(task)
+        self.executing_tasks.add(task, exchange_id, str(envelope.message.protocol_id))
         self.task_to_request[task] = envelope
 
     async def receive(self, *args: Any, **kwargs: Any) -> Optional[Envelope]:
@@ -161,18 +282,31 @@ class DcxtConnection(Connection):  # pylint: disable=too-many-instance-attribute
         del args, kwargs
         return envelope
 
-    async def _execute(self, envelope=None) -> Optional[Message]:
+    async def _execute(
+        self, envelope=None, exchange_id: Optional[str] = None, metered: bool = True
+    ) -> Optional[Message]:
         dialogue: Dialogue
         try:
             dialogue = self.protocol_interface.validate_envelope(envelope)
-            return await self.protocol_interface.handle_envelope(envelope)
+            if self.exchange_states.get(exchange_id, ExchangeState.READY) != ExchangeState.READY:
+                raise ValueError(f"Exchange {exchange_id} is {self.exchange_states[exchange_id].value}")
+            response_message = await self.protocol_interface.handle_envelope(envelope)
+            self.scheduler.reset(exchange_id)
+            return response_message
+        except DDoSProtection as error:
+            delay = self.scheduler.throttle(exchange_id)
+            self.logger.warning(f"Rate limited by {exchange_id}, backing off for {delay:.2f}s. e={error}")
+            return self.get_error_message(error, envelope.message, dialogue)
         except Exception as error:  # pylint: disable=broad-except
             self.logger.error(f"Couldn't execute task, e={error} traceback={traceback.print_exc()}")
             return self.get_error_message(error, envelope.message, dialogue)
+        finally:
+            if metered:
+                self.executing_tasks.release(exchange_id)
 
-    def _handle_req(self, envelope) -> Task:
+    def _handle_req(self, envelope, exchange_id: Optional[str] = None, metered: bool = True) -> Task:
         """Create a task."""
-        return self.loop.create_task(self._execute(envelope))
+        return self.loop.create_task(self._execute(envelope, exchange_id, metered))
 
     def _handle_done_task(self, task: Task) -> None:
         """Handle completed task."""
@@ -183,7 +317,11 @@ class DcxtConnection(Connection):  # pylint: disable=too-many-instance-attribute
         if response_envelope is None:
             return
         self.logger.debug(f"Placing {response_message} in queue")
-        self.queue.put_nowait(response_envelope)
+        try:
+            self.queue.put_nowait(response_envelope)
+        except asyncio.QueueFull:
+            self.logger.warning("Delivery queue is full, waiting for the agent to catch up.")
+            self.loop.create_task(self.queue.put(response_envelope))
 
     def get_error_message(
         self,
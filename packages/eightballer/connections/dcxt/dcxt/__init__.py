@@ -1,12 +1,38 @@
 """
-Imports supported decentralised exchanges.
+Registry of the supported decentralised exchanges.
+
+Exchange classes are only imported when they are first looked up, so that an agent
+only pays for the client libraries of the venues it is configured with.
 """
-from packages.eightballer.connections.dcxt.dcxt.balancer import BalancerClient
+import importlib
+from typing import Any, Dict
+
+EXCHANGE_REGISTRY: Dict[str, str] = {
+    "lyra": "packages.eightballer.connections.dcxt.dcxt.lyra_v2:LyraClient",
+    "hundred_x": "packages.eightballer.connections.dcxt.dcxt.hundred_x:HundredXClient",
+    "balancer": "packages.eightballer.connections.dcxt.dcxt.balancer:BalancerClient",
+    "replay": "packages.eightballer.connections.dcxt.dcxt.replay:ReplayClient",
+}
+
+
+def register_exchange(exchange_id: str, class_path: str) -> None:
+    """Register an exchange class, given as `module:ClassName`."""
+    EXCHANGE_REGISTRY[exchange_id] = class_path
+
+
+def get_exchange_class(exchange_id: str) -> Any:
+    """Import and return the class of an exchange."""
+    if exchange_id not in EXCHANGE_REGISTRY:
+        raise AttributeError(f"Exchange {exchange_id} not found in dcxt")
+    module_name, class_name = EXCHANGE_REGISTRY[exchange_id].split(":")
+    exchange_class = getattr(importlib.import_module(module_name), class_name)
+    # importing a submodule binds it on the package, which would shadow an exchange of the same name.
+    globals()[exchange_id] = exchange_class
+    return exchange_class
 
-# pylint: disable=C0103
-from packages.eightballer.connections.dcxt.dcxt.hundred_x import HundredXClient
-from packages.eightballer.connections.dcxt.dcxt.lyra_v2 import LyraClient
 
-lyra = LyraClient
-hundred_x = HundredXClient
-balancer = BalancerClient
+def __getattr__(name: str) -> Any:
+    """Resolve the exchange classes lazily, i.e. `dcxt.lyra`."""
+    if name in EXCHANGE_REGISTRY:
+        return get_exchange_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
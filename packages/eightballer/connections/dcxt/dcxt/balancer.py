@@ -2,12 +2,18 @@
 Balancer exchange.
 """
 import json
-from glob import glob
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 from aea_ledger_ethereum import Account
 from balpy import balpy
 
+from packages.eightballer.connections.dcxt.dcxt.defi_exchange import (
+    DEFAULT_CALL_TIMEOUT,
+    DEFAULT_MAX_WORKERS,
+    BlockingCallExecutor,
+)
 from packages.eightballer.connections.dcxt.dcxt.exceptions import ConfigurationError, SorRetrievalException
 from packages.eightballer.protocols.balances.custom_types import Balance, Balances
 from packages.eightballer.protocols.markets.custom_types import Market, Markets
@@ -23,25 +29,36 @@ DEFAULT_ENCODING = "utf-8"
 
 
 PACKAGE_DIR = Path(__file__).parent
-ABI_DIR = PACKAGE_DIR / "abis"
+POOLS_PATH = PACKAGE_DIR / "data" / "balancer" / "mainnet.json"
+
+
+@lru_cache(maxsize=None)
+def load_pool_ids() -> dict:
+    """Read the pool IDs the first time they are used."""
+    json_data = json.loads(POOLS_PATH.read_text(encoding=DEFAULT_ENCODING))['pools']
+    if 'Element' in json_data:
+        del json_data['Element']
+    return json_data
 
-ABI_MAPPING = {
-    Path(path)
-    .stem.upper(): open(path, encoding=DEFAULT_ENCODING)  # pylint: disable=R1732
-    .read()  # pylint: disable=R1732
-    for path in glob(str(ABI_DIR / "*.json"))
-}
 
 ETH_KEYPATH = 'ethereum_private_key.txt'
 
 BASE_ASSET_ID = '0x6b175474e89094c44da98b954eedeac495271d0f'
 
+OLAS_ADDRESS = '0x0001a500a6b18995b03f44bb040a5ffc28e45cb0'
+USDC_ADDRESS = '0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48'
+WHITELISTED_POOLS = ['0xebdd200fe52997142215f7603bc28a80becdadeb000200000000000000000694']
+WHITE_LISTED_TOKENS = [OLAS_ADDRESS, USDC_ADDRESS]
+
 
 class BalancerClient:
     """
     Balancer exchange.
     """
 
+    # balpy sets up its web3 connections when the client is created.
+    blocking_init = True
+
     def __init__(self, *args, **kwargs):  # pylint: disable=super-init-not-called
         del args
         custom_kwargs = kwargs.get("kwargs", {})
@@ -72,6 +89,15 @@ class BalancerClient:
         self.gas_price = kwargs.get("gas_price", None)
         self.gas_price_premium = kwargs.get("gas_price_premium", GAS_PRICE_PREMIUM)
 
+        # balpy and web3 calls block, so they are run off the event loop.
+        # The multicall object is shared state, hence calls using it are serialised.
+        self.blocking_calls = BlockingCallExecutor(
+            "balancer",
+            max_workers=custom_kwargs.get("max_workers", DEFAULT_MAX_WORKERS),
+            timeout=custom_kwargs.get("call_timeout", DEFAULT_CALL_TIMEOUT),
+        )
+        self._multicall_lock = threading.Lock()
+
     async def fetch_markets(
         self,
         params: dict,
@@ -128,11 +154,7 @@ class BalancerClient:
         :return: The pool IDs.
         """
         # We read in the pool IDs from a file for now.
-        with open(Path(__file__).parent / 'data' / 'balancer' / "mainnet.json", "r", encoding=DEFAULT_ENCODING) as file:
-            json_data = json.loads(file.read())['pools']
-        if 'Element' in json_data:
-            del json_data['Element']
-        return json_data
+        return load_pool_ids()
 
     async def fetch_tickers(self, *args, **kwargs):
         """
@@ -151,13 +173,6 @@ class BalancerClient:
 
         # We use olas USDC as the base pair for now.
 
-        OLAS_ADDRESS = '0x0001a500a6b18995b03f44bb040a5ffc28e45cb0'
-        USDC_ADDRESS = '0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48'
-
-        WHITELISTED_POOLS = ['0xebdd200fe52997142215f7603bc28a80becdadeb000200000000000000000694']
-
-        WHITE_LISTED_TOKENS = [OLAS_ADDRESS, USDC_ADDRESS]
-
         pools_of_interest = {}
         for pool_type in params:
             for pool_id in params[pool_type]:
@@ -169,48 +184,56 @@ class BalancerClient:
 
         if not pools_of_interest:
             raise SorRetrievalException("No pools of interest found!")
-        self.bal.getOnchainData(pools_of_interest)
-        # We setup a mulkticall to ensure we have the name of all of the pools.
-
-        self.bal.mc.reset()
-        for token_address in self.bal.decimals:
-            if token_address not in WHITE_LISTED_TOKENS:
-                continue
-
-            contract = self.bal.erc20GetContract(token_address)
-            self.bal.mc.addCall(
-                token_address,
-                contract.abi,
-                'name',
-                args=[],
-            )
-        name_data = self.bal.mc.execute()
-
-        # We now get the symbols
-        self.bal.mc.reset()
-        for token_address in self.bal.decimals:
-            if token_address not in WHITE_LISTED_TOKENS:
-                continue
-            contract = self.bal.erc20GetContract(token_address)
-            self.bal.mc.addCall(
-                token_address,
-                contract.abi,
-                'symbol',
-                args=[],
-            )
-        symbol_data = self.bal.mc.execute()
-
-        breakpoint()
+        name_data, symbol_data = await self.blocking_calls.run(self._fetch_token_data, pools_of_interest)
 
         default_amount_usd = (
             100  # we use 100 as the default amount for now, assuming that the user has 100 of the token.
         )
         for address, name, symbol in zip(self.bal.decimals, name_data[0], symbol_data[0]):
-            print(address, name[0], symbol[0])
+            self.logger.debug(f"Token {address}: {name[0]} ({symbol[0]})")
             # We now get get the price for the swap
 
         del args, kwargs
 
+    def _fetch_token_data(self, pools_of_interest):
+        """
+        Fetches the on chain data of the pools, and the names and symbols of their tokens.
+
+        This call blocks, and is to be run on the blocking call executor.
+        """
+        with self._multicall_lock:
+            self.bal.getOnchainData(pools_of_interest)
+            # We setup a mulkticall to ensure we have the name of all of the pools.
+
+            self.bal.mc.reset()
+            for token_address in self.bal.decimals:
+                if token_address not in WHITE_LISTED_TOKENS:
+                    continue
+
+                contract = self.bal.erc20GetContract(token_address)
+                self.bal.mc.addCall(
+                    token_address,
+                    contract.abi,
+                    'name',
+                    args=[],
+                )
+            name_data = self.bal.mc.execute()
+
+            # We now get the symbols
+            self.bal.mc.reset()
+            for token_address in self.bal.decimals:
+                if token_address not in WHITE_LISTED_TOKENS:
+                    continue
+                contract = self.bal.erc20GetContract(token_address)
+                self.bal.mc.addCall(
+                    token_address,
+                    contract.abi,
+                    'symbol',
+                    args=[],
+                )
+            symbol_data = self.bal.mc.execute()
+        return name_data, symbol_data
+
     def get_params_for_swap(self, input_token_address, output_token_address, input_amount):
         """
         Given the data, we get the params for the swap from the balancer exchange.
@@ -256,6 +279,11 @@ class BalancerClient:
         del args, kwargs
         raise NotImplementedError
 
+    async def close(self):
+        """Close the client."""
+        self.blocking_calls.shutdown()
+        return True
+
     async def fetch_positions(self, positions_message: PositionsMessage, dialogue: PositionsDialogue, **kwargs):
         """
         Fetches a ticker.
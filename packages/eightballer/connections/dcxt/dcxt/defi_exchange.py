@@ -1,3 +1,40 @@
 """
 Base exchange to be used to for erc20 exchanges.
 """
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_CALL_TIMEOUT = 30
+
+
+class BlockingCallExecutor:
+    """
+    Runs the blocking calls of an exchange client on a thread pool of its own.
+
+    The pool is bounded, so a slow RPC endpoint can only tie up the threads of its
+    exchange, and calls are awaited with a timeout, so the event loop never waits on them.
+    Cancelling the awaiting task cancels the call if it has not started yet.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float = DEFAULT_CALL_TIMEOUT,
+    ) -> None:
+        """Initialise the executor."""
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"dcxt-{name}")
+
+    async def run(self, func: Callable[..., Any], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        """Run a blocking call, raising `asyncio.TimeoutError` if it takes longer than the timeout."""
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        return await asyncio.wait_for(future, timeout or self.timeout)
+
+    def shutdown(self) -> None:
+        """Stop the pool, dropping the calls which have not started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,108 @@
+"""
+Implements the catalogue of the Lyra instruments, refreshed around their listings and expiries.
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+DEFAULT_CURRENCY = "btc"
+DEFAULT_INSTRUMENT_TYPE = "perp"
+MAX_AGE = 3600.0
+SETTLE_DELAY = 5.0
+
+Scope = Tuple[str, str]
+
+
+def is_live(instrument: Dict[str, Any], now: float) -> bool:
+    """Check whether an instrument is active at a time, from its scheduled activation and deactivation."""
+    return instrument["scheduled_activation"] <= now < instrument["scheduled_deactivation"]
+
+
+class InstrumentCatalogue:
+    """
+    The Lyra instruments, keyed by name and indexed by currency and type.
+
+    Instruments are fetched by currency and type, the scope of the Lyra API, and each
+    instrument is converted once. As the activation and deactivation of every instrument
+    are scheduled, whether it is active is worked out locally, so that a scope is only
+    fetched again once one of its instruments is listed or expires, or after `max_age`
+    seconds to find the listings not yet scheduled when it was last fetched.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, str], Awaitable[List[Dict[str, Any]]]],
+        convert: Callable[[Dict[str, Any]], Any],
+        max_age: float = MAX_AGE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialise the catalogue."""
+        self.fetch = fetch
+        self.convert = convert
+        self.max_age = max_age
+        self.clock = clock
+        self.instruments: Dict[str, Dict[str, Any]] = {}
+        self.by_currency: Dict[str, Set[str]] = {}
+        self.by_type: Dict[str, Set[str]] = {}
+        self.refresh_at: Dict[Scope, float] = {}
+        self._markets: Dict[str, Tuple[bool, Any]] = {}
+        self._lock = asyncio.Lock()
+
+    def get(self, instrument_name: str) -> Optional[Dict[str, Any]]:
+        """Get the raw instrument of a name, as returned by the API."""
+        return self.instruments.get(instrument_name)
+
+    def _next_refresh(self, names: Set[str], now: float) -> float:
+        scheduled = (
+            at
+            for name in names
+            for at in (self.instruments[name]["scheduled_activation"], self.instruments[name]["scheduled_deactivation"])
+            if at > now
+        )
+        return min(now + self.max_age, min(scheduled, default=now + self.max_age) + SETTLE_DELAY)
+
+    def load(self, scope: Scope, instruments: List[Dict[str, Any]]) -> None:
+        """Replace the instruments of a scope."""
+        currency, instrument_type = scope
+        stale = self.by_currency.get(currency, set()) & self.by_type.get(instrument_type, set())
+        names = {instrument["instrument_name"] for instrument in instruments}
+        for name in stale - names:
+            del self.instruments[name]
+            self._markets.pop(name, None)
+            self.by_currency[currency].discard(name)
+            self.by_type[instrument_type].discard(name)
+        for instrument in instruments:
+            name = instrument["instrument_name"]
+            if self.instruments.get(name) != instrument:
+                self._markets.pop(name, None)
+            self.instruments[name] = instrument
+            self.by_currency.setdefault(currency, set()).add(name)
+            self.by_type.setdefault(instrument_type, set()).add(name)
+        self.refresh_at[scope] = self._next_refresh(names, self.clock())
+
+    async def _ensure(self, scope: Scope) -> None:
+        async with self._lock:
+            if self.clock() >= self.refresh_at.get(scope, 0):
+                self.load(scope, await self.fetch(*scope))
+
+    def _market(self, name: str, live: bool) -> Any:
+        cached = self._markets.get(name)
+        if cached is None or cached[0] != live:
+            cached = self._markets[name] = (live, self.convert({**self.instruments[name], "is_active": live}))
+        return cached[1]
+
+    async def markets(
+        self, currency: Optional[str] = None, instrument_type: Optional[str] = None, expired: bool = False
+    ) -> List[Any]:
+        """Get the markets of a currency and type, by default those of the Lyra API."""
+        scope = ((currency or DEFAULT_CURRENCY).lower(), (instrument_type or DEFAULT_INSTRUMENT_TYPE).lower())
+        await self._ensure(scope)
+        now = self.clock()
+        names = self.by_currency.get(scope[0], set()) & self.by_type.get(scope[1], set())
+        markets = []
+        for name in sorted(names):
+            instrument = self.instruments[name]
+            if not expired and instrument["scheduled_deactivation"] <= now:
+                continue
+            markets.append(self._market(name, is_live(instrument, now)))
+        return markets
@@ -0,0 +1,160 @@
+"""
+Implements the signing of Lyra orders, off the event loop and from the EIP-712 hashes encoded once.
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Any, Callable, Dict
+
+import eth_abi
+from eth_keys import keys
+from eth_utils import keccak, to_checksum_address
+
+MAX_FEE = "200.01"
+MAX_WORKERS = 2
+SIGNATURE_EXPIRY = 600
+WEI = Decimal(10**18)
+
+ACTION_TYPES = ["bytes32", "uint256", "uint256", "address", "bytes32", "uint256", "address", "address"]
+TRADE_TYPES = ["address", "uint256", "int256", "int256", "uint256", "uint256", "bool"]
+
+
+def to_wei(value: Any) -> int:
+    """Convert an amount in ether to wei, as web3 does, without its float rounding."""
+    return int(Decimal(str(value)) * WEI)
+
+
+class NonceAllocator:
+    """
+    Allocates the nonces of a signer, strictly increasing.
+
+    Lyra nonces are a timestamp in milliseconds followed by three digits, so a nonce
+    is allocated from the clock and, when more than one is allocated in a millisecond,
+    from the last nonce plus one, rather than from three random digits which may clash.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        """Initialise the allocator."""
+        self.clock = clock
+        self.last = 0
+
+    def allocate(self) -> int:
+        """Allocate the next nonce."""
+        self.last = max(self.last + 1, int(self.clock() * 1000) * 1000)
+        return self.last
+
+
+class OrderSigner:
+    """
+    Signs the orders of a Lyra subaccount on a pool of workers.
+
+    The domain separator, the action type hash and the addresses of the signature are
+    decoded once, so that signing an order only encodes its own fields. The orders are
+    defined on the event loop, where their nonces are allocated in order, then hashed and
+    signed on the pool, so the loop never blocks on secp256k1. `presign` starts signing
+    as soon as an order is known, i.e. a hedge ahead of the fill it hedges.
+    """
+
+    def __init__(
+        self,
+        contracts: Dict[str, str],
+        private_key: str,
+        wallet: str,
+        subaccount_id: int,
+        max_workers: int = MAX_WORKERS,
+        expiry: int = SIGNATURE_EXPIRY,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialise the signer."""
+        self.subaccount_id = int(subaccount_id)
+        self.expiry = expiry
+        self.clock = clock
+        self.nonces = NonceAllocator(clock)
+        self._key = keys.PrivateKey(bytes.fromhex(private_key[2:] if private_key.startswith("0x") else private_key))
+        self.signer = self._key.public_key.to_checksum_address()
+        self.wallet = to_checksum_address(wallet)
+        self._prefix = b"\x19\x01" + bytes.fromhex(contracts["DOMAIN_SEPARATOR"][2:])
+        self._action_typehash = bytes.fromhex(contracts["ACTION_TYPEHASH"][2:])
+        self._trade_module = to_checksum_address(contracts["TRADE_MODULE_ADDRESS"])
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lyra-signer")
+
+    def define(
+        self,
+        instrument_name: str,
+        side: str,
+        amount: float,
+        price: float,
+        order_type: str = "limit",
+        time_in_force: str = "gtc",
+        reduce_only: bool = False,
+    ) -> Dict[str, Any]:
+        """Define an order, allocating its nonce and the expiry of its signature."""
+        return {
+            "instrument_name": instrument_name,
+            "subaccount_id": self.subaccount_id,
+            "direction": side,
+            "limit_price": price,
+            "amount": amount,
+            "signature_expiry_sec": int(self.clock()) + self.expiry,
+            "max_fee": MAX_FEE,
+            "nonce": self.nonces.allocate(),
+            "signer": self.signer,
+            "order_type": order_type,
+            "mmp": False,
+            "time_in_force": time_in_force,
+            "reduce_only": reduce_only,
+        }
+
+    def typed_data_hash(self, order: Dict[str, Any], asset_address: str, base_asset_sub_id: int) -> bytes:
+        """Get the EIP-712 hash of an order."""
+        trade_data = keccak(
+            eth_abi.encode(
+                TRADE_TYPES,
+                [
+                    to_checksum_address(asset_address),
+                    int(base_asset_sub_id),
+                    to_wei(order["limit_price"]),
+                    to_wei(order["amount"]),
+                    to_wei(order["max_fee"]),
+                    order["subaccount_id"],
+                    order["direction"] == "buy",
+                ],
+            )
+        )
+        action_hash = keccak(
+            eth_abi.encode(
+                ACTION_TYPES,
+                [
+                    self._action_typehash,
+                    order["subaccount_id"],
+                    order["nonce"],
+                    self._trade_module,
+                    trade_data,
+                    order["signature_expiry_sec"],
+                    self.wallet,
+                    order["signer"],
+                ],
+            )
+        )
+        return keccak(self._prefix + action_hash)
+
+    def sign(self, order: Dict[str, Any], asset_address: str, base_asset_sub_id: int) -> Dict[str, Any]:
+        """Sign an order, returning it with its signature."""
+        signature = self._key.sign_msg_hash(self.typed_data_hash(order, asset_address, base_asset_sub_id))
+        signed = signature.r.to_bytes(32, "big") + signature.s.to_bytes(32, "big") + bytes([signature.v + 27])
+        return {**order, "signature": "0x" + signed.hex()}
+
+    def run(self, function: Callable[..., Any], *args: Any) -> "asyncio.Future[Any]":
+        """Run a function on the pool, i.e. another signature of the account."""
+        return asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    def presign(
+        self, order: Dict[str, Any], asset_address: str, base_asset_sub_id: int
+    ) -> "asyncio.Future[Dict[str, Any]]":
+        """Start signing an order on the pool, returning the future of the signed order."""
+        return self.run(self.sign, order, asset_address, base_asset_sub_id)
+
+    def close(self) -> None:
+        """Shut the pool down."""
+        self._executor.shutdown(wait=False)
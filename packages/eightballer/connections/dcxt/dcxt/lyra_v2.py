@@ -2,22 +2,36 @@
 An interface for the Lyra API.
 """
 
+import asyncio
 import datetime
 import traceback
+import uuid
 
+import aiohttp
+from ccxt import InvalidOrder
 from lyra.async_client import AsyncClient
-from lyra.enums import InstrumentType
+from lyra.enums import Environment, InstrumentType
 from lyra.enums import OrderStatus as LyraOrderStatus
 from lyra.enums import OrderType as LyraOrderType
 from lyra.enums import UnderlyingCurrency
 
+from packages.eightballer.connections.dcxt.dcxt.lyra_instruments import InstrumentCatalogue
+from packages.eightballer.connections.dcxt.dcxt.lyra_signing import OrderSigner
+from packages.eightballer.connections.dcxt.position_cache import PositionCache
+from packages.eightballer.connections.dcxt.subscriptions import reconnect_delay
+from packages.eightballer.connections.dcxt.ticker_columns import TickerColumns
+from packages.eightballer.connections.dcxt.ticker_stream import TickerTable
 from packages.eightballer.protocols.balances.custom_types import Balance, Balances
 from packages.eightballer.protocols.markets.custom_types import Market, Markets
 from packages.eightballer.protocols.order_book.custom_types import OrderBook
 from packages.eightballer.protocols.orders.custom_types import Order, Orders, OrderStatus, OrderType
-from packages.eightballer.protocols.positions.custom_types import Position
+from packages.eightballer.protocols.positions.custom_types import Position, Positions
 from packages.eightballer.protocols.tickers.custom_types import Ticker, Tickers
 
+TICKER_INTERVAL = "100"
+ORDER_BOOK_GROUP = "1"
+ORDER_BOOK_DEPTH = "100"
+
 
 def to_market(api_result):
     """Convert to a market object.
@@ -133,9 +147,41 @@ def to_ticker(api_result):
         change=float(api_result["stats"]["usd_change"]),
         percentage=float(api_result["stats"]["percent_change"]),
         baseVolume=float(api_result["stats"]["contract_volume"]),
+        markPrice=float(api_result["mark_price"]),
+        indexPrice=float(api_result["index_price"]),
     )
 
 
+def to_ticker_columns(api_results):
+    """
+    Parse the tickers of many instruments in one pass, into columns.
+
+    The string values of every ticker are gathered in a single row, in the order of
+    `ticker_columns.COLUMNS`, and the whole response is converted to floats at once.
+    """
+    symbols, timestamps, rows = [], [], []
+    for api_result in api_results:
+        stats = api_result["stats"]
+        symbols.append(api_result["instrument_name"])
+        timestamps.append(api_result["timestamp"])
+        rows.append(
+            (
+                api_result["best_bid_price"],
+                api_result["best_bid_amount"],
+                api_result["best_ask_price"],
+                api_result["best_ask_amount"],
+                api_result["mark_price"],
+                api_result["index_price"],
+                stats["high"],
+                stats["low"],
+                stats["usd_change"],
+                stats["percent_change"],
+                stats["contract_volume"],
+            )
+        )
+    return TickerColumns(symbols, timestamps, rows)
+
+
 def to_balance(api_result):
     """
     {
@@ -159,6 +205,10 @@ def to_balance(api_result):
     )
 
 
+def _optional_float(value):
+    return None if value is None else float(value)
+
+
 def to_position(api_result):
     """
     [
@@ -218,13 +268,15 @@ def to_position(api_result):
         size=float(api_result["amount"]),
         entry_price=float(api_result["average_price"]),
         realized_pnl=float(api_result["realized_pnl"]),
-        unrealized_pnl=float(api_result["unrealized_pnl"]),
-        initial_margin=float(api_result["initial_margin"]),
-        maintenance_margin=float(api_result["maintenance_margin"]),
-        notional=float(api_result["mark_value"]),
-        leverage=float(api_result["leverage"]),
-        liquidation_price=float(api_result["liquidation_price"]),
-        mark_price=float(api_result["mark_price"]),
+        # the fields marked to market are unset for a position moved by a streamed trade, until the next
+        # snapshot; options have no leverage, and perps no liquidation price until they are at risk.
+        unrealized_pnl=_optional_float(api_result["unrealized_pnl"]),
+        initial_margin=_optional_float(api_result["initial_margin"]),
+        maintenance_margin=_optional_float(api_result["maintenance_margin"]),
+        notional=_optional_float(api_result["mark_value"]),
+        leverage=_optional_float(api_result["leverage"]),
+        liquidation_price=_optional_float(api_result["liquidation_price"]),
+        mark_price=_optional_float(api_result["mark_price"]),
         exchange_id="lyra",
     )
 
@@ -333,19 +385,53 @@ class LyraClient:
 
     def __init__(self, *args, **kwargs):
         """Initialize the LyraClient."""
-        del args, kwargs
-        self.client = AsyncClient()
+        del args
+        auth = kwargs.get("auth", {})
+        self.logger = auth.get("logger")
+        env = kwargs.get("env")
+        client_params = {
+            "env": Environment(getattr(env, "value", env)) if env is not None else Environment.TEST,
+            "subaccount_id": kwargs.get("subaccount_id"),
+            "wallet": kwargs.get("wallet"),
+        }
+        if auth.get("private_key"):
+            client_params["private_key"] = auth["private_key"].strip()
+        self.client = AsyncClient(**client_params)
+        self.catalogue = InstrumentCatalogue(self._fetch_instruments, to_market)
+        self.ticker_table = TickerTable()
+        self._ticker_channels = set()
+        self._ticker_ws = None
+        self._ticker_task = None
+        self._book_channels = set()
+        self._book_task = None
+        self._books = asyncio.Queue()
+        self.position_cache = PositionCache(to_position)
+        self._position_task = None
+        self._snapshot_window = (0, 0)
+        self._signer = None
+        self._session = None
+
+    @property
+    def signer(self):
+        """Get the signer of the orders of the subaccount, created when the first order is signed."""
+        if self._signer is None:
+            if self.client.subaccount_id is None:
+                raise InvalidOrder("Lyra orders are signed for a subaccount, but no subaccount_id is configured.")
+            self._signer = OrderSigner(
+                self.client.contracts, self.client.signer.key.hex(), self.client.wallet, self.client.subaccount_id
+            )
+        return self._signer
+
+    async def _fetch_instruments(self, currency, instrument_type):
+        return await self.client.fetch_instruments(
+            instrument_type=InstrumentType(instrument_type), currency=UnderlyingCurrency(currency)
+        )
 
     async def fetch_markets(self, *args, **kwargs):
-        """Fetch all markets."""
+        """Fetch all markets, from the instrument catalogue."""
         del args
         params = kwargs.get("params", {})
-        if "currency" in params:
-            params["currency"] = UnderlyingCurrency(params["currency"].lower())
-        if "type" in params:
-            params["type"] = InstrumentType(params["type"].lower())
-        result = await self.client.fetch_instruments(**params)
-        markets = [to_market(market) for market in result]
+        markets = await self.catalogue.markets(currency=params.get("currency"), instrument_type=params.get("type"))
         markets = Markets(
             markets=markets,
         )
@@ -360,12 +446,161 @@ class LyraClient:
         if "type" in params:
             params["type"] = InstrumentType(params["type"].lower())
         result = await self.client.fetch_tickers(**params)
-        tickers = [to_ticker(ticker) for ticker in result.values()]
+        # the tickers are built as they are read, from the columns parsed in one pass.
         tickers = Tickers(
-            tickers=tickers,
+            tickers=to_ticker_columns(result.values()),
         )
         return tickers
 
+    async def watch_tickers(self, symbols=None, key=None, params=None):
+        """
+        Stream the tickers which changed, of some symbols or of every instrument matching the params.
+
+        The tickers of every subscriber are kept in one table, fed by a single websocket
+        subscribed to the ticker channels of all the symbols watched.
+        """
+        if not symbols:
+            markets = await self.fetch_markets(params=dict(params or {}))
+            symbols = [market.symbol for market in markets.markets]
+        subscription = self.ticker_table.subscribe(symbols, key)
+        try:
+            await self._subscribe_tickers(symbols)
+            async for tickers in subscription.updates():
+                yield tickers
+        finally:
+            self.ticker_table.unsubscribe(subscription)
+            if not self.ticker_table.subscribers:
+                self._stop_ticker_stream()
+
+    def unwatch_tickers(self, key):
+        """End the ticker subscription registered under a key, returning whether there was one."""
+        return self.ticker_table.unsubscribe_key(key)
+
+    async def _subscribe_tickers(self, symbols):
+        channels = {f"ticker.{symbol}.{TICKER_INTERVAL}" for symbol in symbols} - self._ticker_channels
+        self._ticker_channels |= channels
+        if self._ticker_task is None or self._ticker_task.done():
+            self._ticker_task = asyncio.ensure_future(
+                self._stream("ticker", self._connect_tickers, self._handle_ticker_message)
+            )
+        elif channels and self._ticker_ws is not None and not self._ticker_ws.closed:
+            await self._ticker_ws.send_json({"method": "subscribe", "params": {"channels": sorted(channels)}})
+
+    def _stop_ticker_stream(self):
+        if self._ticker_task is not None:
+            self._ticker_task.cancel()
+        self._ticker_task = None
+        self._ticker_channels = set()
+
+    def _handle_ticker_message(self, message):
+        if "error" in message:
+            raise ConnectionError(f"Ticker subscription failed: {message['error']}")
+        params = message.get("params") or {}
+        channel = params.get("channel", "")
+        if not channel.startswith("ticker."):
+            return
+        data = params["data"]
+        symbol = channel.split(".")[1]
+        self.ticker_table.update(
+            to_ticker({**data["instrument_ticker"], "instrument_name": symbol, "timestamp": data["timestamp"]})
+        )
+
+    async def _connect_tickers(self, websocket):
+        self._ticker_ws = websocket
+        await websocket.send_json({"method": "subscribe", "params": {"channels": sorted(self._ticker_channels)}})
+
+    async def _stream(self, name, on_connect, on_message):
+        """Run a websocket stream, reconnecting it after a jittered backoff whenever it fails."""
+        attempt = 0
+        while True:
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.ws_connect(self.client.contracts["WS_ADDRESS"]) as websocket:
+                        await on_connect(websocket)
+                        async for message in websocket:
+                            if message.type != aiohttp.WSMsgType.TEXT:
+                                break
+                            on_message(message.json())
+                            attempt = 0
+                error = ConnectionError(f"{name} stream closed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pylint: disable=broad-except
+                error = exc
+            attempt += 1
+            delay = reconnect_delay(attempt)
+            if self.logger is not None:
+                self.logger.warning(f"Lyra {name} stream failed: {error}. Reconnecting in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def watch_positions(self, key=None, params=None):
+        """
+        Stream the positions which changed, a closed position being sent once with a size of 0.
+
+        The positions are cached from a snapshot taken each time the stream connects, then
+        moved by the trades of the subaccount as they are streamed.
+        """
+        del params
+        if self.client.subaccount_id is None:
+            raise ValueError("Lyra positions are streamed for a subaccount, but no subaccount_id is configured.")
+        subscription = self.position_cache.subscribe(key=key)
+        try:
+            if self._position_task is None or self._position_task.done():
+                self._position_task = asyncio.ensure_future(
+                    self._stream("position", self._connect_positions, self._handle_position_message)
+                )
+            async for positions in subscription.updates():
+                yield positions
+        finally:
+            self.position_cache.unsubscribe(subscription)
+            if not self.position_cache.subscribers and self._position_task is not None:
+                self._position_task.cancel()
+                self._position_task = None
+
+    def unwatch_positions(self, key):
+        """End the position subscription registered under a key, returning whether there was one."""
+        return self.position_cache.unsubscribe_key(key)
+
+    async def _connect_positions(self, websocket):
+        login_id = str(uuid.uuid4())
+        await websocket.send_json(
+            {"method": "public/login", "params": self.client.sign_authentication_header(), "id": login_id}
+        )
+        channel = f"{self.client.subaccount_id}.trades"
+        await websocket.send_json({"method": "subscribe", "params": {"channels": [channel]}})
+        # the trades streamed meanwhile wait on the socket until the snapshot is loaded. The snapshot is
+        # bracketed by the time of the exchange, as it holds the trades made before it was taken and none
+        # of those made after.
+        started = await self._server_time()
+        positions = await self.client.get_positions()
+        self._snapshot_window = (started, await self._server_time())
+        self.position_cache.load(positions)
+
+    def _handle_position_message(self, message):
+        if "error" in message:
+            raise ConnectionError(f"Position subscription failed: {message['error']}")
+        params = message.get("params") or {}
+        if not params.get("channel", "").endswith(".trades"):
+            return
+        started, finished = self._snapshot_window
+        if any(started <= trade["timestamp"] <= finished for trade in params["data"]):
+            # the snapshot may or may not hold a trade made while it was taken, so it is taken again.
+            raise ConnectionError("A trade was made while the positions were snapshot")
+        for trade in params["data"]:
+            if trade["timestamp"] > finished:
+                self.position_cache.apply_trade(trade)
+
+    async def _server_time(self):
+        """Get the time of the exchange, in milliseconds."""
+        url = f"{self.client.contracts['BASE_URL']}/public/get_time"
+        async with self._get_session().post(url, json={}) as response:
+            return (await response.json())["result"]
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
     async def fetch_balance(self, *args, **kwargs):
         """Fetch all balances."""
         del args, kwargs
@@ -383,7 +618,10 @@ class LyraClient:
         if "currency" in params:
             params["currency"] = UnderlyingCurrency(params["currency"].lower())
         result = await self.client.get_positions(**params)
-        return result
+        positions = Positions(
+            positions=[to_position(position) for position in result],
+        )
+        return positions
 
     async def fetch_open_orders(self, *args, **kwargs):
         """Fetch all open orders."""
@@ -396,6 +634,53 @@ class LyraClient:
         )
         return orders
 
+    async def _instrument(self, symbol):
+        instrument = self.catalogue.get(symbol)
+        if instrument is None:
+            currency, kind = symbol.split("-")[:2]
+            await self.catalogue.markets(currency=currency, instrument_type="perp" if kind == "PERP" else "option")
+            instrument = self.catalogue.get(symbol)
+        if instrument is None:
+            raise InvalidOrder(f"Unknown instrument: {symbol}")
+        return instrument
+
+    async def prepare_order(self, symbol, type, side, amount, price, params=None):  # pylint: disable=W0622
+        """
+        Define an order and start signing it, returning the future of the signed order.
+
+        The order is signed on the pool of the signer while the caller carries on, so that
+        an order known ahead, i.e. a hedge, is ready to be submitted by the time it is needed.
+        """
+        if price is None:
+            raise InvalidOrder("Lyra orders need a limit price, the worst price of a market order.")
+        params = params or {}
+        instrument = await self._instrument(symbol)
+        order = self.signer.define(
+            symbol,
+            side,
+            amount,
+            price,
+            order_type=type,
+            time_in_force=params.get("time_in_force", "gtc"),
+            reduce_only=params.get("reduce_only", False),
+        )
+        return self.signer.presign(order, instrument["base_asset_address"], instrument["base_asset_sub_id"])
+
+    async def submit_order(self, signed_order):
+        """Submit a signed order."""
+        headers = await self.signer.run(self.client._create_signature_headers)  # pylint: disable=protected-access
+        url = f"{self.client.contracts['BASE_URL']}/private/order"
+        async with self._get_session().post(url, json=signed_order, headers=headers) as response:
+            result = await response.json()
+        if "error" in result:
+            raise InvalidOrder(f"Lyra rejected the order: {result['error']}")
+        return to_order(result["result"]["order"])
+
+    async def create_order(self, symbol, type, side, amount, price=None, params=None):  # pylint: disable=W0622
+        """Create an order, signed off the event loop."""
+        signed_order = await (await self.prepare_order(symbol, type, side, amount, price, params=params))
+        return await self.submit_order(signed_order)
+
     async def watch_order_book(self, *args, **kwargs):
         """Watch the order book."""
         params = kwargs.get("params", {})
@@ -410,6 +695,64 @@ class LyraClient:
         )
         return order_book
 
+    async def watch_order_book_for_symbols(self, symbols, params=None):
+        """
+        Get the next book of any of the symbols, all of them streamed over a single websocket.
+
+        The stream is restarted when it is asked for other symbols. Each book is a snapshot
+        of its top levels, numbered by its publish id.
+        """
+        del params
+        channels = {f"orderbook.{symbol}.{ORDER_BOOK_GROUP}.{ORDER_BOOK_DEPTH}" for symbol in symbols}
+        if channels != self._book_channels or self._book_task is None or self._book_task.done():
+            self._stop_book_stream()
+            self._book_channels = channels
+            self._book_task = asyncio.ensure_future(
+                self._stream("order book", self._connect_books, self._handle_book_message)
+            )
+        return await self._books.get()
+
+    async def un_watch_order_book_for_symbols(self, symbols, params=None):
+        """Stop streaming the books of the symbols, once none of them is watched any more."""
+        del symbols, params
+        self._stop_book_stream()
+
+    def _stop_book_stream(self):
+        if self._book_task is not None:
+            self._book_task.cancel()
+        self._book_task = None
+        self._book_channels = set()
+        # the books of the symbols streamed before are not read any more.
+        self._books = asyncio.Queue()
+
+    async def _connect_books(self, websocket):
+        await websocket.send_json({"method": "subscribe", "params": {"channels": sorted(self._book_channels)}})
+
+    def _handle_book_message(self, message):
+        if "error" in message:
+            raise ConnectionError(f"Order book subscription failed: {message['error']}")
+        params = message.get("params") or {}
+        if not params.get("channel", "").startswith("orderbook."):
+            return
+        data = params["data"]
+        self._books.put_nowait(
+            {
+                "symbol": data["instrument_name"],
+                "bids": [[float(price), float(size)] for price, size in data["bids"]],
+                "asks": [[float(price), float(size)] for price, size in data["asks"]],
+                "timestamp": data["timestamp"],
+                "nonce": data["publish_id"],
+            }
+        )
+
     async def close(self):
         """Close the client."""
+        self._stop_ticker_stream()
+        self._stop_book_stream()
+        if self._position_task is not None:
+            self._position_task.cancel()
+        if self._session is not None:
+            await self._session.close()
+        if self._signer is not None:
+            self._signer.close()
         return True
@@ -0,0 +1,175 @@
+"""
+Implements the ReplayClient class, which serves market data recorded by the connection.
+
+The recording is replayed on a clock starting at its first record, running at `speed`
+times real time, or, with a speed of 0, as fast as it is consumed, the clock then
+following the last book or tickers served so that every run is the same.
+"""
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from packages.eightballer.connections.dcxt.recorder import MarketDataReader, RecordKind
+from packages.eightballer.protocols.balances.custom_types import Balance, Balances
+from packages.eightballer.protocols.markets.custom_types import Market, Markets
+from packages.eightballer.protocols.order_book.custom_types import OrderBook
+from packages.eightballer.protocols.tickers.custom_types import Ticker, Tickers
+
+MARKETS_FILE = "markets.json"
+
+
+class ReplayFinished(Exception):
+    """The recording has no more records to replay."""
+
+
+class ReplayClock:
+    """The time of the replay, in nanoseconds of the recording."""
+
+    def __init__(self, start: int, speed: float) -> None:
+        """Initialise the clock."""
+        self.start = start
+        self.speed = speed
+        self.current = start
+        self._started_at: Optional[int] = None
+
+    def now(self) -> int:
+        """Get the current time of the recording."""
+        if not self.speed:
+            return self.current
+        if self._started_at is None:
+            self._started_at = time.monotonic_ns()
+        return self.start + int((time.monotonic_ns() - self._started_at) * self.speed)
+
+    async def wait_until(self, received_at: int) -> None:
+        """Wait until the time a record was received, at the speed of the replay."""
+        if not self.speed:
+            self.current = max(self.current, received_at)
+            return
+        delay = (received_at - self.now()) / self.speed / 1e9
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ReplayClient:
+    """
+    A client replaying the market data recorded by the connection.
+
+    :param kwargs: the `kwargs` of the exchange config, i.e. `record_dir`, the recording to replay,
+        `speed`, `source`, the exchange recorded when the recording holds several, and `balances`,
+        the balances to report, keyed by asset.
+    """
+
+    exchange_id = "replay"
+
+    def __init__(self, *args, **kwargs):
+        """Initialise the client."""
+        del args
+        config = kwargs.get("kwargs", {})
+        self.directory = Path(config["record_dir"])
+        self.reader = MarketDataReader(str(self.directory))
+        self.source: Optional[str] = config.get("source")
+        self.balances: Dict[str, float] = config.get("balances", {})
+        first_records = [next(self._read(kind), None) for kind in RecordKind]
+        start = min((record["received_at"] for record in first_records if record is not None), default=0)
+        self.clock = ReplayClock(start, float(config.get("speed", 1.0)))
+        self._books: Dict[str, Iterator[Dict[str, Any]]] = {}
+        self._tickers: Dict[str, Dict[str, Any]] = {}
+        self._ticker_records = self._read(RecordKind.TICKER)
+        self._next_ticker: Optional[Dict[str, Any]] = next(self._ticker_records, None)
+        self._symbols: Optional[List[str]] = None
+
+    def _read(self, kind: RecordKind, symbol: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        return self.reader.read(kind, exchange_id=self.source, symbol=symbol)
+
+    async def watch_order_book(self, *args, **kwargs):
+        """Get the next book of a symbol, once the replay reaches the time it was received."""
+        del kwargs
+        symbol = args[0]
+        records = self._books.get(symbol)
+        if records is None:
+            records = self._books[symbol] = self._read(RecordKind.ORDER_BOOK, symbol)
+        record = next(records, None)
+        if record is None:
+            raise ReplayFinished(f"No more books of {symbol} to replay")
+        await self.clock.wait_until(record["received_at"])
+        return OrderBook(
+            exchange_id=self.exchange_id,
+            symbol=symbol,
+            bids=record["bids"],
+            asks=record["asks"],
+            timestamp=record["timestamp"],
+            nonce=record["nonce"],
+        )
+
+    def _take_ticker(self) -> Dict[str, Any]:
+        record = self._tickers[self._next_ticker["symbol"]] = self._next_ticker
+        self._next_ticker = next(self._ticker_records, None)
+        return record
+
+    async def _replay_tickers(self) -> Dict[str, Dict[str, Any]]:
+        now = self.clock.now()
+        symbols = set()
+        while self._next_ticker is not None and self._next_ticker["received_at"] <= now:
+            symbols.add(self._take_ticker()["symbol"])
+        if not self.clock.speed:
+            # replayed as fast as it is consumed, a fetch moves the clock on over the next tickers, up to
+            # a symbol repeating, so that a recording of tickers alone is replayed too.
+            while self._next_ticker is not None and self._next_ticker["symbol"] not in symbols:
+                record = self._take_ticker()
+                symbols.add(record["symbol"])
+                await self.clock.wait_until(record["received_at"])
+        return self._tickers
+
+    @staticmethod
+    def _to_ticker(record: Dict[str, Any]) -> Dict[str, Any]:
+        ticker = {key: value for key, value in record.items() if key not in ("received_at", "exchange_id")}
+        ticker["datetime"] = ticker["timestamp"]
+        return ticker
+
+    async def fetch_tickers(self, *args, **kwargs):
+        """Fetch the last ticker of every symbol recorded up to the time of the replay."""
+        del args, kwargs
+        tickers = [Ticker(**self._to_ticker(record)) for record in (await self._replay_tickers()).values()]
+        return Tickers(tickers=tickers)
+
+    async def fetch_ticker(self, *args, **kwargs):
+        """Fetch the last ticker of a symbol recorded up to the time of the replay."""
+        del kwargs
+        record = (await self._replay_tickers()).get(args[0])
+        if record is None:
+            raise ValueError(f"No ticker of {args[0]} recorded yet")
+        return self._to_ticker(record)
+
+    def _recorded_symbols(self) -> List[str]:
+        # the recording does not change while it is replayed, so it is only read through once.
+        if self._symbols is None:
+            self._symbols = sorted({record["symbol"] for kind in RecordKind for record in self._read(kind)})
+        return self._symbols
+
+    async def fetch_markets(self, *args, **kwargs):
+        """Fetch the markets saved with the recording, or those of the symbols recorded."""
+        del args, kwargs
+        path = self.directory / MARKETS_FILE
+        if path.exists():
+            markets = [Market(**market) for market in json.loads(path.read_text(encoding="utf-8"))]
+        else:
+            markets = [
+                Market(id=symbol, lowercaseId=symbol.lower(), symbol=symbol, active=True)
+                for symbol in self._recorded_symbols()
+            ]
+        return Markets(markets=markets)
+
+    async def fetch_balance(self, *args, **kwargs):
+        """Fetch the configured balances."""
+        del args, kwargs
+        balances = [
+            Balance(asset_id=asset_id, free=float(amount), used=0, total=float(amount))
+            for asset_id, amount in self.balances.items()
+        ]
+        return Balances(balances=balances)
+
+    async def close(self):
+        """Close the client."""
+        return True
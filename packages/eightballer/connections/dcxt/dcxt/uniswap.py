@@ -42,6 +42,9 @@ class UniswapClient:
     Balancer exchange.
     """
 
+    # balpy sets up its web3 connections when the client is created.
+    blocking_init = True
+
     def __init__(self, *args, **kwargs):  # pylint: disable=super-init-not-called
         del args
         custom_kwargs = kwargs.get("kwargs", {})
@@ -0,0 +1,69 @@
+"""
+Bounded queue of the envelopes delivered by the connection to the agent.
+"""
+import asyncio
+from collections import defaultdict, deque
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_MAX_QUEUE_SIZE = 1000
+
+
+class _ConflationSlot:  # pylint: disable=too-few-public-methods
+    """Place held in the queue by the latest item of a conflation key."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Hashable) -> None:
+        self.key = key
+
+
+class ConflatingQueue(asyncio.Queue):
+    """
+    A bounded queue, conflating the items put under the same key.
+
+    Only the latest item of a key is kept until the consumer gets it, so a consumer
+    falling behind receives fresh items and the queue holds at most one item per key.
+    The number of items overwritten is counted by key. An item put with a `build`
+    function is only built when it is consumed, so the items overwritten are never built.
+    """
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: deque = deque()
+        self._latest: Dict[Hashable, Tuple[Any, Optional[Callable[[Any], Any]]]] = {}
+        self.conflated: Dict[Hashable, int] = defaultdict(int)
+
+    def _get(self) -> Any:
+        item = self._queue.popleft()
+        if isinstance(item, _ConflationSlot):
+            item, build = self._latest.pop(item.key)
+            return item if build is None else build(item)
+        return item
+
+    async def put_latest(self, key: Hashable, item: Any, build: Optional[Callable[[Any], Any]] = None) -> None:
+        """Put an item, replacing the item of the same key if it is still waiting to be consumed."""
+        if key in self._latest:
+            self._latest[key] = (item, build)
+            self.conflated[key] += 1
+            return
+        self._latest[key] = (item, build)
+        try:
+            await self.put(_ConflationSlot(key))
+        except asyncio.CancelledError:
+            del self._latest[key]
+            raise
+
+    def discard(self, key: Hashable) -> None:
+        """Drop the item of a key still waiting to be consumed, if any."""
+        if self._latest.pop(key, None) is None:
+            return
+        for slot in self._queue:
+            if isinstance(slot, _ConflationSlot) and slot.key == key:
+                self._queue.remove(slot)
+                break
+        self.task_done()
+        self._wakeup_next(self._putters)
+
+    @property
+    def conflated_total(self) -> int:
+        """Get the number of items overwritten before being consumed."""
+        return sum(self.conflated.values())
@@ -8,6 +8,7 @@ from typing import Optional
 from ccxt import RequestTimeout
 
 from packages.eightballer.connections.dcxt.interfaces.interface_base import BaseInterface
+from packages.eightballer.connections.dcxt.single_flight import make_key
 from packages.eightballer.protocols.balances.dialogues import BalancesDialogue, BaseBalancesDialogues
 from packages.eightballer.protocols.balances.message import BalancesMessage
 
@@ -32,7 +33,10 @@ class BalanceInterface(BaseInterface):
             params = {}
             for key, value in message.params.items():
                 params[key] = value.decode()
-            balances = await exchange.fetch_balance(params=params)
+            balances = await connection.single_flight.run(
+                make_key(message.exchange_id, message.performative, params),
+                lambda: exchange.fetch_balance(params=params),
+            )
             response_message = dialogue.reply(
                 performative=BalancesMessage.Performative.ALL_BALANCES,
                 target_message=message,
@@ -1,4 +1,5 @@
 """Interface."""
+import time
 from typing import Any, Callable, Dict, Optional
 
 import ccxt.async_support as ccxt  # pylint: disable=E0401,E0611
@@ -14,6 +15,20 @@ from packages.eightballer.connections.dcxt.interfaces.order_book import OrderBoo
 from packages.eightballer.connections.dcxt.interfaces.position import PositionInterface
 from packages.eightballer.connections.dcxt.interfaces.spot_asset import SpotAssetInterface
 from packages.eightballer.connections.dcxt.interfaces.ticker import TickerInterface
+from packages.eightballer.connections.dcxt.market_cache import DEFAULT_MARKET_CACHE_TTL, MarketCache
+from packages.eightballer.connections.dcxt.metrics import ConnectionMetrics
+from packages.eightballer.connections.dcxt.scheduler import is_streaming
+from packages.eightballer.connections.dcxt.single_flight import SingleFlight
+from packages.eightballer.connections.dcxt.subscriptions import DEFAULT_STALE_AFTER, SubscriptionManager
+
+
+def get_exchange_id(message: Message) -> Optional[str]:
+    """Get the id of the exchange a message is addressed to."""
+    if message.is_set("exchange_id"):
+        return message.get("exchange_id")
+    if message.is_set("order"):
+        return message.get("order").exchange_id
+    return None
 
 
 class ConnectionProtocolInterface:  # pylint: disable=too-many-instance-attributes
@@ -27,6 +42,22 @@ class ConnectionProtocolInterface:  # pylint: disable=too-many-instance-attribut
         self.executing_tasks = kwargs.get("executing_tasks")
         self.queue = kwargs.get("queue")
         self.exchanges: Dict[str, ccxt.Exchange] = kwargs.get("exchanges")
+        self.single_flight = SingleFlight()
+        self.recorder = kwargs.get("recorder")
+        self.metrics = ConnectionMetrics()
+        self.order_book_subscriptions = SubscriptionManager(
+            logger=self.logger,
+            stale_after=kwargs.get("order_book_stale_after", DEFAULT_STALE_AFTER),
+            max_reconnects=kwargs.get("order_book_max_reconnects"),
+            recorder=self.recorder,
+            metrics=self.metrics,
+        )
+        self.scheduler = kwargs.get("scheduler")
+        self.market_cache = MarketCache(
+            ttl=kwargs.get("market_cache_ttl", DEFAULT_MARKET_CACHE_TTL),
+            logger=self.logger,
+            schedule=self.scheduler.schedule if self.scheduler is not None else None,
+        )
         self.supported_protocols = {
             SpotAssetInterface.protocol_id: SpotAssetInterface(),
             OhlcvInterface.protocol_id: OhlcvInterface(),
@@ -49,7 +80,17 @@ class ConnectionProtocolInterface:  # pylint: disable=too-many-instance-attribut
         interface = self.supported_protocols.get(envelope.message.protocol_id)
         msg, dialogue, performative = interface.validate_msg(envelope.message)
         handler: Callable[[Any], Any] = interface.get_handler(performative)
-        return await handler(msg, dialogue, connection=self)
+        if is_streaming(msg):
+            return await handler(msg, dialogue, connection=self)
+        start, failed = time.perf_counter(), True
+        try:
+            response_message = await handler(msg, dialogue, connection=self)
+            failed = response_message is not None and response_message.performative.value == "error"
+            return response_message
+        finally:
+            self.metrics.observe_request(
+                interface.protocol_id.name, get_exchange_id(msg), time.perf_counter() - start, failed
+            )
 
     def build_envelope(self, request: Optional[Envelope], response_message: Optional[Message]):
         """Build the envelope."""
@@ -1,11 +1,12 @@
 """Implements the interface for market protocol."""
-from typing import Optional, cast
+from typing import Any, Awaitable, Callable, Dict, Optional, cast
 
 from aea.protocols.base import Message
 from aea.protocols.dialogue.base import Dialogue
 from ccxt import RequestTimeout
 
 from packages.eightballer.connections.dcxt.interfaces.interface_base import BaseInterface
+from packages.eightballer.connections.dcxt.single_flight import make_key
 from packages.eightballer.protocols.markets.dialogues import BaseMarketsDialogues, MarketsDialogue
 from packages.eightballer.protocols.markets.message import MarketsMessage
 
@@ -17,14 +18,32 @@ class MarketInterface(BaseInterface):
     dialogue_class = MarketsDialogue
     dialogues_class = BaseMarketsDialogues
 
+    @staticmethod
+    def fetcher(connection, exchange_id: str, params: Dict[str, Any]) -> Callable[[], Awaitable[Any]]:
+        """Get the function fetching the markets of an exchange."""
+        exchange = connection.exchanges[exchange_id]
+        key = make_key(exchange_id, MarketsMessage.Performative.GET_ALL_MARKETS, params)
+        # the exchange clients may normalise the params in place, so each call gets its own copy.
+        return lambda: connection.single_flight.run(key, lambda: exchange.fetch_markets(params=dict(params)))
+
+    def warm_cache(self, connection) -> None:
+        """Start fetching the markets of every exchange, ahead of the first request."""
+        for exchange_id in connection.exchanges:
+            connection.market_cache.warm(
+                make_key(exchange_id, MarketsMessage.Performative.GET_ALL_MARKETS, {}),
+                self.fetcher(connection, exchange_id, {}),
+            )
+
     async def get_all_markets(self, message: MarketsMessage, dialogue: Dialogue, connection) -> Optional[Message]:
         """Get all markets from the exchange."""
-        exchange = connection.exchanges[message.exchange_id]
         try:
             params = {}
             if message.currency is not None:
                 params["currency"] = message.currency
-            markets = await exchange.fetch_markets(params=params)
+            markets = await connection.market_cache.get(
+                make_key(message.exchange_id, message.performative, params),
+                self.fetcher(connection, message.exchange_id, params),
+            )
             response_message = dialogue.reply(
                 performative=MarketsMessage.Performative.ALL_MARKETS,
                 target_message=message,
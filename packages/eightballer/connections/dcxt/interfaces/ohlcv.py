@@ -7,6 +7,8 @@ from packages.eightballer.protocols.markets.custom_types import Market
 from packages.eightballer.protocols.ohlcv.dialogues import OhlcvDialogue, OhlcvDialogues
 from packages.eightballer.protocols.ohlcv.message import OhlcvMessage
 
+CANDLE_KEYS = ["timestamp", "open", "high", "low", "close", "volume"]
+
 
 def _seconds_to_timeframe(seconds=60):
     """Seconds to timeframe."""
@@ -26,8 +28,7 @@ class OhlcvInterface(BaseInterface):
     @staticmethod
     def _parse_data_to_msg(ccxt_data: List[List[int]], market: Any):
         """parse ccxt data to msg."""
-        keys = ["timestamp", "open", "high", "low", "close", "volume"]
-        candle = dict(zip(keys, ccxt_data[-1]))
+        candle = dict(zip(CANDLE_KEYS, ccxt_data[-1]))
 
         return OhlcvMessage(
             performative=OhlcvMessage.Performative.CANDLESTICK,
@@ -41,6 +42,7 @@ class OhlcvInterface(BaseInterface):
         """Poll market."""
         connection.logger.info(f"Starting to poll : {market.market_name} on {market.exchange_id}")
         exchange = connection.exchanges[market.exchange_id]
+        recorded = None
         while True:
             res = await exchange.fetchOHLCV(
                 market.market_name,
@@ -48,6 +50,12 @@ class OhlcvInterface(BaseInterface):
             )
             connection.logger.info(f"Length of candles from api call : {len(res)}")
             response_message = self._parse_data_to_msg(res, market)
+            # the last candle is still forming, so each candle is recorded once, when a newer one opened.
+            if connection.recorder is not None and len(res) > 1 and res[-2][0] != recorded:
+                recorded = res[-2][0]
+                connection.recorder.record_ohlcv(
+                    market.exchange_id, market.market_name, market.interval, dict(zip(CANDLE_KEYS, res[-2]))
+                )
             response_envelope = connection.build_envelope(request=market, response_message=response_message)
             await connection.queue.put(response_envelope)
             connection.logger.info(f"Starting to sleep until: {market.interval} for ")
@@ -1,16 +1,20 @@
 """Order protocol handler."""
+import asyncio
 import traceback
 from datetime import datetime
-from typing import Any, Dict, Optional, cast
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, cast
 
 import ccxt.async_support as ccxt  # pylint: disable=E0401,E0611
 
 from packages.eightballer.connections.dcxt.interfaces.interface_base import BaseInterface
+from packages.eightballer.connections.dcxt.scheduler import Priority
 from packages.eightballer.protocols.orders.custom_types import Order, Orders, OrderSide, OrderStatus, OrderType
-from packages.eightballer.protocols.orders.dialogues import BaseOrdersDialogues, OrdersDialogue
+from packages.eightballer.protocols.orders.dialogues import OrdersDialogue, OrdersDialogues
 from packages.eightballer.protocols.orders.message import OrdersMessage
 
 INTERVAL = 10
+MAX_BATCH_CONCURRENCY = 5
 
 
 def from_id_to_instrument_name(instrument_id):
@@ -144,12 +148,64 @@ def get_error(message: OrdersMessage, dialogue: OrdersDialogue, error_msg: str)
     return response_message
 
 
+def supports(exchange: Any, method: str, capability: str) -> bool:
+    """Check whether an exchange has a native endpoint, as advertised by ccxt or implemented by a dcxt client."""
+    has = getattr(exchange, "has", None)
+    if isinstance(has, dict):
+        return bool(has.get(capability))
+    return hasattr(exchange, method)
+
+
+Call = Callable[[], Awaitable[Any]]
+Run = Callable[[Call], Awaitable[Any]]
+
+
+def run_now(call: Call) -> Awaitable[Any]:
+    """Make a call straight away."""
+    return call()
+
+
+def metered(connection: Any, exchange_id: str, priority: Priority) -> Run:
+    """Get how the calls of a batch are made, each within the rate limit of the exchange when it is scheduled."""
+    scheduler = getattr(connection, "scheduler", None)
+    if scheduler is None:
+        return run_now
+    return partial(scheduler.schedule, exchange_id, priority=priority)
+
+
+async def fan_out(calls: List[Call], run: Run = run_now, max_concurrency: int = MAX_BATCH_CONCURRENCY) -> List[Any]:
+    """Run calls concurrently, at most `max_concurrency` at a time, returning their results or errors in order."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def limit(call: Call) -> Any:
+        async with semaphore:
+            return await run(call)
+
+    return await asyncio.gather(*(limit(call) for call in calls), return_exceptions=True)
+
+
+def order_key(order: Order, position: int) -> str:
+    """Get the key reporting the result of an order of a batch."""
+    return str(order.client_order_id or order.id or position)
+
+
+def order_params(order: Order) -> Dict[str, Any]:
+    """Get the params creating an order."""
+    return {
+        "symbol": order.symbol,
+        "amount": order.amount,
+        "price": order.price,
+        "type": order.type.name.lower(),
+        "side": order.side.name.lower(),
+    }
+
+
 class OrderInterface(BaseInterface):
     """Interface for the order protocol."""
 
     protocol_id = OrdersMessage.protocol_id
     dialogue_class = OrdersDialogue
-    dialogues_class = BaseOrdersDialogues
+    dialogues_class = OrdersDialogues
     exchange_to_orders: Dict[str, list] = {}
     open_orders: Dict[str, list] = {}
 
@@ -175,7 +231,7 @@ class OrderInterface(BaseInterface):
                 type=order.type.name.lower(),
                 side=order.side.name.lower(),
             )
-            updated_order = from_api_call(res, order.exchange_id)
+            updated_order = res if isinstance(res, Order) else from_api_call(res, order.exchange_id)
             updated_order.client_order_id = order.client_order_id
 
         except ccxt.InsufficientFunds as base_error:
@@ -294,6 +350,137 @@ class OrderInterface(BaseInterface):
             connection.logger.error(traceback.format_exc())
             return get_error(message, dialogue, str(error))
 
+    def _track(self, exchange_id: str, order: Order) -> None:
+        self.open_orders.setdefault(exchange_id, {})
+        if order.status in (OrderStatus.CANCELLED, OrderStatus.FAILED, OrderStatus.FILLED):
+            self.open_orders[exchange_id].pop(order.id, None)
+        else:
+            self.open_orders[exchange_id][order.id] = order
+
+    async def create_orders(
+        self, message: OrdersMessage, dialogue: OrdersDialogue, connection
+    ) -> Optional[OrdersMessage]:
+        """
+        Submit a batch of orders, with the batch endpoint of the exchange if it has one.
+
+        Otherwise, the orders are submitted concurrently. Either way, every order is
+        reported, those which failed with their error and a FAILED status, or CANCELLED
+        if the account had insufficient funds.
+        """
+        exchange = connection.exchanges[message.exchange_id]
+        orders = list(message.orders.orders)
+        run = metered(connection, message.exchange_id, Priority.CREATE)
+        if supports(exchange, "create_orders", "createOrders"):
+            try:
+                results: List[Any] = await run(
+                    lambda: exchange.create_orders([order_params(order) for order in orders])
+                )
+            except Exception as error:  # pylint: disable=W0703
+                results = [error] * len(orders)
+        else:
+            results = await fan_out(
+                [lambda order=order: exchange.create_order(**order_params(order)) for order in orders], run
+            )
+        created, errors = [], {}
+        for position, (order, result) in enumerate(zip(orders, results)):
+            if isinstance(result, Exception):
+                connection.logger.error(f"Failed to create order {order_key(order, position)}: {result}")
+                # as for a single order, an order the account cannot fund is cancelled rather than failed.
+                order.status = (
+                    OrderStatus.CANCELLED if isinstance(result, ccxt.InsufficientFunds) else OrderStatus.FAILED
+                )
+                errors[order_key(order, position)] = str(result)
+                created.append(order)
+                continue
+            updated_order = result if isinstance(result, Order) else from_api_call(result, message.exchange_id)
+            updated_order.client_order_id = order.client_order_id
+            self._track(message.exchange_id, updated_order)
+            created.append(updated_order)
+        return dialogue.reply(
+            target_message=message,
+            performative=OrdersMessage.Performative.ORDERS_CREATED,
+            orders=Orders(orders=created),
+            errors=errors,
+        )
+
+    async def _cancel(self, exchange: Any, orders: List[Order], run: Run = run_now) -> List[Any]:
+        """Cancel orders, per symbol with the batch endpoint of the exchange if it has one, or concurrently."""
+        if not supports(exchange, "cancel_orders", "cancelOrders"):
+            return await fan_out([lambda order=order: exchange.cancel_order(order.id) for order in orders], run)
+        by_symbol: Dict[str, List[Tuple[int, Order]]] = {}
+        for position, order in enumerate(orders):
+            by_symbol.setdefault(order.symbol, []).append((position, order))
+        results: List[Any] = [None] * len(orders)
+        for symbol, batch in by_symbol.items():
+            try:
+                ids = [order.id for _, order in batch]
+                await run(lambda ids=ids, symbol=symbol: exchange.cancel_orders(ids, symbol))
+                outcome: Any = None
+            except Exception as error:  # pylint: disable=W0703
+                outcome = error
+            for position, _ in batch:
+                results[position] = outcome
+        return results
+
+    def _cancelled(self, message: OrdersMessage, dialogue: OrdersDialogue, connection, orders, results):
+        cancelled, errors = [], {}
+        for position, (order, result) in enumerate(zip(orders, results)):
+            if isinstance(result, Exception):
+                connection.logger.error(f"Failed to cancel order {order_key(order, position)}: {result}")
+                errors[order_key(order, position)] = str(result)
+            else:
+                order.status = OrderStatus.CANCELLED
+                self._track(message.exchange_id, order)
+            cancelled.append(order)
+        return dialogue.reply(
+            target_message=message,
+            performative=OrdersMessage.Performative.ORDERS_CANCELLED,
+            orders=Orders(orders=cancelled),
+            errors=errors,
+        )
+
+    async def cancel_orders(
+        self, message: OrdersMessage, dialogue: OrdersDialogue, connection
+    ) -> Optional[OrdersMessage]:
+        """Cancel a batch of orders, reporting those which could not be cancelled with their error."""
+        exchange = connection.exchanges[message.exchange_id]
+        orders = list(message.orders.orders)
+        results = await self._cancel(exchange, orders, metered(connection, message.exchange_id, Priority.CANCEL))
+        return self._cancelled(message, dialogue, connection, orders, results)
+
+    async def cancel_all_orders(
+        self, message: OrdersMessage, dialogue: OrdersDialogue, connection
+    ) -> Optional[OrdersMessage]:
+        """
+        Cancel every open order, of a symbol if one is given, i.e. to pull all quotes at once.
+
+        Exchanges without a cancel all endpoint have their open orders fetched and cancelled as a batch.
+        """
+        exchange = connection.exchanges[message.exchange_id]
+        symbol = message.symbol if message.is_set("symbol") else None
+        run = metered(connection, message.exchange_id, Priority.CANCEL)
+        try:
+            if supports(exchange, "cancel_all_orders", "cancelAllOrders"):
+                await run(lambda: exchange.cancel_all_orders(symbol))
+                orders = [
+                    order
+                    for order in self.open_orders.get(message.exchange_id, {}).values()
+                    if symbol is None or order.symbol == symbol
+                ]
+                results: List[Any] = [None] * len(orders)
+            else:
+                open_orders = await run(lambda: exchange.fetch_open_orders(params={}))
+                if isinstance(open_orders, Orders):
+                    open_orders = open_orders.orders
+                else:
+                    open_orders = [from_api_call(order, message.exchange_id) for order in open_orders]
+                orders = [order for order in open_orders if symbol is None or order.symbol == symbol]
+                results = await self._cancel(exchange, orders, run)
+        except Exception as error:  # pylint: disable=W0703
+            connection.logger.error(f"Couldn't cancel the orders of {message.exchange_id}: {error}")
+            return get_error(message, dialogue, str(error))
+        return self._cancelled(message, dialogue, connection, orders, results)
+
     def get_order_from_message(self, message):
         """Get internal order from message."""
         return self.open_orders[message.order.exchange_id].get(message.order.id)
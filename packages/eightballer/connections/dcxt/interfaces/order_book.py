@@ -1,55 +1,92 @@
 """
 Interface for the order book protocol.
 """
-import asyncio
 from typing import Optional
 
-from aea.skills.base import Envelope
+from aea.mail.base import Envelope
 
+from packages.eightballer.connections.dcxt.book_throttle import BookThrottle, is_true
 from packages.eightballer.connections.dcxt.interfaces.interface_base import BaseInterface
-from packages.eightballer.protocols.order_book.dialogues import BaseOrderBookDialogues, OrderBookDialogue
+from packages.eightballer.connections.dcxt.order_book_engine import BookDiffTracker
+from packages.eightballer.protocols.order_book.dialogues import OrderBookDialogue, OrderBookDialogues
 from packages.eightballer.protocols.order_book.message import OrderBookMessage
 
-DEFAULT_INTERVAL = 0.1
-
 
 class OrderBookInterface(BaseInterface):
     """
-    Interface for positions protocol.
+    Interface for order book protocol.
     """
 
     protocol_id = OrderBookMessage.protocol_id
     dialogue_class = OrderBookDialogue
-    dialogues_class = BaseOrderBookDialogues
+    dialogues_class = OrderBookDialogues
 
     async def subscribe(
         self, message: OrderBookMessage, dialogue: OrderBookDialogue, connection
     ) -> Optional[OrderBookMessage]:
         """
-        Get a position from the exchange.
+        Stream the order book of a symbol, pushing it each time it changes.
         """
         exchange = connection.exchanges[message.exchange_id]
         connection.logger.info(f"Subscribing to {message.exchange_id} order book. Symbol: {message.symbol}")
+        params = message.params if message.is_set("params") else {}
+        throttle = BookThrottle.from_params(params)
+        # with diffs, the book is sent in full once, then only its changed levels.
+        tracker = BookDiffTracker() if is_true(params.get("diffs")) else None
+        key = (message.exchange_id, message.symbol, dialogue.dialogue_label.dialogue_reference)
+
+        def deliver(performative: OrderBookMessage.Performative, **kwargs) -> Envelope:
+            update = dialogue.reply(performative=performative, target_message=message, **kwargs)
+            return Envelope(to=update.to, sender=update.sender, message=update)
+
+        def deliver_book(order_book) -> Envelope:
+            return deliver(OrderBookMessage.Performative.ORDER_BOOK_UPDATE, order_book=order_book)
+
+        subscription = connection.order_book_subscriptions.subscribe(
+            message.exchange_id, exchange, message.symbol, key=dialogue.dialogue_label.dialogue_reference
+        )
         try:
-            while True:
-                book = await exchange.watch_order_book(
-                    message.symbol,
-                )
-                response_message = dialogue.reply(
-                    performative=OrderBookMessage.Performative.ORDER_BOOK_UPDATE,
-                    target_message=message,
-                    order_book=book,
-                )
-                envelope = Envelope(
-                    to=response_message.to,
-                    sender=response_message.sender,
-                    message=response_message,
-                )
-                await connection.queue.put(envelope)
-                await asyncio.sleep(DEFAULT_INTERVAL)
-        except Exception:  # pylint: disable=broad-except
-            response_message = dialogue.reply(
+            # books are only forwarded when the exchange stream changes them, as limited by the subscriber.
+            async for book in throttle.throttle(subscription.updates()):
+                if tracker is None:
+                    # only the latest book of each subscription is kept until the agent reads it, and
+                    # its reply is only built then, so the books dropped take no message id.
+                    await connection.queue.put_latest(key, book.to_order_book(), build=deliver_book)
+                elif tracker.needs_snapshot(book):
+                    await connection.queue.put(deliver_book(tracker.snapshot(book)))
+                else:
+                    diff = tracker.diff(book)
+                    if diff is None:
+                        continue
+                    # diffs build on each other so none may be dropped, the changes are conflated upstream instead.
+                    await connection.queue.put(
+                        deliver(
+                            OrderBookMessage.Performative.ORDER_BOOK_DIFF, order_book=diff, sequence=tracker.sequence
+                        )
+                    )
+        except Exception as error:  # pylint: disable=broad-except
+            connection.logger.error(f"Order book subscription to {message.exchange_id} {message.symbol} failed: {error}")
+            # a book still waiting would be replied after the error, out of order.
+            connection.queue.discard(key)
+            return dialogue.reply(
                 performative=OrderBookMessage.Performative.ERROR,
                 target_message=message,
+                error_msg=str(error),
             )
-        return response_message
+        finally:
+            connection.order_book_subscriptions.unsubscribe(subscription)
+        # every update was queued as it came, so a stream which ended has nothing more to reply.
+        return None
+
+    async def unsubscribe(
+        self, message: OrderBookMessage, dialogue: OrderBookDialogue, connection
+    ) -> Optional[OrderBookMessage]:
+        """
+        End the subscription of the dialogue, stopping the stream once no other dialogue subscribes to it.
+        """
+        connection.logger.info(f"Unsubscribing from {message.exchange_id} order book. Symbol: {message.symbol}")
+        connection.order_book_subscriptions.unsubscribe_key(dialogue.dialogue_label.dialogue_reference)
+        return dialogue.reply(
+            performative=OrderBookMessage.Performative.UNSUBSCRIBED,
+            target_message=message,
+        )
@@ -3,15 +3,16 @@ Interface for the positios protocol.
 """
 from typing import Optional
 
+from aea.mail.base import Envelope
 from ccxt import AuthenticationError, BadSymbol, RequestTimeout
 
 from packages.eightballer.connections.dcxt.interfaces.interface_base import BaseInterface
 from packages.eightballer.protocols.positions.custom_types import Position, Positions
-from packages.eightballer.protocols.positions.dialogues import BasePositionsDialogues, PositionsDialogue
+from packages.eightballer.protocols.positions.dialogues import PositionsDialogue, PositionsDialogues
 from packages.eightballer.protocols.positions.message import PositionsMessage
 
 
-def all_positions_from_api_call(api_call):
+def all_positions_from_api_call(api_call, exchange_id):
     """
     Get all positions from the exchange.
     """
@@ -19,7 +20,7 @@ def all_positions_from_api_call(api_call):
     for position in api_call:
         if "size" in position.get("info", {}):
             position["size"] = float(position["info"]["size"])
-        positions.append(Position.from_api_call(position))
+        positions.append(Position.from_api_call(position, exchange_id))
     return Positions(positions=positions)
 
 
@@ -30,7 +31,7 @@ class PositionInterface(BaseInterface):
 
     protocol_id = PositionsMessage.protocol_id
     dialogue_class = PositionsDialogue
-    dialogues_class = BasePositionsDialogues
+    dialogues_class = PositionsDialogues
 
     async def get_all_positions(
         self, message: PositionsMessage, dialogue: PositionsDialogue, connection
@@ -44,7 +45,8 @@ class PositionInterface(BaseInterface):
             for key, value in message.params.items():
                 params[key] = value.decode()
             positions = await exchange.fetch_positions(params=params)
-            positions = all_positions_from_api_call(positions)
+            if not isinstance(positions, Positions):
+                positions = all_positions_from_api_call(positions, message.exchange_id)
             response_message = dialogue.reply(
                 performative=PositionsMessage.Performative.ALL_POSITIONS,
                 target_message=message,
@@ -83,7 +85,7 @@ class PositionInterface(BaseInterface):
                 message.position_id,
             )
 
-            position = Position.from_api_call(position)
+            position = Position.from_api_call(position, message.exchange_id)
             response_message = dialogue.reply(
                 performative=PositionsMessage.Performative.POSITION,
                 target_message=message,
@@ -112,3 +114,63 @@ class PositionInterface(BaseInterface):
                 error_msg="Authentication error",
             )
         return response_message
+
+    async def subscribe(
+        self, message: PositionsMessage, dialogue: PositionsDialogue, connection
+    ) -> Optional[PositionsMessage]:
+        """
+        Stream the positions of the exchange, pushing those which changed.
+        """
+        exchange = connection.exchanges[message.exchange_id]
+        if not hasattr(exchange, "watch_positions"):
+            return dialogue.reply(
+                performative=PositionsMessage.Performative.ERROR,
+                target_message=message,
+                error_code=PositionsMessage.ErrorCode.API_ERROR,
+                error_msg=f"{message.exchange_id} does not stream positions.",
+            )
+        connection.logger.info(f"Subscribing to {message.exchange_id} positions.")
+        params = {}
+        if message.is_set("params"):
+            for key, value in message.params.items():
+                params[key] = value.decode()
+        try:
+            async for positions in exchange.watch_positions(
+                key=dialogue.dialogue_label.dialogue_reference, params=params
+            ):
+                update = dialogue.reply(
+                    performative=PositionsMessage.Performative.POSITIONS_UPDATE,
+                    target_message=message,
+                    positions=Positions(positions=positions),
+                    exchange_id=message.exchange_id,
+                )
+                # each update only holds the positions which changed, so none may be dropped.
+                await connection.queue.put(
+                    Envelope(
+                        to=update.to,
+                        sender=update.sender,
+                        message=update,
+                    )
+                )
+        except Exception as error:  # pylint: disable=broad-except
+            connection.logger.error(f"Position subscription to {message.exchange_id} failed: {error}")
+            return dialogue.reply(
+                performative=PositionsMessage.Performative.ERROR,
+                target_message=message,
+                error_code=PositionsMessage.ErrorCode.API_ERROR,
+                error_msg=str(error),
+            )
+        return None
+
+    async def unsubscribe(
+        self, message: PositionsMessage, dialogue: PositionsDialogue, connection
+    ) -> Optional[PositionsMessage]:
+        """
+        End the position subscription of the dialogue.
+        """
+        connection.logger.info(f"Unsubscribing from {message.exchange_id} positions.")
+        connection.exchanges[message.exchange_id].unwatch_positions(dialogue.dialogue_label.dialogue_reference)
+        return dialogue.reply(
+            performative=PositionsMessage.Performative.UNSUBSCRIBED,
+            target_message=message,
+        )
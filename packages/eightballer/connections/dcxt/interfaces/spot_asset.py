@@ -2,6 +2,7 @@
 import asyncio
 
 from packages.eightballer.connections.dcxt.interfaces.interface_base import BaseInterface
+from packages.eightballer.connections.dcxt.single_flight import make_key
 from packages.eightballer.protocols.spot_asset.custom_types import Decimal
 from packages.eightballer.protocols.spot_asset.dialogues import SpotAssetDialogue, SpotAssetDialogues
 from packages.eightballer.protocols.spot_asset.message import SpotAssetMessage
@@ -67,7 +68,10 @@ class SpotAssetInterface(BaseInterface):
                     res.append(balance)
                 res = {"info": {"balances": res}}
             else:
-                res = await exchange.fetch_balance(message.name)
+                res = await connection.single_flight.run(
+                    make_key(message.exchange_id, message.performative, {"name": message.name}),
+                    lambda: exchange.fetch_balance(message.name),
+                )
             connection.logger.debug("Updated balances: %s", message.exchange_id)
             if exchange is None:
                 raise ValueError("Unsupported exchange {message.exchange_id}")
@@ -3,11 +3,13 @@ Implements the interface for the Ticker protocol.
 """
 from typing import Optional
 
+from aea.mail.base import Envelope
 from ccxt import RequestTimeout
 
 from packages.eightballer.connections.dcxt.interfaces.interface_base import BaseInterface
-from packages.eightballer.protocols.tickers.custom_types import Ticker
-from packages.eightballer.protocols.tickers.dialogues import BaseTickersDialogues, TickersDialogue
+from packages.eightballer.connections.dcxt.single_flight import make_key
+from packages.eightballer.protocols.tickers.custom_types import Ticker, Tickers
+from packages.eightballer.protocols.tickers.dialogues import TickersDialogue, TickersDialogues
 from packages.eightballer.protocols.tickers.message import TickersMessage
 
 
@@ -16,7 +18,7 @@ class TickerInterface(BaseInterface):
 
     protocol_id = TickersMessage.protocol_id
     dialogue_class = TickersDialogue
-    dialogues_class = BaseTickersDialogues
+    dialogues_class = TickersDialogues
 
     async def get_all_tickers(
         self, message: TickersMessage, dialogue: TickersDialogue, connection
@@ -31,7 +33,17 @@ class TickerInterface(BaseInterface):
             if message.params is not None:
                 for key, value in message.params.items():
                     params[key] = value.decode()
-            tickers = await exchange.fetch_tickers(params=params)
+
+            async def fetch_tickers() -> Tickers:
+                tickers = await exchange.fetch_tickers(params=params)
+                # recorded by the shared call, once, rather than by each request it answers.
+                if connection.recorder is not None:
+                    connection.recorder.record_tickers(message.exchange_id, tickers.tickers)
+                return tickers
+
+            tickers = await connection.single_flight.run(
+                make_key(message.exchange_id, message.performative, params), fetch_tickers
+            )
             response_message = dialogue.reply(
                 performative=TickersMessage.Performative.ALL_TICKERS,
                 target_message=message,
@@ -61,6 +73,8 @@ class TickerInterface(BaseInterface):
                 params[key] = value.decode()
             ticker = await exchange.fetch_ticker(message.symbol, params=params)
             ticker = Ticker(**ticker)
+            if connection.recorder is not None:
+                connection.recorder.record_ticker(message.exchange_id, ticker)
             response_message = dialogue.reply(
                 performative=TickersMessage.Performative.TICKER,
                 target_message=message,
@@ -75,3 +89,68 @@ class TickerInterface(BaseInterface):
                 error_data={},
             )
         return response_message
+
+    async def subscribe(
+        self, message: TickersMessage, dialogue: TickersDialogue, connection
+    ) -> Optional[TickersMessage]:
+        """
+        Stream the tickers of the exchange, pushing those which changed.
+        """
+        exchange = connection.exchanges[message.exchange_id]
+        if not hasattr(exchange, "watch_tickers"):
+            return dialogue.reply(
+                performative=TickersMessage.Performative.ERROR,
+                target_message=message,
+                error_code=TickersMessage.ErrorCode.API_ERROR,
+                error_msg=f"{message.exchange_id} does not stream tickers.",
+                error_data={},
+            )
+        connection.logger.info(f"Subscribing to {message.exchange_id} tickers.")
+        params = {}
+        if message.is_set("params"):
+            for key, value in message.params.items():
+                params[key] = value.decode()
+        symbols = message.symbols if message.is_set("symbols") else None
+        try:
+            async for tickers in exchange.watch_tickers(
+                symbols, key=dialogue.dialogue_label.dialogue_reference, params=params
+            ):
+                if connection.recorder is not None:
+                    connection.recorder.record_tickers(message.exchange_id, tickers)
+                update = dialogue.reply(
+                    performative=TickersMessage.Performative.TICKERS_UPDATE,
+                    target_message=message,
+                    tickers=Tickers(tickers=tickers),
+                    exchange_id=message.exchange_id,
+                )
+                # each update only holds the tickers which changed, so none may be dropped.
+                await connection.queue.put(
+                    Envelope(
+                        to=update.to,
+                        sender=update.sender,
+                        message=update,
+                    )
+                )
+        except Exception as error:  # pylint: disable=broad-except
+            connection.logger.error(f"Ticker subscription to {message.exchange_id} failed: {error}")
+            return dialogue.reply(
+                performative=TickersMessage.Performative.ERROR,
+                target_message=message,
+                error_code=TickersMessage.ErrorCode.API_ERROR,
+                error_msg=str(error),
+                error_data={},
+            )
+        return None
+
+    async def unsubscribe(
+        self, message: TickersMessage, dialogue: TickersDialogue, connection
+    ) -> Optional[TickersMessage]:
+        """
+        End the ticker subscription of the dialogue.
+        """
+        connection.logger.info(f"Unsubscribing from {message.exchange_id} tickers.")
+        connection.exchanges[message.exchange_id].unwatch_tickers(dialogue.dialogue_label.dialogue_reference)
+        return dialogue.reply(
+            performative=TickersMessage.Performative.UNSUBSCRIBED,
+            target_message=message,
+        )
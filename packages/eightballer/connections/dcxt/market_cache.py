@@ -0,0 +1,121 @@
+"""
+In memory cache of the market metadata of the exchanges.
+"""
+import asyncio
+import time
+from asyncio import Task
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+DEFAULT_MARKET_CACHE_TTL = 300
+
+
+class MarketCache:
+    """
+    Caches the markets of the exchanges, keyed by exchange and request params.
+
+    Entries older than the ttl are still served, while a refresh runs in the background,
+    so only the very first request for a key waits on the exchange. A refresher loop
+    keeps every known entry fresh, and entries can be invalidated explicitly.
+
+    The background refreshes are made through `schedule`, i.e. the request scheduler,
+    so that they count against the rate limits of the exchanges.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_MARKET_CACHE_TTL,
+        logger: Any = None,
+        schedule: Optional[Callable[[str, Callable[[], Awaitable[Any]]], Awaitable[Any]]] = None,
+    ) -> None:
+        """Initialise the cache."""
+        if ttl <= 0:
+            raise ValueError(f"The market cache ttl must be positive, not {ttl}")
+        self.ttl = ttl
+        self.logger = logger
+        self.schedule = schedule
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._fetchers: Dict[Tuple, Callable[[], Awaitable[Any]]] = {}
+        self._refreshing: Dict[Tuple, Task] = {}
+        self._refresher: Optional[Task] = None
+
+    def __contains__(self, key: Tuple) -> bool:
+        return key in self._entries
+
+    def is_stale(self, key: Tuple) -> bool:
+        """Check whether an entry is missing or older than the ttl."""
+        entry = self._entries.get(key)
+        return entry is None or time.monotonic() - entry[0] > self.ttl
+
+    async def get(self, key: Tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Get the markets for a key, fetching them only on a cold cache."""
+        self._fetchers[key] = fetch
+        entry = self._entries.get(key)
+        if entry is None:
+            return await self._fetch(key)
+        if self.is_stale(key):
+            self.refresh(key)
+        return entry[1]
+
+    async def _fetch(self, key: Tuple) -> Any:
+        markets = await self._fetchers[key]()
+        self._entries[key] = (time.monotonic(), markets)
+        return markets
+
+    async def _refresh(self, key: Tuple) -> Any:
+        if self.schedule is None:
+            return await self._fetch(key)
+        return await self.schedule(key[0], lambda: self._fetch(key))
+
+    def refresh(self, key: Tuple) -> Optional[Task]:
+        """Refresh an entry in the background."""
+        if key in self._refreshing:
+            return self._refreshing[key]
+        if key not in self._fetchers:
+            return None
+        task = asyncio.ensure_future(self._refresh(key))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda done: self._on_refreshed(key, done))
+        return task
+
+    def _on_refreshed(self, key: Tuple, task: Task) -> None:
+        # a refresh cancelled by an invalidation may be done after another has started for the key.
+        if self._refreshing.get(key) is task:
+            del self._refreshing[key]
+        if task.cancelled() or task.exception() is None:
+            return
+        if self.logger is not None:
+            self.logger.warning(f"Failed to refresh markets for {key[0]}: {task.exception()}")
+
+    def invalidate(self, exchange_id: Optional[str] = None) -> None:
+        """Drop the cached markets of an exchange, or of every exchange, cancelling their refreshes."""
+        for key in list(self._entries):
+            if exchange_id is None or key[0] == exchange_id:
+                del self._entries[key]
+        # a refresh still running would otherwise store the markets fetched before the invalidation.
+        for key in list(self._refreshing):
+            if exchange_id is None or key[0] == exchange_id:
+                self._refreshing.pop(key).cancel()
+
+    def warm(self, key: Tuple, fetch: Callable[[], Awaitable[Any]]) -> Optional[Task]:
+        """Fetch the markets for a key ahead of the first request."""
+        self._fetchers[key] = fetch
+        return self.refresh(key)
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.ttl / 2)
+            for key in list(self._fetchers):
+                self.refresh(key)
+
+    def start(self) -> None:
+        """Start keeping the cached entries fresh."""
+        if self._refresher is None:
+            self._refresher = asyncio.ensure_future(self._refresh_forever())
+
+    def stop(self) -> None:
+        """Stop refreshing the cached entries."""
+        for task in [self._refresher, *self._refreshing.values()]:
+            if task is not None:
+                task.cancel()
+        self._refresher = None
+        self._refreshing.clear()
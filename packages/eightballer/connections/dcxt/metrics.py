@@ -0,0 +1,202 @@
+"""
+Metrics of the requests handled by the connection, and the endpoint serving them.
+"""
+import json
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_RATE_WINDOW = 10.0
+PROMETHEUS_CONTENT_TYPE = "text/plain"
+METRIC_PREFIX = "dcxt"
+
+
+class Histogram:
+    """Fixed bucket histogram, with the same semantics as a Prometheus histogram."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Initialise the histogram."""
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Get the cumulative count of each bucket, as Prometheus `le` labels."""
+        total, result = 0, []
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((str(bound), total))
+        result.append(("+Inf", self.count))
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the histogram as a dict."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "buckets": dict(self.cumulative()),
+        }
+
+
+class RateCounter:
+    """Counts events, and their rate over the last completed window."""
+
+    def __init__(self, window: float = DEFAULT_RATE_WINDOW) -> None:
+        """Initialise the counter."""
+        self.window = window
+        self.total = 0
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._rate = 0.0
+
+    def _roll(self, now: float) -> None:
+        elapsed = now - self._window_start
+        if elapsed < self.window:
+            return
+        # windows without any event bring the rate down to zero
+        self._rate = self._window_count / self.window if elapsed < 2 * self.window else 0.0
+        self._window_start = now
+        self._window_count = 0
+
+    def increment(self) -> None:
+        """Record an event."""
+        self._roll(time.monotonic())
+        self.total += 1
+        self._window_count += 1
+
+    @property
+    def rate(self) -> float:
+        """Get the number of events per second."""
+        self._roll(time.monotonic())
+        return self._rate
+
+
+def _labels(**labels: Any) -> str:
+    return ",".join(f'{key}="{value}"' for key, value in labels.items())
+
+
+class ConnectionMetrics:
+    """
+    Collects the metrics of the connection.
+
+    Request latencies and errors are recorded per interface and exchange, order book
+    updates per exchange and symbol. Gauges, i.e. the in-flight requests and the depth
+    of the queues, are read from their source when the metrics are rendered.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """Initialise the metrics."""
+        self.buckets = buckets
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.errors: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.order_book_updates: Dict[Tuple[str, str], RateCounter] = {}
+        self.gauges: Dict[str, Tuple[Optional[str], Callable[[], Dict[str, float]]]] = {}
+
+    def observe_request(self, interface: str, exchange_id: Optional[str], seconds: float, error: bool) -> None:
+        """Record a handled request."""
+        key = (interface, str(exchange_id))
+        if key not in self.latency:
+            self.latency[key] = Histogram(self.buckets)
+        self.latency[key].observe(seconds)
+        if error:
+            self.errors[key] += 1
+
+    def observe_order_book_update(self, exchange_id: str, symbol: str) -> None:
+        """Record an order book update."""
+        key = (exchange_id, symbol)
+        if key not in self.order_book_updates:
+            self.order_book_updates[key] = RateCounter()
+        self.order_book_updates[key].increment()
+
+    def add_gauge(self, name: str, read: Callable[[], Dict[str, float]], label: Optional[str] = "exchange_id") -> None:
+        """Add a gauge, read as values keyed by the value of its label, or by "" if it has none."""
+        self.gauges[name] = (label, read)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the current metrics as a dict."""
+        return {
+            "requests": {
+                f"{interface}/{exchange_id}": {
+                    "latency": histogram.to_dict(),
+                    "errors": self.errors.get((interface, exchange_id), 0),
+                }
+                for (interface, exchange_id), histogram in self.latency.items()
+            },
+            "order_book_updates": {
+                f"{exchange_id}/{symbol}": {"total": counter.total, "rate": counter.rate}
+                for (exchange_id, symbol), counter in self.order_book_updates.items()
+            },
+            "gauges": {name: read() for name, (_, read) in self.gauges.items()},
+        }
+
+    def render_prometheus(self) -> str:
+        """Render the current metrics in the Prometheus text format."""
+        latency, errors = f"{METRIC_PREFIX}_request_latency_seconds", f"{METRIC_PREFIX}_request_errors_total"
+        updates = f"{METRIC_PREFIX}_order_book_updates_total"
+        lines = [f"# TYPE {latency} histogram"]
+        for (interface, exchange_id), histogram in self.latency.items():
+            labels = _labels(interface=interface, exchange_id=exchange_id)
+            for bound, count in histogram.cumulative():
+                lines.append(f'{latency}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"{latency}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{latency}_count{{{labels}}} {histogram.count}")
+        lines.append(f"# TYPE {errors} counter")
+        for (interface, exchange_id), count in self.errors.items():
+            lines.append(f"{errors}{{{_labels(interface=interface, exchange_id=exchange_id)}}} {count}")
+        lines.append(f"# TYPE {updates} counter")
+        for (exchange_id, symbol), counter in self.order_book_updates.items():
+            lines.append(f"{updates}{{{_labels(exchange_id=exchange_id, symbol=symbol)}}} {counter.total}")
+        for name, (label, read) in self.gauges.items():
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} gauge")
+            for key, value in read().items():
+                labels = f"{{{_labels(**{label: key})}}}" if label is not None else ""
+                lines.append(f"{METRIC_PREFIX}_{name}{labels} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Serves the metrics of the connection over http, at /metrics and /stats."""
+
+    def __init__(self, metrics: ConnectionMetrics, host: str, port: int) -> None:
+        """Initialise the server."""
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        del request
+        return web.Response(text=self.metrics.render_prometheus(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+    async def _handle_stats(self, request: web.Request) -> web.Response:
+        del request
+        return web.Response(text=json.dumps(self.metrics.snapshot()), content_type="application/json")
+
+    async def start(self) -> None:
+        """Start serving."""
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        app.router.add_get("/stats", self._handle_stats)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,365 @@
+"""
+Local L2 order books, maintained from the snapshots and deltas of the exchange streams.
+"""
+import time
+import zlib
+from bisect import bisect_left, insort
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from packages.eightballer.protocols.order_book.custom_types import OrderBook
+
+Level = Tuple[float, float]
+Checksum = Callable[[List[List[float]], List[List[float]]], int]
+
+CHECKSUM_DEPTH = 25
+
+
+class BookOutOfSync(Exception):
+    """The local book no longer matches the book of the exchange, i.e. a delta was missed, and must be resynced."""
+
+
+def get_field(update: Any, name: str, default: Any = None) -> Any:
+    """Read a field of an update, given either as a dict or as an object."""
+    if isinstance(update, dict):
+        return update.get(name, default)
+    return getattr(update, name, default)
+
+
+def _format_decimal(value: float) -> str:
+    return f"{value:.10f}".rstrip("0").rstrip(".") or "0"
+
+
+def crc32_checksum(bids: List[List[float]], asks: List[List[float]], depth: int = CHECKSUM_DEPTH) -> int:
+    """
+    Get the checksum of the top levels of a book, as a signed 32 bit integer.
+
+    The CRC32 is computed over the levels interleaved as `bid_price:bid_size:ask_price:ask_size`,
+    level by level, the prices and sizes written as plain decimals. Exchanges formatting
+    their levels otherwise provide their own `order_book_checksum`.
+    """
+    values: List[str] = []
+    for index in range(depth):
+        for levels in (bids, asks):
+            if index < len(levels):
+                values.extend(_format_decimal(value) for value in levels[index][:2])
+    checksum = zlib.crc32(":".join(values).encode())
+    return checksum - (1 << 32) if checksum >= 1 << 31 else checksum
+
+
+class BookSide:
+    """
+    One side of a book: the size at each price, with the prices kept sorted best first.
+
+    Bids are keyed by their negated price, so both sides are held in ascending order
+    and a level is inserted or removed with a binary search.
+    """
+
+    def __init__(self, descending: bool) -> None:
+        """Initialise the side."""
+        self.descending = descending
+        self.sizes: Dict[float, float] = {}
+        self._keys: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _key(self, price: float) -> float:
+        return -price if self.descending else price
+
+    def set(self, price: float, size: float) -> bool:
+        """Set the size at a price, a zero size removing the level, returning whether the side changed."""
+        current = self.sizes.get(price)
+        if size <= 0:
+            if current is None:
+                return False
+            del self.sizes[price]
+            del self._keys[bisect_left(self._keys, self._key(price))]
+            return True
+        if current == size:
+            return False
+        if current is None:
+            insort(self._keys, self._key(price))
+        self.sizes[price] = size
+        return True
+
+    def replace(self, levels: Iterable[Sequence[Any]]) -> bool:
+        """Replace every level of the side, returning whether the side changed."""
+        sizes = {float(level[0]): float(level[1]) for level in levels if float(level[1]) > 0}
+        if sizes == self.sizes:
+            return False
+        self.sizes = sizes
+        self._keys = sorted(self._key(price) for price in sizes)
+        return True
+
+    def best(self) -> Optional[Level]:
+        """Get the best level of the side."""
+        if not self._keys:
+            return None
+        price = self._key(self._keys[0])
+        return price, self.sizes[price]
+
+    def levels(self, depth: Optional[int] = None) -> List[List[float]]:
+        """Get the levels of the side, best first."""
+        keys = self._keys if depth is None else self._keys[:depth]
+        return [[price, self.sizes[price]] for price in map(self._key, keys)]
+
+
+class L2OrderBook:
+    """
+    Price level order book of a symbol, kept in sync with the stream of an exchange.
+
+    A snapshot replaces the whole book and deltas update single levels. Deltas are
+    sequenced: those received before the first snapshot, or with a sequence number
+    already applied, are dropped, and one which does not follow the last applied
+    raises `BookOutOfSync`, the book waiting for a snapshot to resync. Every update
+    reports whether it changed the book, so that only books which actually moved are forwarded.
+    """
+
+    def __init__(self, exchange_id: str, symbol: str) -> None:
+        """Initialise the book."""
+        self.exchange_id = exchange_id
+        self.symbol = symbol
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.sequence: Optional[int] = None
+        self.timestamp: Optional[int] = None
+        self.synced = False
+        self.received_at = time.monotonic()
+        self.epoch = 0
+
+    def reset(self) -> None:
+        """Drop the deltas received until the next snapshot, i.e. after the stream reconnected."""
+        self.synced = False
+        self.epoch += 1
+
+    def apply_snapshot(
+        self,
+        bids: Iterable[Sequence[Any]],
+        asks: Iterable[Sequence[Any]],
+        sequence: Optional[int] = None,
+        timestamp: Optional[int] = None,
+    ) -> bool:
+        """Replace the book with a snapshot, returning whether the book changed."""
+        self.received_at = time.monotonic()
+        changed = self.bids.replace(bids)
+        changed = self.asks.replace(asks) or changed
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self.synced = True
+        return changed
+
+    def apply_delta(
+        self,
+        bids: Iterable[Sequence[Any]],
+        asks: Iterable[Sequence[Any]],
+        sequence: Optional[int] = None,
+        timestamp: Optional[int] = None,
+        previous_sequence: Optional[int] = None,
+    ) -> bool:
+        """
+        Apply the changed levels of a delta, returning whether the book changed.
+
+        A delta follows the last one applied if its `previous_sequence` is the sequence of
+        the book or, for exchanges numbering their deltas contiguously, if its sequence is next.
+        """
+        self.received_at = time.monotonic()
+        if not self.synced:
+            return False
+        if sequence is not None and self.sequence is not None:
+            if sequence <= self.sequence:
+                return False
+            expected = self.sequence if previous_sequence is not None else self.sequence + 1
+            if (previous_sequence if previous_sequence is not None else sequence) != expected:
+                self.reset()
+                raise BookOutOfSync(
+                    f"Delta {sequence} of {self.exchange_id} {self.symbol} does not follow {self.sequence}"
+                )
+        changed = False
+        for side, levels in ((self.bids, bids), (self.asks, asks)):
+            for level in levels:
+                changed = side.set(float(level[0]), float(level[1])) or changed
+        if sequence is not None:
+            self.sequence = sequence
+        if timestamp is not None:
+            self.timestamp = timestamp
+        return changed
+
+    def verify_checksum(self, checksum: int, compute: Checksum = crc32_checksum) -> None:
+        """Check the book against the checksum of the exchange, raising `BookOutOfSync` if it does not match."""
+        actual = compute(self.bids.levels(CHECKSUM_DEPTH), self.asks.levels(CHECKSUM_DEPTH))
+        if actual != checksum:
+            self.reset()
+            raise BookOutOfSync(f"Checksum {actual} of {self.exchange_id} {self.symbol} does not match {checksum}")
+
+    def best_bid(self) -> Optional[Level]:
+        """Get the best bid."""
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[Level]:
+        """Get the best ask."""
+        return self.asks.best()
+
+    def to_order_book(self, depth: Optional[int] = None) -> OrderBook:
+        """Get the book as an order book of the protocol."""
+        return OrderBook(
+            exchange_id=self.exchange_id,
+            symbol=self.symbol,
+            bids=self.bids.levels(depth),
+            asks=self.asks.levels(depth),
+            timestamp=self.timestamp,
+            nonce=self.sequence,
+        )
+
+
+def _changed_levels(previous: Dict[float, float], current: Dict[float, float]) -> List[List[float]]:
+    changed = [[price, size] for price, size in current.items() if previous.get(price) != size]
+    return changed + [[price, 0.0] for price in previous if price not in current]
+
+
+class BookDiffTracker:
+    """
+    The levels of a book last delivered to a subscriber, so that only the levels changed since are sent.
+
+    Diffs are numbered from 1 after each snapshot. A snapshot is due first, and again
+    whenever the book was resynced, i.e. its epoch changed.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the tracker."""
+        self.bids: Dict[float, float] = {}
+        self.asks: Dict[float, float] = {}
+        self.epoch: Optional[int] = None
+        self.sequence = 0
+
+    def needs_snapshot(self, book: L2OrderBook) -> bool:
+        """Check whether the book must be sent in full."""
+        return self.epoch != book.epoch
+
+    def snapshot(self, book: L2OrderBook) -> OrderBook:
+        """Get the book in full, as the base of the next diffs."""
+        self.bids, self.asks = dict(book.bids.sizes), dict(book.asks.sizes)
+        self.epoch = book.epoch
+        self.sequence = 0
+        return book.to_order_book()
+
+    def diff(self, book: L2OrderBook) -> Optional[OrderBook]:
+        """Get the levels changed since the last delivery, a zero size removing a level, or None if none did."""
+        bids, asks = _changed_levels(self.bids, book.bids.sizes), _changed_levels(self.asks, book.asks.sizes)
+        if not bids and not asks:
+            return None
+        self.bids, self.asks = dict(book.bids.sizes), dict(book.asks.sizes)
+        self.sequence += 1
+        return OrderBook(
+            exchange_id=book.exchange_id,
+            symbol=book.symbol,
+            bids=bids,
+            asks=asks,
+            timestamp=book.timestamp,
+            nonce=book.sequence,
+        )
+
+
+def _apply_update(book: L2OrderBook, update: Any, checksum: Checksum) -> bool:
+    if get_field(update, "snapshot", False):
+        changed = book.apply_snapshot(
+            get_field(update, "bids", []),
+            get_field(update, "asks", []),
+            sequence=get_field(update, "sequence"),
+            timestamp=get_field(update, "timestamp"),
+        )
+    else:
+        changed = book.apply_delta(
+            get_field(update, "bids", []),
+            get_field(update, "asks", []),
+            sequence=get_field(update, "sequence"),
+            timestamp=get_field(update, "timestamp"),
+            previous_sequence=get_field(update, "previous_sequence"),
+        )
+    expected = get_field(update, "checksum")
+    if expected is not None and book.synced:
+        book.verify_checksum(int(expected), checksum)
+    return changed
+
+
+def apply_snapshot_update(
+    book: L2OrderBook,
+    snapshot: Any,
+    checksum: Checksum = crc32_checksum,
+    on_gap: Optional[Callable[[BookOutOfSync], None]] = None,
+) -> bool:
+    """
+    Apply a snapshot of `watch_order_book`, returning whether the book changed.
+
+    Snapshots are numbered by their `nonce`, e.g. the publish id of Lyra. As each snapshot
+    is complete, one with a lower nonce than the book, i.e. from a stream whose numbering
+    restarted, is reported to `on_gap` and the book resyncs from it. A snapshot carrying a
+    checksum is checked against it, and on a mismatch the book waits for the next snapshot.
+    """
+    nonce = get_field(snapshot, "nonce")
+    if nonce is not None and book.synced and book.sequence is not None and nonce < book.sequence:
+        book.reset()
+        if on_gap is not None:
+            on_gap(BookOutOfSync(f"Snapshot {nonce} of {book.exchange_id} {book.symbol} is behind {book.sequence}"))
+    changed = book.apply_snapshot(
+        get_field(snapshot, "bids", []),
+        get_field(snapshot, "asks", []),
+        sequence=nonce,
+        timestamp=get_field(snapshot, "timestamp"),
+    )
+    expected = get_field(snapshot, "checksum")
+    if expected is not None:
+        try:
+            book.verify_checksum(int(expected), checksum)
+        except BookOutOfSync as error:
+            if on_gap is not None:
+                on_gap(error)
+            return False
+    return changed
+
+
+async def _resync(exchange: Any, symbol: str, book: L2OrderBook) -> None:
+    snapshot = await exchange.fetch_order_book(symbol)
+    book.apply_snapshot(
+        get_field(snapshot, "bids", []),
+        get_field(snapshot, "asks", []),
+        sequence=get_field(snapshot, "nonce"),
+        timestamp=get_field(snapshot, "timestamp"),
+    )
+
+
+async def watch_book_changes(
+    exchange: Any,
+    symbol: str,
+    book: L2OrderBook,
+    on_gap: Optional[Callable[[BookOutOfSync], None]] = None,
+) -> AsyncIterator[L2OrderBook]:
+    """
+    Yield the book each time the stream of the exchange changes it.
+
+    Exchanges exposing `watch_order_book_deltas` stream sequenced updates, flagged as
+    either a snapshot or a delta, and optionally carrying the checksum of the book. A
+    missed delta or a checksum mismatch is reported to `on_gap`, and the book is resynced
+    from `fetch_order_book` if the exchange has it, or else `BookOutOfSync` is raised for
+    the stream to be restarted. For the other exchanges, the successive snapshots returned
+    by `watch_order_book` are applied to the local book, which drops those that are unchanged.
+    Those snapshots are checked by their nonce and checksum too, see `apply_snapshot_update`.
+    """
+    checksum = getattr(exchange, "order_book_checksum", crc32_checksum)
+    if hasattr(exchange, "watch_order_book_deltas"):
+        async for update in exchange.watch_order_book_deltas(symbol):
+            try:
+                changed = _apply_update(book, update, checksum)
+            except BookOutOfSync as error:
+                if on_gap is not None:
+                    on_gap(error)
+                if not hasattr(exchange, "fetch_order_book"):
+                    raise
+                await _resync(exchange, symbol, book)
+                changed = True
+            if changed:
+                yield book
+        return
+    while True:
+        snapshot = await exchange.watch_order_book(symbol)
+        if apply_snapshot_update(book, snapshot, checksum, on_gap):
+            yield book
@@ -0,0 +1,97 @@
+"""
+Caches of the positions of an account, kept current from its trades and pushed to subscribers as they change.
+"""
+from typing import Any, Callable, Dict, Iterable, List
+
+from packages.eightballer.connections.dcxt.symbol_table import SymbolTable
+
+# the fields the exchange works out from the mark price and its margin rules, which are not known
+# once a trade has moved the position, until the next snapshot.
+MARKED_FIELDS = (
+    "unrealized_pnl",
+    "initial_margin",
+    "maintenance_margin",
+    "mark_value",
+    "leverage",
+    "liquidation_price",
+)
+
+
+def _signed_amount(trade: Dict[str, Any]) -> float:
+    amount = float(trade["trade_amount"])
+    return amount if trade["direction"] == "buy" else -amount
+
+
+class PositionCache(SymbolTable):
+    """
+    The positions of an account by symbol, as raw API results and as converted positions.
+
+    The cache is loaded from a snapshot of the positions, then each trade moves the size,
+    average price and realised pnl of its position, so that the positions stay current
+    between snapshots; the fields marked to market are left unset until the next snapshot,
+    rather than kept as they were before the trade. A position closed by a trade, or missing from a snapshot, is pushed
+    once with a size of 0 and dropped.
+    """
+
+    def __init__(self, convert: Callable[[Dict[str, Any]], Any]) -> None:
+        """Initialise the cache."""
+        super().__init__()
+        self.convert = convert
+        self.raw: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def positions(self) -> List[Any]:
+        """Get the open positions."""
+        return list(self.items.values())
+
+    def _publish(self, raw: Dict[str, Any]) -> None:
+        symbol = raw["instrument_name"]
+        self.publish(self.convert(raw))
+        if float(raw["amount"]) == 0:
+            self.raw.pop(symbol, None)
+            self.items.pop(symbol, None)
+        else:
+            self.raw[symbol] = raw
+
+    def load(self, api_results: Iterable[Dict[str, Any]]) -> None:
+        """Replace the positions with a snapshot, pushing those which changed."""
+        snapshot = {raw["instrument_name"]: raw for raw in api_results}
+        for symbol in set(self.raw) - set(snapshot):
+            self._publish({**self.raw[symbol], "amount": "0"})
+        for symbol, raw in snapshot.items():
+            if self.raw.get(symbol) != raw:
+                self._publish(raw)
+
+    def apply_trade(self, trade: Dict[str, Any]) -> None:
+        """Move the position of a trade by its amount."""
+        symbol = trade["instrument_name"]
+        price = float(trade["trade_price"])
+        raw = self.raw.get(symbol) or {
+            "instrument_name": symbol,
+            "amount": "0",
+            "average_price": "0",
+            "realized_pnl": "0",
+            "mark_price": None,
+        }
+        size, average = float(raw["amount"]), float(raw["average_price"])
+        traded = _signed_amount(trade)
+        new_size = round(size + traded, 12)
+        realized = float(raw["realized_pnl"])
+        if size == 0 or (size > 0) == (traded > 0):
+            # the position grows, at the average of its price and the trade price.
+            average = (average * size + price * traded) / new_size
+        else:
+            closed = min(abs(traded), abs(size))
+            realized += (price - average) * closed * (1 if size > 0 else -1)
+            if abs(traded) > abs(size):
+                # the position flipped side, the remainder being opened at the trade price.
+                average = price
+        self._publish(
+            {
+                **raw,
+                "amount": str(new_size),
+                "average_price": str(average if new_size else 0),
+                "realized_pnl": str(realized),
+                **{name: None for name in MARKED_FIELDS},
+            }
+        )
@@ -0,0 +1,368 @@
+"""
+Recorder of the market data received by the connection, in memory mapped segment files.
+
+Every kind of record has a fixed schema, so all the records of a segment have the same
+size and are found by offset. A segment starts with a header and an index holding the
+receive time of the first record of every block of `INDEX_INTERVAL` records, which
+time range reads binary search before scanning the records of the matching blocks.
+"""
+import math
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+from bisect import bisect_right
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from packages.eightballer.connections.dcxt.ticker_columns import TickerColumns
+
+DEFAULT_DEPTH = 20
+DEFAULT_SEGMENT_CAPACITY = 16384
+DEFAULT_MAX_PENDING = 10000
+INDEX_INTERVAL = 256
+MAGIC = b"DCXTSEG1"
+SEGMENT_SUFFIX = ".seg"
+
+FILE_HEADER = struct.Struct("<8sBHIIqq")
+FILE_HEADER_SIZE = 64
+RECORD_HEADER = struct.Struct("<q32s32s")
+TICKER_FIELDS = (
+    "high",
+    "low",
+    "bid",
+    "bidVolume",
+    "ask",
+    "askVolume",
+    "close",
+    "last",
+    "change",
+    "percentage",
+    "baseVolume",
+)
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+class RecordKind(IntEnum):
+    """Kinds of market data recorded."""
+
+    ORDER_BOOK = 1
+    TICKER = 2
+    OHLCV = 3
+
+
+def _encode_str(value: str) -> bytes:
+    return value.encode()[:32]
+
+
+def _decode_str(value: bytes) -> str:
+    return value.rstrip(b"\0").decode()
+
+
+def _float(value: Any) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def _get(item: Any, name: str) -> Any:
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def record_struct(kind: RecordKind, depth: int = DEFAULT_DEPTH) -> struct.Struct:
+    """Get the schema of a kind of record: receive time, exchange and symbol, then the fields of the kind."""
+    if kind == RecordKind.ORDER_BOOK:
+        return struct.Struct(f"{RECORD_HEADER.format}qqHH{4 * depth}d")
+    if kind == RecordKind.TICKER:
+        return struct.Struct(f"{RECORD_HEADER.format}q{len(TICKER_FIELDS)}d")
+    return struct.Struct(f"{RECORD_HEADER.format}qI{len(OHLCV_FIELDS)}d")
+
+
+def _pad_levels(levels: Sequence[Sequence[Any]], depth: int) -> List[float]:
+    values = [float(value) for level in list(levels)[:depth] for value in level[:2]]
+    return values + [0.0] * (2 * depth - len(values))
+
+
+def decode(kind: RecordKind, schema: struct.Struct, depth: int, data: bytes) -> Dict[str, Any]:
+    """Decode a record."""
+    values = schema.unpack(data)
+    received_at, exchange_id, symbol = values[0], _decode_str(values[1]), _decode_str(values[2])
+    record: Dict[str, Any] = {"received_at": received_at, "exchange_id": exchange_id, "symbol": symbol}
+    fields = values[3:]
+    if kind == RecordKind.ORDER_BOOK:
+        timestamp, nonce, bid_count, ask_count = fields[:4]
+        levels = fields[4:]
+        record.update(
+            timestamp=timestamp or None,
+            nonce=nonce or None,
+            bids=[[levels[2 * i], levels[2 * i + 1]] for i in range(bid_count)],
+            asks=[[levels[2 * (depth + i)], levels[2 * (depth + i) + 1]] for i in range(ask_count)],
+        )
+    elif kind == RecordKind.TICKER:
+        record["timestamp"] = fields[0] or None
+        record.update({name: _optional(value) for name, value in zip(TICKER_FIELDS, fields[1:])})
+    else:
+        record.update(timestamp=fields[0], interval=fields[1])
+        record.update(dict(zip(OHLCV_FIELDS, fields[2:])))
+    return record
+
+
+class Segment:
+    """A memory mapped segment file of records of one kind."""
+
+    def __init__(self, path: Path, mapped: mmap.mmap, kind: RecordKind, depth: int, capacity: int) -> None:
+        """Initialise the segment."""
+        self.path = path
+        self.mapped = mapped
+        self.kind = kind
+        self.depth = depth
+        self.capacity = capacity
+        self.schema = record_struct(kind, depth)
+        self.index_size = 8 * math.ceil(capacity / INDEX_INTERVAL)
+        _, _, _, _, self.count, self.first_at, self.last_at = FILE_HEADER.unpack_from(mapped, 0)
+
+    @classmethod
+    def create(cls, path: Path, kind: RecordKind, depth: int, capacity: int) -> "Segment":
+        """Create a segment, with all of its space allocated upfront."""
+        size = FILE_HEADER_SIZE + 8 * math.ceil(capacity / INDEX_INTERVAL) + capacity * record_struct(kind, depth).size
+        with open(path, "wb+") as file:
+            file.truncate(size)
+            mapped = mmap.mmap(file.fileno(), size)
+        FILE_HEADER.pack_into(mapped, 0, MAGIC, kind, depth, capacity, 0, 0, 0)
+        return cls(path, mapped, kind, depth, capacity)
+
+    @classmethod
+    def open(cls, path: Path) -> "Segment":
+        """Open a segment to read it."""
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, kind, depth, capacity, *_ = FILE_HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a market data segment")
+        return cls(path, mapped, RecordKind(kind), depth, capacity)
+
+    @property
+    def is_full(self) -> bool:
+        """Check whether the segment has no space left."""
+        return self.count >= self.capacity
+
+    def _offset(self, position: int) -> int:
+        return FILE_HEADER_SIZE + self.index_size + position * self.schema.size
+
+    def append(self, received_at: int, data: bytes) -> None:
+        """Append an encoded record."""
+        if self.count % INDEX_INTERVAL == 0:
+            struct.pack_into("<q", self.mapped, FILE_HEADER_SIZE + 8 * (self.count // INDEX_INTERVAL), received_at)
+        offset = self._offset(self.count)
+        self.mapped[offset : offset + self.schema.size] = data
+        self.count += 1
+        self.first_at = self.first_at or received_at
+        self.last_at = received_at
+        FILE_HEADER.pack_into(
+            self.mapped, 0, MAGIC, self.kind, self.depth, self.capacity, self.count, self.first_at, self.last_at
+        )
+
+    def read(self, start: Optional[int] = None, end: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Read the records received within a time range, in nanoseconds."""
+        if not self.count or (start is not None and self.last_at < start) or (end is not None and self.first_at > end):
+            return
+        position = 0
+        if start is not None:
+            blocks = math.ceil(self.count / INDEX_INTERVAL)
+            firsts = struct.unpack_from(f"<{blocks}q", self.mapped, FILE_HEADER_SIZE)
+            position = max(bisect_right(firsts, start) - 1, 0) * INDEX_INTERVAL
+        for index in range(position, self.count):
+            offset = self._offset(index)
+            (received_at,) = struct.unpack_from("<q", self.mapped, offset)
+            if start is not None and received_at < start:
+                continue
+            if end is not None and received_at > end:
+                return
+            yield decode(self.kind, self.schema, self.depth, self.mapped[offset : offset + self.schema.size])
+
+    def close(self) -> None:
+        """Flush and unmap the segment."""
+        if not self.mapped.closed:
+            self.mapped.flush()
+            self.mapped.close()
+
+
+def _segment_paths(directory: Path, kind: RecordKind) -> List[Path]:
+    return sorted(directory.glob(f"{kind.name.lower()}-*{SEGMENT_SUFFIX}"))
+
+
+class MarketDataRecorder:
+    """
+    Appends the market data received by the connection to segment files.
+
+    Records are encoded on the caller's side and handed to a writer thread, so recording
+    never blocks the event loop. The pending records are bounded: once the writer falls
+    behind by `max_pending` records, new records are dropped and counted rather than waited on.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        depth: int = DEFAULT_DEPTH,
+        capacity: int = DEFAULT_SEGMENT_CAPACITY,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        """Initialise the recorder."""
+        self.directory = Path(directory)
+        self.depth = depth
+        self.capacity = capacity
+        self.dropped = 0
+        self.schemas = {kind: record_struct(kind, depth) for kind in RecordKind}
+        self._pending: "queue.Queue[Optional[Tuple[RecordKind, int, bytes]]]" = queue.Queue(max_pending)
+        self._segments: Dict[RecordKind, Segment] = {}
+        self._last_at = 0
+        self._writer: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_forever, name="dcxt-recorder", daemon=True)
+            self._writer.start()
+
+    def stop(self) -> None:
+        """Write the pending records and close the segments."""
+        if self._writer is None:
+            return
+        self._pending.put(None)
+        self._writer.join()
+        self._writer = None
+
+    def _received_at(self) -> int:
+        # records are appended in the order they are received, so their times never go backwards.
+        self._last_at = max(time.time_ns(), self._last_at + 1)
+        return self._last_at
+
+    def _submit(self, kind: RecordKind, received_at: int, data: bytes) -> None:
+        try:
+            self._pending.put_nowait((kind, received_at, data))
+        except queue.Full:
+            self.dropped += 1
+
+    def _header(self, exchange_id: str, symbol: str) -> Tuple[int, bytes, bytes]:
+        return self._received_at(), _encode_str(exchange_id), _encode_str(symbol)
+
+    def record_order_book(
+        self,
+        exchange_id: str,
+        symbol: str,
+        bids: Sequence[Sequence[Any]],
+        asks: Sequence[Sequence[Any]],
+        timestamp: Optional[int] = None,
+        nonce: Optional[int] = None,
+    ) -> None:
+        """Record the top `depth` levels of a book, best first."""
+        header = self._header(exchange_id, symbol)
+        data = self.schemas[RecordKind.ORDER_BOOK].pack(
+            *header,
+            timestamp or 0,
+            nonce or 0,
+            min(len(bids), self.depth),
+            min(len(asks), self.depth),
+            *_pad_levels(bids, self.depth),
+            *_pad_levels(asks, self.depth),
+        )
+        self._submit(RecordKind.ORDER_BOOK, header[0], data)
+
+    def record_ticker(self, exchange_id: str, ticker: Any) -> None:
+        """Record a ticker."""
+        header = self._header(exchange_id, _get(ticker, "symbol"))
+        data = self.schemas[RecordKind.TICKER].pack(
+            *header,
+            int(_get(ticker, "timestamp") or 0),
+            *(_float(_get(ticker, name)) for name in TICKER_FIELDS),
+        )
+        self._submit(RecordKind.TICKER, header[0], data)
+
+    def record_tickers(self, exchange_id: str, tickers: Iterable[Any]) -> None:
+        """Record a batch of tickers, read from their columns if they are held as such."""
+        if isinstance(tickers, TickerColumns):
+            self._record_ticker_columns(exchange_id, tickers)
+            return
+        for ticker in tickers:
+            self.record_ticker(exchange_id, ticker)
+
+    def _record_ticker_columns(self, exchange_id: str, tickers: TickerColumns) -> None:
+        mark = tickers.column("mark")
+        columns = [mark if name in ("close", "last") else tickers.column(name) for name in TICKER_FIELDS]
+        rows = np.column_stack(columns).tolist()
+        for symbol, timestamp, row in zip(tickers.symbols, tickers.timestamps.tolist(), rows):
+            header = self._header(exchange_id, symbol)
+            self._submit(RecordKind.TICKER, header[0], self.schemas[RecordKind.TICKER].pack(*header, timestamp, *row))
+
+    def record_ohlcv(self, exchange_id: str, symbol: str, interval: int, candle: Dict[str, Any]) -> None:
+        """Record a candle."""
+        header = self._header(exchange_id, symbol)
+        data = self.schemas[RecordKind.OHLCV].pack(
+            *header,
+            int(candle["timestamp"]),
+            int(interval),
+            *(_float(candle.get(name)) for name in OHLCV_FIELDS),
+        )
+        self._submit(RecordKind.OHLCV, header[0], data)
+
+    def _segment(self, kind: RecordKind) -> Segment:
+        segment = self._segments.get(kind)
+        if segment is not None and not segment.is_full:
+            return segment
+        if segment is not None:
+            segment.close()
+        existing = _segment_paths(self.directory, kind)
+        number = int(existing[-1].stem.rsplit("-", 1)[1]) + 1 if existing else 0
+        path = self.directory / f"{kind.name.lower()}-{number:06d}{SEGMENT_SUFFIX}"
+        segment = self._segments[kind] = Segment.create(path, kind, self.depth, self.capacity)
+        return segment
+
+    def _write_forever(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                break
+            kind, received_at, data = item
+            self._segment(kind).append(received_at, data)
+        for segment in self._segments.values():
+            segment.close()
+        self._segments.clear()
+
+
+class MarketDataReader:
+    """Reads the records of a recording directory."""
+
+    def __init__(self, directory: str) -> None:
+        """Initialise the reader."""
+        self.directory = Path(directory)
+
+    def read(
+        self,
+        kind: RecordKind,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        exchange_id: Optional[str] = None,
+        symbol: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Read the records of a kind received within a time range, in nanoseconds since the epoch."""
+        for path in _segment_paths(self.directory, kind):
+            if os.path.getsize(path) < FILE_HEADER_SIZE:
+                continue
+            segment = Segment.open(path)
+            try:
+                for record in segment.read(start, end):
+                    if exchange_id is not None and record["exchange_id"] != exchange_id:
+                        continue
+                    if symbol is not None and record["symbol"] != symbol:
+                        continue
+                    yield record
+            finally:
+                segment.close()
@@ -0,0 +1,241 @@
+"""
+Rate limit aware, prioritised scheduling of the requests made to the exchanges.
+"""
+import asyncio
+import itertools
+import time
+from asyncio import Task
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from aea.mail.base import Envelope
+from aea.protocols.base import Message
+
+from packages.eightballer.connections.dcxt.tasks import TaskRegistry
+from packages.eightballer.protocols.order_book.message import OrderBookMessage
+
+THROTTLE_DELAY = 0.1
+THROTTLE_BACKOFF = 2
+MAX_THROTTLE_DELAY = 30
+
+
+class Priority(IntEnum):
+    """Priority lanes of the scheduler, lowest value first."""
+
+    CANCEL = 0
+    CREATE = 1
+    ORDER_BOOK = 2
+    DEFAULT = 3
+
+
+PERFORMATIVE_PRIORITIES = {
+    "cancel_order": Priority.CANCEL,
+    "cancel_orders": Priority.CANCEL,
+    "cancel_all_orders": Priority.CANCEL,
+    "create_order": Priority.CREATE,
+    "create_orders": Priority.CREATE,
+}
+PROTOCOL_PRIORITIES = {
+    str(OrderBookMessage.protocol_id): Priority.ORDER_BOOK,
+}
+STREAMING_PERFORMATIVES = {"subscribe"}
+# the handlers of batches make one exchange call per order, or per batch endpoint call, each scheduled on its own.
+BATCH_PERFORMATIVES = {"create_orders", "cancel_orders", "cancel_all_orders"}
+
+
+def get_priority(message: Message) -> Priority:
+    """Get the priority lane of a message."""
+    priority = PERFORMATIVE_PRIORITIES.get(message.performative.value)
+    if priority is not None:
+        return priority
+    return PROTOCOL_PRIORITIES.get(str(message.protocol_id), Priority.DEFAULT)
+
+
+def is_streaming(message: Message) -> bool:
+    """Check whether a message opens a long lived stream, which must not hold an in-flight slot."""
+    return message.performative.value in STREAMING_PERFORMATIVES
+
+
+def is_batch(message: Message) -> bool:
+    """Check whether a message is a batch, whose exchange calls take their tokens as they are scheduled."""
+    return message.performative.value in BATCH_PERFORMATIVES
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+
+    A bucket without a rate never runs out of tokens, but can still be throttled
+    when the exchange tells us we are sending too many requests.
+    """
+
+    def __init__(self, rate: Optional[float] = None, capacity: Optional[float] = None) -> None:
+        """Initialise the bucket, `rate` being the number of requests per second."""
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._strikes = 0
+
+    def _refill(self, now: float) -> None:
+        if self.rate is None:
+            return
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self) -> float:
+        """Get the time to wait until a token is available."""
+        now = time.monotonic()
+        self._refill(now)
+        wait = max(self._blocked_until - now, 0.0)
+        if self.rate is not None and self._tokens < 1:
+            wait = max(wait, (1 - self._tokens) / self.rate)
+        return wait
+
+    async def acquire(self) -> None:
+        """Wait for, and take, a token."""
+        while (wait := self.wait_time()) > 0:
+            await asyncio.sleep(wait)
+        if self.rate is not None:
+            self._tokens -= 1
+
+    def throttle(self) -> float:
+        """Stop handing out tokens for an exponentially growing delay."""
+        delay = min(THROTTLE_DELAY * THROTTLE_BACKOFF**self._strikes, MAX_THROTTLE_DELAY)
+        self._strikes += 1
+        self._blocked_until = time.monotonic() + delay
+        if self.rate is not None:
+            self._tokens = 0
+        return delay
+
+    def reset(self) -> None:
+        """Reset the throttling backoff."""
+        self._strikes = 0
+
+
+class RequestScheduler:
+    """
+    Schedules the requests of each exchange by priority, within its rate limit.
+
+    Every exchange has its own queue and worker, so a throttled exchange does not
+    delay the requests made to the others. The calls made by the connection itself,
+    i.e. those of a batch, run in a lane of their own, which only waits for tokens;
+    a batch holding an in-flight slot can so never wait on its own calls, stuck behind
+    an envelope waiting for that slot.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[Envelope, Optional[str], bool], Any],
+        registry: TaskRegistry,
+        rate_limits: Optional[Dict[str, Dict[str, float]]] = None,
+    ) -> None:
+        """Initialise the scheduler."""
+        self.dispatch = dispatch
+        self.registry = registry
+        self.rate_limits = rate_limits or {}
+        self._queues: Dict[Optional[str], asyncio.PriorityQueue] = {}
+        self._buckets: Dict[Optional[str], TokenBucket] = {}
+        self._calls: Dict[Optional[str], asyncio.PriorityQueue] = {}
+        self._workers: Dict[Optional[str], Task] = {}
+        self._call_workers: Dict[Optional[str], Task] = {}
+        self._counter = itertools.count()
+
+    def bucket(self, exchange_id: Optional[str]) -> TokenBucket:
+        """Get the token bucket of an exchange."""
+        if exchange_id not in self._buckets:
+            rate_limit = self.rate_limits.get(exchange_id, {})
+            self._buckets[exchange_id] = TokenBucket(
+                rate=rate_limit.get("requests_per_second"),
+                capacity=rate_limit.get("burst"),
+            )
+        return self._buckets[exchange_id]
+
+    def _queue(self, exchange_id: Optional[str]) -> asyncio.PriorityQueue:
+        queue = self._queues.get(exchange_id)
+        if queue is None:
+            queue = self._queues[exchange_id] = asyncio.PriorityQueue()
+            self._workers[exchange_id] = asyncio.ensure_future(self._work(exchange_id, queue))
+        return queue
+
+    def _call_queue(self, exchange_id: Optional[str]) -> asyncio.PriorityQueue:
+        queue = self._calls.get(exchange_id)
+        if queue is None:
+            queue = self._calls[exchange_id] = asyncio.PriorityQueue()
+            self._call_workers[exchange_id] = asyncio.ensure_future(self._work_calls(exchange_id, queue))
+        return queue
+
+    def submit(self, envelope: Envelope, exchange_id: Optional[str]) -> None:
+        """Queue a request to be dispatched."""
+        self._queue(exchange_id).put_nowait((get_priority(envelope.message), next(self._counter), envelope))
+
+    def schedule(
+        self,
+        exchange_id: Optional[str],
+        call: Callable[[], Awaitable[Any]],
+        priority: Priority = Priority.DEFAULT,
+    ) -> "asyncio.Future[Any]":
+        """Queue a call made by the connection itself, i.e. a background refresh, returning its future."""
+        future = asyncio.get_event_loop().create_future()
+        self._call_queue(exchange_id).put_nowait((priority, next(self._counter), (call, future)))
+        return future
+
+    @staticmethod
+    async def _run(call: Callable[[], Awaitable[Any]], future: "asyncio.Future[Any]") -> None:
+        try:
+            result = await call()
+        except Exception as error:  # pylint: disable=broad-except
+            if not future.done():
+                future.set_exception(error)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    async def _work(self, exchange_id: Optional[str], queue: asyncio.PriorityQueue) -> None:
+        """Dispatch the queued requests of an exchange, highest priority first."""
+        bucket = self.bucket(exchange_id)
+        while True:
+            _, _, envelope = await queue.get()
+            metered = not is_streaming(envelope.message)
+            if metered:
+                await self.registry.acquire(exchange_id)
+            if not is_batch(envelope.message):
+                await bucket.acquire()
+            self.dispatch(envelope, exchange_id, metered)
+
+    async def _work_calls(self, exchange_id: Optional[str], queue: asyncio.PriorityQueue) -> None:
+        """Run the queued calls of an exchange, highest priority first, without taking in-flight slots."""
+        bucket = self.bucket(exchange_id)
+        while True:
+            _, _, (call, future) = await queue.get()
+            if future.cancelled():
+                continue
+            await bucket.acquire()
+            asyncio.ensure_future(self._run(call, future))
+
+    def throttle(self, exchange_id: Optional[str]) -> float:
+        """Back off from an exchange which is rate limiting us."""
+        return self.bucket(exchange_id).throttle()
+
+    def reset(self, exchange_id: Optional[str]) -> None:
+        """Reset the backoff of an exchange."""
+        self.bucket(exchange_id).reset()
+
+    @property
+    def pending(self) -> Dict[Optional[str], int]:
+        """Get the number of queued requests, by exchange."""
+        pending: Dict[Optional[str], int] = {}
+        for queues in (self._queues, self._calls):
+            for exchange_id, queue in queues.items():
+                pending[exchange_id] = pending.get(exchange_id, 0) + queue.qsize()
+        return pending
+
+    def stop(self) -> None:
+        """Stop dispatching requests."""
+        for workers in (self._workers, self._call_workers):
+            for worker in workers.values():
+                worker.cancel()
+            workers.clear()
+        self._queues.clear()
+        self._calls.clear()
@@ -0,0 +1,47 @@
+"""
+Coalescing of identical, concurrent, read only requests to the exchanges.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+def make_key(exchange_id: str, performative: Any, params: Optional[Dict[str, Any]] = None) -> Tuple:
+    """Make the key identifying a request."""
+    return (exchange_id, performative, tuple(sorted((params or {}).items())))
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call between every caller making the same request.
+
+    The first caller starts the call, later callers with the same key wait on it,
+    and the key is forgotten as soon as the call completes, so results are never
+    served stale.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the single flight group."""
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run the call, or wait on the identical call already in flight."""
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        # a waiter being cancelled must not cancel the call the others are waiting on
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # retrieve the exception so it is not reported as never retrieved
+            future.exception()
@@ -0,0 +1,332 @@
+"""
+Order book subscriptions, shared by every dialogue subscribed to the same symbol.
+"""
+import asyncio
+import random
+import time
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from packages.eightballer.connections.dcxt.metrics import ConnectionMetrics
+from packages.eightballer.connections.dcxt.order_book_engine import (
+    BookOutOfSync,
+    L2OrderBook,
+    apply_snapshot_update,
+    crc32_checksum,
+    get_field,
+    watch_book_changes,
+)
+from packages.eightballer.connections.dcxt.recorder import MarketDataRecorder
+
+MULTI_SYMBOL_METHOD = "watch_order_book_for_symbols"
+MULTI_SYMBOL_UNWATCH_METHOD = "un_watch_order_book_for_symbols"
+DEFAULT_STALE_AFTER = 30.0
+RECONNECT_DELAY = 0.5
+MAX_RECONNECT_DELAY = 30.0
+
+
+class StaleBookError(Exception):
+    """The stream of a book has not received anything for too long."""
+
+
+def reconnect_delay(attempt: int, base: float = RECONNECT_DELAY, cap: float = MAX_RECONNECT_DELAY) -> float:
+    """Get the delay before a reconnection attempt, as an exponential backoff with full jitter."""
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))  # nosec
+
+
+class Subscription:
+    """A subscriber to the book of a symbol, notified each time the book changes."""
+
+    def __init__(self, feed: "BookFeed", key: Optional[Hashable] = None) -> None:
+        """Initialise the subscription."""
+        self.feed = feed
+        self.key = key
+        self._changed = asyncio.Event()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+    def notify(self) -> None:
+        """Notify the subscriber the book changed."""
+        self._changed.set()
+
+    def fail(self, error: BaseException) -> None:
+        """End the subscription with the error of its feed."""
+        self._error = error
+        self._changed.set()
+
+    def close(self) -> None:
+        """End the subscription."""
+        self._closed = True
+        self._changed.set()
+
+    async def updates(self) -> AsyncIterator[L2OrderBook]:
+        """Yield the book each time it changed, changes made while the subscriber is busy being conflated."""
+        while True:
+            await self._changed.wait()
+            self._changed.clear()
+            if self._error is not None:
+                raise self._error
+            if self._closed:
+                return
+            yield self.feed.book
+
+
+class BookFeed:
+    """The book of a symbol on an exchange, with its subscribers."""
+
+    def __init__(self, exchange_id: str, symbol: str) -> None:
+        """Initialise the feed."""
+        self.book = L2OrderBook(exchange_id, symbol)
+        self.subscribers: Set[Subscription] = set()
+        self.task: Optional[asyncio.Task] = None
+        self.stream: Optional[asyncio.Task] = None
+        self.stream_started = 0.0
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Get the exchange and symbol of the feed."""
+        return self.book.exchange_id, self.book.symbol
+
+    def publish(self) -> None:
+        """Notify every subscriber the book changed."""
+        for subscription in self.subscribers:
+            subscription.notify()
+
+    def fail(self, error: BaseException) -> None:
+        """End every subscription with an error."""
+        for subscription in self.subscribers:
+            subscription.fail(error)
+
+
+class SubscriptionManager:  # pylint: disable=too-many-instance-attributes
+    """
+    Multiplexes the order book subscriptions of every dialogue over one stream per symbol.
+
+    Subscribing to a symbol already streamed adds a subscriber to its feed, and each
+    update of the book is fanned out to all of them. Exchanges exposing
+    `watch_order_book_for_symbols` stream every subscribed symbol of the exchange over a
+    single stream, which is restarted when the set of symbols changes. A stream is
+    stopped once its last subscriber is gone, the exchange being told through
+    `un_watch_order_book_for_symbols` if it keeps a multi-symbol stream of its own.
+
+    Streams are supervised: a failed stream is reconnected after a jittered exponential
+    backoff, its books resyncing from the next snapshot. Once `max_reconnects` attempts in
+    a row failed, the subscriptions end with the last error. A stream none of whose books
+    received anything for `stale_after` seconds ends their subscriptions with a
+    `StaleBookError` right away, whatever `max_reconnects`, so that its subscribers know not
+    to rely on them any more; a quiet symbol of a stream shared with busier ones is not stale.
+    A book found out of sync, by its sequence numbers or checksum, is counted in `gaps`
+    and resynced, its stream being reconnected as above if the exchange cannot send a
+    snapshot otherwise.
+    """
+
+    def __init__(
+        self,
+        logger: Any = None,
+        stale_after: Optional[float] = DEFAULT_STALE_AFTER,
+        max_reconnects: Optional[int] = None,
+        recorder: Optional[MarketDataRecorder] = None,
+        metrics: Optional[ConnectionMetrics] = None,
+    ) -> None:
+        """Initialise the manager."""
+        self.logger = logger
+        self.recorder = recorder
+        self.metrics = metrics
+        self.stale_after = stale_after
+        self.max_reconnects = max_reconnects
+        self.feeds: Dict[Tuple[str, str], BookFeed] = {}
+        self.reconnects: Dict[str, int] = {}
+        self.gaps: Dict[str, int] = {}
+        self._by_key: Dict[Hashable, Subscription] = {}
+        self._exchanges: Dict[str, Any] = {}
+        self._exchange_tasks: Dict[str, asyncio.Task] = {}
+        self._exchange_symbols: Dict[str, List[str]] = {}
+        self._watchdog: Optional[asyncio.Task] = None
+
+    def symbols(self, exchange_id: str) -> Set[str]:
+        """Get the symbols streamed from an exchange."""
+        return {symbol for feed_exchange_id, symbol in self.feeds if feed_exchange_id == exchange_id}
+
+    def subscribe(
+        self, exchange_id: str, exchange: Any, symbol: str, key: Optional[Hashable] = None
+    ) -> Subscription:
+        """Subscribe to the book of a symbol, starting its stream if it is the first subscriber."""
+        self._exchanges[exchange_id] = exchange
+        feed = self.feeds.get((exchange_id, symbol))
+        if feed is None:
+            feed = self.feeds[(exchange_id, symbol)] = BookFeed(exchange_id, symbol)
+            self._start(exchange_id, exchange, feed)
+        subscription = Subscription(feed, key)
+        feed.subscribers.add(subscription)
+        if key is not None:
+            self._by_key[key] = subscription
+        if feed.book.synced:
+            # late subscribers start from the current book.
+            subscription.notify()
+        if self.stale_after and self._watchdog is None:
+            self._watchdog = asyncio.ensure_future(self._watch_staleness())
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber, stopping the stream of its symbol if it was the last one."""
+        feed = subscription.feed
+        feed.subscribers.discard(subscription)
+        subscription.close()
+        if self._by_key.get(subscription.key) is subscription:
+            del self._by_key[subscription.key]
+        if not feed.subscribers and self.feeds.get(feed.key) is feed:
+            self._remove(feed)
+
+    def unsubscribe_key(self, key: Hashable) -> bool:
+        """Remove the subscriber registered under a key, i.e. a dialogue, returning whether there was one."""
+        subscription = self._by_key.get(key)
+        if subscription is None:
+            return False
+        self.unsubscribe(subscription)
+        return True
+
+    def _remove(self, feed: BookFeed) -> None:
+        """Remove a feed, stopping its stream."""
+        del self.feeds[feed.key]
+        if feed.task is not None:
+            feed.task.cancel()
+        else:
+            self._restart_exchange_stream(feed.book.exchange_id, self._exchanges[feed.book.exchange_id])
+
+    def _drop(self, feed: BookFeed, error: BaseException) -> None:
+        """Drop a feed, ending its subscriptions with an error."""
+        if self.feeds.get(feed.key) is feed:
+            self._remove(feed)
+        feed.fail(error)
+
+    def _start(self, exchange_id: str, exchange: Any, feed: BookFeed) -> None:
+        if hasattr(exchange, MULTI_SYMBOL_METHOD):
+            self._restart_exchange_stream(exchange_id, exchange)
+        else:
+            feed.task = asyncio.ensure_future(
+                self._supervise(exchange_id, lambda: self._stream_symbol(exchange, feed), [feed])
+            )
+
+    def _restart_exchange_stream(self, exchange_id: str, exchange: Any) -> None:
+        task = self._exchange_tasks.pop(exchange_id, None)
+        if task is not None:
+            task.cancel()
+        symbols = sorted(self.symbols(exchange_id))
+        watched = self._exchange_symbols.pop(exchange_id, [])
+        if watched and not symbols and hasattr(exchange, MULTI_SYMBOL_UNWATCH_METHOD):
+            asyncio.ensure_future(getattr(exchange, MULTI_SYMBOL_UNWATCH_METHOD)(watched))
+        if symbols:
+            self._exchange_symbols[exchange_id] = symbols
+            feeds = [self.feeds[(exchange_id, symbol)] for symbol in symbols]
+            self._exchange_tasks[exchange_id] = asyncio.ensure_future(
+                self._supervise(exchange_id, lambda: self._stream_exchange(exchange_id, exchange, symbols), feeds)
+            )
+
+    async def _supervise(
+        self, exchange_id: str, stream: Callable[[], Awaitable[None]], feeds: List[BookFeed]
+    ) -> None:
+        """Run a stream, reconnecting it whenever it fails until `max_reconnects` attempts in a row failed."""
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            run = asyncio.ensure_future(stream())
+            for feed in feeds:
+                feed.stream, feed.stream_started = run, started
+            try:
+                await asyncio.wait([run])
+            except asyncio.CancelledError:
+                run.cancel()
+                raise
+            error = run.exception() or ConnectionError("Stream ended")
+            if isinstance(error, BookOutOfSync):
+                # the gap was counted, and a new stream starts from a snapshot. The stream only counts as
+                # healthy if it kept in sync for a while, so one falling out of sync after each snapshot gives up.
+                if time.monotonic() - started > MAX_RECONNECT_DELAY:
+                    attempt = 0
+            elif any(feed.book.received_at > started for feed in feeds):
+                attempt = 0
+            attempt += 1
+            self.reconnects[exchange_id] = self.reconnects.get(exchange_id, 0) + 1
+            if self.max_reconnects is not None and attempt > self.max_reconnects:
+                for feed in feeds:
+                    self._drop(feed, error)
+                return
+            delay = reconnect_delay(attempt)
+            if self.logger is not None:
+                self.logger.warning(f"Order book stream of {exchange_id} failed: {error}. Reconnecting in {delay:.2f}s")
+            for feed in feeds:
+                feed.book.reset()
+            await asyncio.sleep(delay)
+
+    def _publish(self, feed: BookFeed) -> None:
+        feed.publish()
+        if self.metrics is not None:
+            # counted once per update of the exchange, however many dialogues it is fanned out to.
+            self.metrics.observe_order_book_update(*feed.key)
+        if self.recorder is not None:
+            book = feed.book
+            self.recorder.record_order_book(
+                book.exchange_id,
+                book.symbol,
+                book.bids.levels(self.recorder.depth),
+                book.asks.levels(self.recorder.depth),
+                timestamp=book.timestamp,
+                nonce=book.sequence,
+            )
+
+    def _on_gap(self, feed: BookFeed, error: BookOutOfSync) -> None:
+        exchange_id = feed.book.exchange_id
+        self.gaps[exchange_id] = self.gaps.get(exchange_id, 0) + 1
+        if self.logger is not None:
+            self.logger.warning(f"Order book of {feed.key} is out of sync: {error}. Resyncing")
+
+    async def _stream_symbol(self, exchange: Any, feed: BookFeed) -> None:
+        on_gap = partial(self._on_gap, feed)
+        async for _ in watch_book_changes(exchange, feed.book.symbol, feed.book, on_gap=on_gap):
+            self._publish(feed)
+
+    async def _stream_exchange(self, exchange_id: str, exchange: Any, symbols: List[str]) -> None:
+        checksum = getattr(exchange, "order_book_checksum", crc32_checksum)
+        while True:
+            update = await getattr(exchange, MULTI_SYMBOL_METHOD)(symbols)
+            feed = self.feeds.get((exchange_id, get_field(update, "symbol")))
+            if feed is not None and apply_snapshot_update(
+                feed.book, update, checksum, on_gap=partial(self._on_gap, feed)
+            ):
+                self._publish(feed)
+
+    async def _watch_staleness(self) -> None:
+        while True:
+            await asyncio.sleep(self.stale_after / 2)
+            now = time.monotonic()
+            streams: Dict[asyncio.Task, List[BookFeed]] = {}
+            for feed in self.feeds.values():
+                # the feeds which are not streaming are waiting to reconnect.
+                if feed.stream is not None and not feed.stream.done():
+                    streams.setdefault(feed.stream, []).append(feed)
+            for feeds in streams.values():
+                silence = now - max(feeds[0].stream_started, *(feed.book.received_at for feed in feeds))
+                if silence > self.stale_after:
+                    if self.logger is not None:
+                        symbols = ", ".join(feed.book.symbol for feed in feeds)
+                        self.logger.warning(f"Order books of {symbols} are stale, nothing received for {silence:.0f}s")
+                    # rather than reconnecting silently, the subscribers are told, and may subscribe again.
+                    error = StaleBookError(f"No order book update received for {silence:.0f}s")
+                    for feed in feeds:
+                        self._drop(feed, error)
+
+    def stop(self) -> None:
+        """Stop every stream, ending their subscriptions."""
+        for feed in self.feeds.values():
+            if feed.task is not None:
+                feed.task.cancel()
+            for subscription in list(feed.subscribers):
+                subscription.close()
+        for task in [*self._exchange_tasks.values(), self._watchdog]:
+            if task is not None:
+                task.cancel()
+        self.feeds.clear()
+        self._by_key.clear()
+        self._exchange_tasks.clear()
+        self._exchange_symbols.clear()
+        self._watchdog = None
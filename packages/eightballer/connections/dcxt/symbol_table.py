@@ -0,0 +1,94 @@
+"""
+Tables of the latest item of every symbol, i.e. tickers or positions, pushing those which changed to subscribers.
+"""
+import asyncio
+from typing import Any, AsyncIterator, Dict, Hashable, Iterable, List, Optional, Set
+
+from packages.eightballer.connections.dcxt.order_book_engine import get_field
+
+
+class SymbolSubscription:
+    """A subscriber to the items of a set of symbols, or of every symbol if none are given."""
+
+    def __init__(self, symbols: Optional[Set[str]] = None, key: Optional[Hashable] = None) -> None:
+        """Initialise the subscription."""
+        self.symbols = symbols
+        self.key = key
+        self._changed: Dict[str, Any] = {}
+        self._event = asyncio.Event()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+    def notify(self, item: Any) -> None:
+        """Notify the subscriber an item changed, if it is one of its symbols."""
+        symbol = get_field(item, "symbol")
+        if self.symbols is None or symbol in self.symbols:
+            self._changed[symbol] = item
+            self._event.set()
+
+    def fail(self, error: BaseException) -> None:
+        """End the subscription with the error of the stream."""
+        self._error = error
+        self._event.set()
+
+    def close(self) -> None:
+        """End the subscription."""
+        self._closed = True
+        self._event.set()
+
+    async def updates(self) -> AsyncIterator[List[Any]]:
+        """Yield the items which changed, a symbol changing again while the subscriber is busy being conflated."""
+        while True:
+            await self._event.wait()
+            self._event.clear()
+            if self._error is not None:
+                raise self._error
+            if self._closed:
+                return
+            changed, self._changed = list(self._changed.values()), {}
+            if changed:
+                yield changed
+
+
+class SymbolTable:
+    """The latest item of every symbol, new subscribers starting from the items already held."""
+
+    def __init__(self) -> None:
+        """Initialise the table."""
+        self.items: Dict[str, Any] = {}
+        self.subscribers: Dict[Hashable, SymbolSubscription] = {}
+
+    def publish(self, item: Any) -> None:
+        """Store an item and push it to the subscribers."""
+        self.items[get_field(item, "symbol")] = item
+        for subscription in self.subscribers.values():
+            subscription.notify(item)
+
+    def subscribe(self, symbols: Optional[Iterable[str]] = None, key: Optional[Hashable] = None) -> SymbolSubscription:
+        """Subscribe to the items of some symbols, or of all of them."""
+        subscription = SymbolSubscription(None if symbols is None else set(symbols), key)
+        self.subscribers[subscription if key is None else key] = subscription
+        for item in self.items.values():
+            subscription.notify(item)
+        return subscription
+
+    def unsubscribe(self, subscription: SymbolSubscription) -> None:
+        """Remove a subscriber."""
+        key = subscription if subscription.key is None else subscription.key
+        if self.subscribers.get(key) is subscription:
+            del self.subscribers[key]
+        subscription.close()
+
+    def unsubscribe_key(self, key: Hashable) -> bool:
+        """Remove the subscriber registered under a key, i.e. a dialogue, returning whether there was one."""
+        subscription = self.subscribers.get(key)
+        if subscription is None:
+            return False
+        self.unsubscribe(subscription)
+        return True
+
+    def fail(self, error: BaseException) -> None:
+        """End every subscription with an error."""
+        for subscription in list(self.subscribers.values()):
+            subscription.fail(error)
+        self.subscribers.clear()
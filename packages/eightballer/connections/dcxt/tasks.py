@@ -0,0 +1,115 @@
+"""
+Registry of the tasks executing requests on behalf of the connection.
+"""
+import asyncio
+from asyncio import Task
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
+
+DEFAULT_MAX_IN_FLIGHT = 50
+
+
+class TaskRegistry:
+    """
+    Keeps track of the in-flight request tasks, keyed by exchange and protocol.
+
+    Insertion and removal are O(1). Each exchange is given its own slot pool so that
+    a slow venue can only ever hold `max_in_flight` requests at a time.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[Dict[str, int]] = None,
+        default_max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> None:
+        """Initialise the registry."""
+        self._tasks: Dict[Task, Tuple[str, str]] = {}
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._running: Dict[str, int] = defaultdict(int)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._max_in_flight = max_in_flight or {}
+        self.default_max_in_flight = default_max_in_flight
+
+    def __contains__(self, task: Task) -> bool:
+        return task in self._tasks
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(list(self._tasks))
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def add(self, task: Task, exchange_id: str, protocol_id: str) -> None:
+        """Register a task."""
+        self._tasks[task] = (exchange_id, protocol_id)
+        self._counts[exchange_id][protocol_id] += 1
+
+    def remove(self, task: Task) -> Optional[Tuple[str, str]]:
+        """Remove a task, returning the exchange and protocol it was registered under."""
+        key = self._tasks.pop(task, None)
+        if key is None:
+            return None
+        exchange_id, protocol_id = key
+        counts = self._counts[exchange_id]
+        counts[protocol_id] -= 1
+        if counts[protocol_id] <= 0:
+            del counts[protocol_id]
+        if not counts:
+            del self._counts[exchange_id]
+        return key
+
+    def limit(self, exchange_id: str) -> int:
+        """Get the in-flight limit of an exchange."""
+        return self._max_in_flight.get(exchange_id, self.default_max_in_flight)
+
+    def set_limit(self, exchange_id: str, max_in_flight: int) -> None:
+        """Set the in-flight limit of an exchange."""
+        if exchange_id in self._semaphores:
+            raise ValueError(f"Cannot change the in-flight limit of {exchange_id} once requests have been made.")
+        self._max_in_flight[exchange_id] = max_in_flight
+
+    async def acquire(self, exchange_id: str) -> None:
+        """Wait for one of the in-flight slots of an exchange."""
+        semaphore = self._semaphores.get(exchange_id)
+        if semaphore is None:
+            semaphore = self._semaphores[exchange_id] = asyncio.Semaphore(self.limit(exchange_id))
+        await semaphore.acquire()
+        self._running[exchange_id] += 1
+
+    def release(self, exchange_id: str) -> None:
+        """Give back an in-flight slot of an exchange."""
+        self._running[exchange_id] -= 1
+        self._semaphores[exchange_id].release()
+
+    @asynccontextmanager
+    async def slot(self, exchange_id: str) -> AsyncIterator[None]:
+        """Wait for, and hold, one of the in-flight slots of an exchange."""
+        await self.acquire(exchange_id)
+        try:
+            yield
+        finally:
+            self.release(exchange_id)
+
+    def running(self, exchange_id: str) -> int:
+        """Get the number of requests currently holding a slot of an exchange."""
+        return self._running.get(exchange_id, 0)
+
+    @property
+    def running_by_exchange(self) -> Dict[str, int]:
+        """Get the number of requests currently holding a slot, by exchange."""
+        return dict(self._running)
+
+    def is_saturated(self, exchange_id: str) -> bool:
+        """Check whether all the in-flight slots of an exchange are taken."""
+        return self.running(exchange_id) >= self.limit(exchange_id)
+
+    @property
+    def in_flight(self) -> Dict[str, Dict[str, int]]:
+        """Get the registered tasks, counted by exchange and protocol."""
+        return {exchange_id: dict(counts) for exchange_id, counts in self._counts.items()}
+
+    @property
+    def saturated_exchanges(self):
+        """Get the exchanges which have no in-flight slot left."""
+        return [exchange_id for exchange_id in self._running if self.is_saturated(exchange_id)]
@@ -6,7 +6,8 @@ import ccxt
 import pytest
 from aea.mail.base import Envelope
 
-from packages.eightballer.protocols.orders.dialogues import BaseOrdersDialogues, OrdersDialogue
+from packages.eightballer.protocols.orders.custom_types import Order, Orders, OrderSide, OrderStatus, OrderType
+from packages.eightballer.protocols.orders.dialogues import OrdersDialogue, OrdersDialogues
 from packages.eightballer.protocols.orders.message import OrdersMessage
 
 from ..test_dcxt_connection import DEFAULT_EXCHANGE_ID, BaseDcxtConnectionTest, get_dialogues, with_timeout
@@ -39,7 +40,7 @@ TEST_SETTLEMENTS = [
 class TestOrdersExecution(BaseDcxtConnectionTest):
     """Test protocol messages are handled."""
 
-    DIALOGUES = get_dialogues(BaseOrdersDialogues, OrdersDialogue)
+    DIALOGUES = get_dialogues(OrdersDialogues, OrdersDialogue)
 
     @with_timeout(3)
     async def test_handles_get_orders(self) -> None:
@@ -106,3 +107,64 @@ class TestOrdersExecution(BaseDcxtConnectionTest):
         assert response is not None
         assert isinstance(response.message, OrdersMessage)
         assert response.message.performative == OrdersMessage.Performative.ORDERS, f"Error: {response}"
+
+    @with_timeout(3)
+    async def test_handles_create_orders(self) -> None:
+        """Can create a batch of orders, reporting those which failed."""
+        await self.connection.connect()
+        dialogues = self.DIALOGUES(self.client_skill_id)
+        orders = [
+            Order(
+                exchange_id=DEFAULT_EXCHANGE_ID,
+                client_order_id=f"order-{price}",
+                symbol="ETH/USDT",
+                side=OrderSide.BUY,
+                type=OrderType.LIMIT,
+                amount=1.0,
+                price=price,
+            )
+            for price in (1000.0, 0.0, 1e9)
+        ]
+        request, _ = dialogues.create(
+            counterparty=str(self.connection.connection_id),
+            performative=OrdersMessage.Performative.CREATE_ORDERS,
+            orders=Orders(orders=orders),
+            exchange_id=DEFAULT_EXCHANGE_ID,
+        )
+        envelope = Envelope(
+            to=request.to,
+            sender=request.sender,
+            message=request,
+        )
+
+        async def mock_create_order(**kwargs):
+            if not kwargs["price"]:
+                raise ccxt.errors.InvalidOrder("invalid price")
+            if kwargs["price"] > 1e6:
+                raise ccxt.errors.InsufficientFunds("insufficient funds")
+            return {
+                "info": {},
+                "id": "1",
+                "status": "open",
+                "type": kwargs["type"],
+                "side": kwargs["side"],
+                "symbol": kwargs["symbol"],
+                "amount": kwargs["amount"],
+                "price": kwargs["price"],
+                "filled": 0.0,
+                "remaining": kwargs["amount"],
+            }
+
+        exchange = self.connection._exchanges[DEFAULT_EXCHANGE_ID]  # pylint: disable=protected-access
+        exchange.has = {**exchange.has, "createOrders": False}
+        exchange.create_order = MagicMock(side_effect=mock_create_order)
+        await self.connection.send(envelope)
+        await asyncio.sleep(1)
+        response = await self.connection.receive()
+        assert response is not None
+        assert response.message.performative == OrdersMessage.Performative.ORDERS_CREATED, f"Error: {response}"
+        created, failed, unfunded = response.message.orders.orders
+        assert created.status == OrderStatus.OPEN
+        assert failed.status == OrderStatus.FAILED
+        assert unfunded.status == OrderStatus.CANCELLED
+        assert set(response.message.errors) == {"order-0.0", "order-1000000000.0"}
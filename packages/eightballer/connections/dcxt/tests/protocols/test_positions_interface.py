@@ -9,7 +9,7 @@ from aea.mail.base import Envelope
 
 from packages.eightballer.connections.dcxt.interfaces.interface_base import get_dialogues
 from packages.eightballer.protocols.positions.custom_types import Positions
-from packages.eightballer.protocols.positions.dialogues import BasePositionsDialogues, PositionsDialogue
+from packages.eightballer.protocols.positions.dialogues import PositionsDialogue, PositionsDialogues
 from packages.eightballer.protocols.positions.message import PositionsMessage
 
 from ..test_dcxt_connection import DEFAULT_EXCHANGE_ID, BaseDcxtConnectionTest, get_dialogues, with_timeout
@@ -21,7 +21,7 @@ class TestPositionInterface(BaseDcxtConnectionTest):
     Test the position interface.
     """
 
-    DIALOGUES = get_dialogues(BasePositionsDialogues, PositionsDialogue)
+    DIALOGUES = get_dialogues(PositionsDialogues, PositionsDialogue)
 
     @pytest.mark.asyncio
     @with_timeout(4)
@@ -55,3 +55,35 @@ class TestPositionInterface(BaseDcxtConnectionTest):
         assert isinstance(response.message, PositionsMessage)
         assert response.message.performative == PositionsMessage.Performative.ALL_POSITIONS, f"Error: {response}"
         assert isinstance(response.message.positions, Positions)
+
+    @pytest.mark.asyncio
+    @with_timeout(4)
+    async def test_subscribe(self):
+        """
+        Test the positions which changed are pushed to subscribers.
+        """
+        await self.connection.connect()
+        dialogues = self.DIALOGUES(self.client_skill_id)  # pylint: disable=E1120
+        request, _ = dialogues.create(
+            counterparty=str(self.connection.connection_id),
+            performative=PositionsMessage.Performative.SUBSCRIBE,
+            exchange_id=DEFAULT_EXCHANGE_ID,
+        )
+        envelope = Envelope(
+            to=request.to,
+            sender=request.sender,
+            message=request,
+        )
+        position = {"symbol": "ETH-PERP", "size": 1.0}
+
+        async def watch_positions(key=None, params=None):
+            del key, params
+            yield [position]
+
+        self.connection._exchanges[DEFAULT_EXCHANGE_ID].watch_positions = watch_positions  # pylint: disable=W0212
+        await self.connection.protocol_interface.handle_envelope(envelope)
+        response = await self.connection.receive()
+
+        assert response is not None
+        assert response.message.performative == PositionsMessage.Performative.POSITIONS_UPDATE, f"Error: {response}"
+        assert response.message.positions.positions == [position]
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock
 import pytest
 from aea.mail.base import Envelope
 
-from packages.eightballer.protocols.tickers.dialogues import BaseTickersDialogues, TickersDialogue
+from packages.eightballer.protocols.tickers.dialogues import TickersDialogue, TickersDialogues
 from packages.eightballer.protocols.tickers.message import TickersMessage
 
 from ..test_dcxt_connection import DEFAULT_EXCHANGE_ID, BaseDcxtConnectionTest, get_dialogues, with_timeout
@@ -17,7 +17,7 @@ TEST_MARKET = "BTC-PERP"
 class TestFetchTickers(BaseDcxtConnectionTest):
     """Test protocol messages are handled."""
 
-    DIALOGUES = get_dialogues(BaseTickersDialogues, TickersDialogue)
+    DIALOGUES = get_dialogues(TickersDialogues, TickersDialogue)
 
     @with_timeout(30)
     async def test_handles_get_all_tickers(self) -> None:
@@ -46,7 +46,7 @@ class TestFetchTickers(BaseDcxtConnectionTest):
 class TestConnectionHandlesExchangeErrors(BaseDcxtConnectionTest):
     """Test protocol messages are handled."""
 
-    DIALOGUES = get_dialogues(BaseTickersDialogues, TickersDialogue)
+    DIALOGUES = get_dialogues(TickersDialogues, TickersDialogue)
 
     @with_timeout(3)
     async def test_handles_exchange_timeout(self) -> None:
@@ -73,3 +73,76 @@ class TestConnectionHandlesExchangeErrors(BaseDcxtConnectionTest):
         assert response is not None
         assert isinstance(response, TickersMessage)
         assert response.performative == TickersMessage.Performative.ERROR, f"Error: {response}"
+
+
+@pytest.mark.asyncio
+class TestSubscribeTickers(BaseDcxtConnectionTest):
+    """Test ticker subscriptions are handled."""
+
+    DIALOGUES = get_dialogues(TickersDialogues, TickersDialogue)
+
+    @with_timeout(3)
+    async def test_handles_subscribe(self) -> None:
+        """Can push the tickers which changed."""
+        await self.connection.connect()
+        dialogues = self.DIALOGUES(self.client_skill_id)  # pylint: disable=E1120
+        request, _ = dialogues.create(
+            counterparty=str(self.connection.connection_id),
+            performative=TickersMessage.Performative.SUBSCRIBE,
+            exchange_id=DEFAULT_EXCHANGE_ID,
+            symbols=[TEST_MARKET],
+        )
+        envelope = Envelope(
+            to=request.to,
+            sender=request.sender,
+            message=request,
+        )
+        ticker = {"symbol": TEST_MARKET, "timestamp": 1, "bid": 100.0, "ask": 101.0}
+
+        async def watch_tickers(symbols, key=None, params=None):
+            del key, params
+            assert symbols == [TEST_MARKET]
+            yield [ticker]
+
+        self.connection._exchanges[DEFAULT_EXCHANGE_ID].watch_tickers = watch_tickers  # pylint: disable=W0212
+        await self.connection.protocol_interface.handle_envelope(envelope)
+        response = await self.connection.receive()
+
+        assert response is not None
+        assert response.message.performative == TickersMessage.Performative.TICKERS_UPDATE, f"Error: {response}"
+        assert list(response.message.tickers.tickers) == [ticker]
+
+    @with_timeout(3)
+    async def test_handles_unsubscribe(self) -> None:
+        """Can acknowledge the end of a subscription."""
+        await self.connection.connect()
+        dialogues = self.DIALOGUES(self.client_skill_id)  # pylint: disable=E1120
+        request, _ = dialogues.create(
+            counterparty=str(self.connection.connection_id),
+            performative=TickersMessage.Performative.SUBSCRIBE,
+            exchange_id=DEFAULT_EXCHANGE_ID,
+            symbols=[TEST_MARKET],
+        )
+
+        async def watch_tickers(symbols, key=None, params=None):
+            del symbols, key, params
+            yield [{"symbol": TEST_MARKET, "timestamp": 1, "bid": 100.0, "ask": 101.0}]
+
+        exchange = self.connection._exchanges[DEFAULT_EXCHANGE_ID]  # pylint: disable=W0212
+        exchange.watch_tickers = watch_tickers
+        exchange.unwatch_tickers = MagicMock(return_value=True)
+        await self.connection.protocol_interface.handle_envelope(
+            Envelope(to=request.to, sender=request.sender, message=request)
+        )
+        update = (await self.connection.receive()).message
+        unsubscribe = dialogues.update(update).reply(
+            performative=TickersMessage.Performative.UNSUBSCRIBE,
+            target_message=update,
+            exchange_id=DEFAULT_EXCHANGE_ID,
+        )
+        response = await self.connection.protocol_interface.handle_envelope(
+            Envelope(to=unsubscribe.to, sender=unsubscribe.sender, message=unsubscribe)
+        )
+
+        assert response.performative == TickersMessage.Performative.UNSUBSCRIBED, f"Error: {response}"
+        exchange.unwatch_tickers.assert_called_once()
@@ -0,0 +1,49 @@
+"""Test the array backed order books of the dcxt connection."""
+import numpy as np
+
+from packages.eightballer.connections.dcxt.array_book import ArrayOrderBook
+from packages.eightballer.connections.dcxt.order_book_engine import L2OrderBook
+
+
+class TestArrayOrderBook:
+    """Test the array backed order book."""
+
+    def setup_method(self):
+        """Set up the test."""
+        self.book = ArrayOrderBook.from_levels(
+            "lyra",
+            "ETH-PERP",
+            bids=[[99, 2], [100, 1], [98, 0]],
+            asks=[[102, 2], [101, 1]],
+        )
+
+    def test_levels_are_sorted(self):
+        """Test levels are sorted best first, without empty levels."""
+        assert self.book.bids.prices.tolist() == [100.0, 99.0]
+        assert self.book.asks.prices.tolist() == [101.0, 102.0]
+        assert self.book.mid_price == 100.5
+
+    def test_vwap(self):
+        """Test sizes are priced across levels."""
+        assert self.book.asks.vwap(1) == 101.0
+        assert self.book.asks.vwap(2) == 101.5
+        assert self.book.bids.vwap(3) == (100 + 2 * 99) / 3
+        assert self.book.asks.vwap(4) is None
+
+    def test_depth_queries(self):
+        """Test the depth at a price, the cumulative depth and the top levels."""
+        assert self.book.bids.depth_at_price(99.5) == 1.0
+        assert self.book.bids.depth_at_price(99) == 3.0
+        assert self.book.asks.depth_at_price(100) == 0.0
+        np.testing.assert_array_equal(self.book.asks.cumulative_depth(), [[101, 1], [102, 3]])
+        np.testing.assert_array_equal(self.book.bids.top(1), [[100, 1]])
+
+    def test_conversions(self):
+        """Test a book converts to and from the protocol and local books."""
+        order_book = self.book.to_order_book()
+        assert order_book.bids == [[100.0, 1.0], [99.0, 2.0]]
+        assert ArrayOrderBook.from_order_book(order_book).asks.vwap(2) == 101.5
+
+        local = L2OrderBook("lyra", "ETH-PERP")
+        local.apply_snapshot(bids=order_book.bids, asks=order_book.asks)
+        assert ArrayOrderBook.from_l2(local).bids.vwap(3) == self.book.bids.vwap(3)
@@ -0,0 +1,41 @@
+"""Test the executor running the blocking calls of the DeFi clients."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from packages.eightballer.connections.dcxt.dcxt.defi_exchange import BlockingCallExecutor
+
+
+@pytest.mark.asyncio
+class TestBlockingCallExecutor:
+    """Test the blocking call executor."""
+
+    async def test_runs_off_the_event_loop(self):
+        """Test blocking calls do not run on the event loop thread."""
+        executor = BlockingCallExecutor("test")
+        thread_name = await executor.run(lambda: threading.current_thread().name)
+        executor.shutdown()
+        assert thread_name.startswith("dcxt-test")
+
+    async def test_event_loop_keeps_running(self):
+        """Test the event loop serves other tasks while a call blocks."""
+        executor = BlockingCallExecutor("test")
+        ticks = []
+
+        async def tick():
+            for _ in range(5):
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(executor.run(time.sleep, 0.1), tick())
+        executor.shutdown()
+        assert len(ticks) == 5
+
+    async def test_times_out(self):
+        """Test slow calls time out."""
+        executor = BlockingCallExecutor("test", timeout=0.01)
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run(time.sleep, 0.1)
+        executor.shutdown()
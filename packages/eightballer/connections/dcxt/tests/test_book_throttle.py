@@ -0,0 +1,54 @@
+"""Test the throttling of the order book subscriptions of the dcxt connection."""
+import asyncio
+
+import pytest
+
+from packages.eightballer.connections.dcxt.book_throttle import BookThrottle
+from packages.eightballer.connections.dcxt.order_book_engine import L2OrderBook
+
+
+async def stream(book, updates, delay=0.0):
+    """Apply updates to a book, yielding it after each of them."""
+    for bids in updates:
+        book.apply_snapshot(bids=bids, asks=[[101, 1]])
+        yield book
+        await asyncio.sleep(delay)
+
+
+async def pushed(throttle, updates, delay=0.0):
+    """Get the best bids pushed by a throttle."""
+    book = L2OrderBook("lyra", "ETH-PERP")
+    return [update.best_bid() async for update in throttle.throttle(stream(book, updates, delay))]
+
+
+def test_from_params():
+    """Test the throttle is read from the params of a subscribe message."""
+    throttle = BookThrottle.from_params({"min_interval": b"0.05", "max_rate": b"10", "top_of_book_only": b"true"})
+
+    assert throttle.min_interval == 0.1
+    assert throttle.top_of_book_only
+    assert BookThrottle.from_params(None).min_interval == 0.0
+
+
+@pytest.mark.asyncio
+async def test_pushes_every_change():
+    """Test every change is pushed without a throttle."""
+    updates = [[[100, 1]], [[100, 2]], [[100, 3]]]
+
+    assert await pushed(BookThrottle(), updates, delay=0.01) == [(100.0, 1.0), (100.0, 2.0), (100.0, 3.0)]
+
+
+@pytest.mark.asyncio
+async def test_top_of_book_only():
+    """Test changes below the top of the book are not pushed."""
+    updates = [[[100, 1]], [[100, 1], [99, 5]], [[100.5, 1]]]
+
+    assert await pushed(BookThrottle(top_of_book_only=True), updates, delay=0.01) == [(100.0, 1.0), (100.5, 1.0)]
+
+
+@pytest.mark.asyncio
+async def test_min_interval_pushes_latest_book():
+    """Test updates within the interval are conflated into the latest book."""
+    updates = [[[100, size]] for size in range(1, 6)]
+
+    assert await pushed(BookThrottle(min_interval=0.05), updates, delay=0.001) == [(100.0, 1.0), (100.0, 5.0)]
@@ -0,0 +1,60 @@
+"""Test the delivery queue of the dcxt connection."""
+import asyncio
+
+import pytest
+
+from packages.eightballer.connections.dcxt.delivery_queue import ConflatingQueue
+
+
+@pytest.mark.asyncio
+class TestConflatingQueue:
+    """Test the conflating queue."""
+
+    async def test_keeps_latest_item_per_key(self):
+        """Test a slow consumer only gets the latest item of each key."""
+        queue = ConflatingQueue(maxsize=10)
+        for book in range(3):
+            await queue.put_latest(("lyra", "ETH-PERP"), f"eth-{book}")
+        await queue.put_latest(("lyra", "BTC-PERP"), "btc-0")
+        await queue.put("response")
+
+        assert queue.qsize() == 3
+        assert [await queue.get() for _ in range(3)] == ["eth-2", "btc-0", "response"]
+        assert queue.conflated_total == 2
+
+    async def test_is_bounded(self):
+        """Test new keys wait for space once the queue is full."""
+        queue = ConflatingQueue(maxsize=1)
+        await queue.put_latest("first", 1)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.put_latest("second", 2), timeout=0.01)
+        await queue.put_latest("first", 2)
+        assert await queue.get() == 2
+        assert queue.empty()
+
+    async def test_builds_only_the_items_consumed(self):
+        """Test the items put with a build function are only built once consumed."""
+        queue = ConflatingQueue(maxsize=10)
+        built = []
+
+        def build(book):
+            built.append(book)
+            return f"reply-{len(built)}-{book}"
+
+        for book in range(3):
+            await queue.put_latest("eth", book, build=build)
+        assert not built
+        assert await queue.get() == "reply-1-2"
+        assert built == [2]
+
+    async def test_discards_the_waiting_item(self):
+        """Test a discarded item is neither consumed nor keeps the queue full."""
+        queue = ConflatingQueue(maxsize=1)
+        await queue.put_latest("eth", 1)
+        queue.discard("eth")
+        queue.discard("eth")
+        assert queue.empty()
+        await asyncio.wait_for(queue.put("error"), timeout=0.01)
+        assert await queue.get() == "error"
+        queue.task_done()
+        await asyncio.wait_for(queue.join(), timeout=0.01)
@@ -0,0 +1,80 @@
+"""Test the catalogue of the Lyra instruments."""
+import pytest
+
+from packages.eightballer.connections.dcxt.dcxt.lyra_instruments import SETTLE_DELAY, InstrumentCatalogue
+
+NEVER = 9223372036854775807
+
+
+def instrument(name, activation=0, deactivation=NEVER):
+    """Make a raw instrument."""
+    return {"instrument_name": name, "scheduled_activation": activation, "scheduled_deactivation": deactivation}
+
+
+class Clock:
+    """A clock set by the test."""
+
+    def __init__(self):
+        """Initialise the clock."""
+        self.now = 1000.0
+
+    def __call__(self):
+        """Get the time."""
+        return self.now
+
+
+@pytest.mark.asyncio
+class TestInstrumentCatalogue:
+    """Test the instrument catalogue."""
+
+    def setup_method(self):
+        """Set up the test."""
+        self.clock = Clock()
+        self.calls = []
+        self.listed = {
+            ("eth", "option"): [instrument("ETH-1", deactivation=2000), instrument("ETH-2", activation=1500)],
+            ("eth", "perp"): [instrument("ETH-PERP")],
+        }
+        self.catalogue = InstrumentCatalogue(self.fetch, dict, max_age=10000, clock=self.clock)
+
+    async def fetch(self, currency, instrument_type):
+        """Fetch the instruments of a scope."""
+        self.calls.append((currency, instrument_type))
+        return self.listed[(currency, instrument_type)]
+
+    async def names(self, currency, instrument_type, **kwargs):
+        """Get the names and activity of the markets of a scope."""
+        markets = await self.catalogue.markets(currency, instrument_type, **kwargs)
+        return [(market["instrument_name"], market["is_active"]) for market in markets]
+
+    async def test_scopes_are_fetched_once(self):
+        """Test each currency and type is fetched once, and answered from the indexes."""
+        assert await self.names("ETH", "option") == [("ETH-1", True), ("ETH-2", False)]
+        assert await self.names("eth", "perp") == [("ETH-PERP", True)]
+        assert await self.names("eth", "option") == [("ETH-1", True), ("ETH-2", False)]
+
+        assert self.calls == [("eth", "option"), ("eth", "perp")]
+        assert self.catalogue.get("ETH-PERP")["scheduled_deactivation"] == NEVER
+
+    async def test_refreshes_around_listings_and_expiries(self):
+        """Test activity follows the schedule, the scope being fetched again once a listing or expiry passed."""
+        await self.names("eth", "option")
+
+        self.clock.now = 1500
+        assert await self.names("eth", "option") == [("ETH-1", True), ("ETH-2", True)]
+        assert len(self.calls) == 1
+
+        self.clock.now = 1500 + SETTLE_DELAY
+        self.listed[("eth", "option")] = [instrument("ETH-2", activation=1500)]
+        await self.names("eth", "option")
+        assert len(self.calls) == 2
+        assert self.catalogue.get("ETH-1") is None
+        assert self.catalogue.refresh_at[("eth", "option")] == self.clock.now + 10000
+
+    async def test_expired_instruments(self):
+        """Test expired instruments are left out until they are dropped by the API, unless asked for."""
+        await self.names("eth", "option")
+        self.clock.now = 2000
+
+        assert await self.names("eth", "option") == [("ETH-2", True)]
+        assert await self.names("eth", "option", expired=True) == [("ETH-1", False), ("ETH-2", True)]
@@ -0,0 +1,133 @@
+"""Test the signing of the Lyra orders."""
+import threading
+
+import pytest
+from ccxt import InvalidOrder
+from eth_keys import keys
+from eth_utils import keccak
+from lyra.base_client import BaseClient
+from lyra.constants import CONTRACTS, TEST_PRIVATE_KEY
+from lyra.enums import Environment, InstrumentType, UnderlyingCurrency
+
+from packages.eightballer.connections.dcxt.dcxt.lyra_signing import NonceAllocator, OrderSigner
+from packages.eightballer.connections.dcxt.dcxt.lyra_v2 import LyraClient
+
+SUBACCOUNT_ID = 5
+CONTRACTS_TEST = CONTRACTS[Environment.TEST]
+
+
+class KeccakRecorder:
+    """A keccak recording the hashes it computes."""
+
+    def __init__(self, keccak):
+        """Initialise the recorder."""
+        self.keccak = keccak
+        self.hashes = []
+
+    def __call__(self, *args, **kwargs):
+        """Compute and record a hash."""
+        digest = self.keccak(*args, **kwargs)
+        self.hashes.append(bytes(digest))
+        return digest
+
+
+class NullSigner:
+    """A signer leaving the orders of the Lyra client unsigned."""
+
+    def signHash(self, message_hash):  # pylint: disable=invalid-name
+        """Sign nothing."""
+        del message_hash
+        return type("Signed", (), {"signature": b""})()
+
+
+WALLET = keys.PrivateKey(bytes.fromhex(TEST_PRIVATE_KEY[2:])).public_key.to_checksum_address()
+
+
+def make_signer(clock=lambda: 1700000000.0):
+    """Make a signer of the test account."""
+    return OrderSigner(CONTRACTS_TEST, TEST_PRIVATE_KEY, WALLET, SUBACCOUNT_ID, clock=clock)
+
+
+def test_nonces_increase_within_a_millisecond():
+    """Test the nonces allocated in the same millisecond still increase."""
+    allocator = NonceAllocator(clock=lambda: 1700000000.0005)
+    nonces = [allocator.allocate() for _ in range(3)]
+    assert nonces == [1700000000000000, 1700000000000001, 1700000000000002]
+
+
+def test_nonces_follow_the_clock():
+    """Test the nonces restart from the clock once it moves on."""
+    now = [1700000000.0]
+    allocator = NonceAllocator(clock=lambda: now[0])
+    allocator.allocate()
+    now[0] += 0.002
+    assert allocator.allocate() == 1700000000002000
+
+
+def test_signature_matches_lyra():
+    """Test an order is encoded as the Lyra client encodes it, and signed by the account."""
+    signer = make_signer()
+    order = signer.define("BTC-PERP", "buy", 0.1, 35000.5)
+    client = BaseClient(private_key=TEST_PRIVATE_KEY, env=Environment.TEST, subaccount_id=SUBACCOUNT_ID)
+    client.web3_client.keccak = recorder = KeccakRecorder(client.web3_client.keccak)
+    client.signer = NullSigner()
+    client._sign_order(  # pylint: disable=protected-access
+        dict(order), 0, InstrumentType.PERP, UnderlyingCurrency.BTC
+    )
+    # the hashes of the trade data and of the action, which the typed data hash is built from.
+    trade_data_hash, action_hash = recorder.hashes[:2]
+    typed_data_hash = signer.typed_data_hash(order, CONTRACTS_TEST["BTC_PERP_ADDRESS"], 0)
+    assert typed_data_hash == keccak(b"\x19\x01" + bytes.fromhex(CONTRACTS_TEST["DOMAIN_SEPARATOR"][2:]) + action_hash)
+    assert trade_data_hash != action_hash
+
+    signed = signer.sign(order, CONTRACTS_TEST["BTC_PERP_ADDRESS"], 0)
+    signature = bytes.fromhex(signed["signature"][2:])
+    vrs = (signature[64] - 27, int.from_bytes(signature[:32], "big"), int.from_bytes(signature[32:64], "big"))
+    public_key = keys.Signature(vrs=vrs).recover_public_key_from_msg_hash(typed_data_hash)
+    assert public_key.to_checksum_address() == signer.signer
+
+
+@pytest.mark.asyncio
+async def test_presign_signs_off_the_loop():
+    """Test orders are signed on the pool rather than on the event loop."""
+    signer = make_signer()
+    threads = []
+    sign = signer.sign
+
+    def record_thread(*args):
+        threads.append(threading.current_thread())
+        return sign(*args)
+
+    signer.sign = record_thread
+    order = signer.define("BTC-PERP", "sell", 1, 30000)
+    signed = await signer.presign(order, CONTRACTS_TEST["BTC_PERP_ADDRESS"], 0)
+    signer.close()
+    assert signed["nonce"] == order["nonce"]
+    assert signed["signature"].startswith("0x")
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_client_without_subaccount_cannot_sign():
+    """Test a client configured without a subaccount is created, but refuses to sign orders."""
+    client = LyraClient(auth={}, env=Environment.TEST)
+
+    assert client.client.subaccount_id is None
+    with pytest.raises(InvalidOrder):
+        client.signer.define("BTC-PERP", "buy", 0.1, 35000.5)
+
+
+def test_client_signs_for_its_configured_subaccount():
+    """Test the signer of a client is built from the key, wallet and subaccount it is configured with."""
+    client = LyraClient(
+        auth={"private_key": f"{TEST_PRIVATE_KEY}\n"},
+        env=Environment.TEST,
+        subaccount_id=SUBACCOUNT_ID,
+        wallet=WALLET,
+    )
+
+    order = client.signer.define("BTC-PERP", "buy", 0.1, 35000.5)
+    client.signer.close()
+    assert order["subaccount_id"] == SUBACCOUNT_ID
+    assert client.signer.wallet == WALLET
+    assert client.signer.signer == WALLET
+    assert client.client.contracts == CONTRACTS_TEST
@@ -0,0 +1,85 @@
+"""Test the market metadata cache."""
+import asyncio
+
+import pytest
+
+from packages.eightballer.connections.dcxt.market_cache import MarketCache
+
+TEST_KEY = ("lyra", "get_all_markets", ())
+
+
+@pytest.mark.asyncio
+class TestMarketCache:
+    """Test the market cache."""
+
+    def setup_method(self) -> None:
+        """Set up a fetcher counting its calls."""
+        self.calls = 0
+
+    async def fetch(self):
+        """Fetch the markets."""
+        self.calls += 1
+        return f"markets-{self.calls}"
+
+    async def test_serves_from_memory(self):
+        """Test only the first request goes to the exchange."""
+        cache = MarketCache(ttl=60)
+        assert await cache.get(TEST_KEY, self.fetch) == "markets-1"
+        assert await cache.get(TEST_KEY, self.fetch) == "markets-1"
+        assert self.calls == 1
+
+    async def test_stale_entries_refresh_in_background(self):
+        """Test stale entries are served while being refreshed."""
+        cache = MarketCache(ttl=0.01)
+        await cache.get(TEST_KEY, self.fetch)
+        await asyncio.sleep(0.02)
+        assert await cache.get(TEST_KEY, self.fetch) == "markets-1"
+        await asyncio.sleep(0)
+        assert await cache.get(TEST_KEY, self.fetch) == "markets-2"
+
+    async def test_rejects_non_positive_ttl(self):
+        """Test a ttl of 0, which would make the refresher spin, is rejected."""
+        with pytest.raises(ValueError):
+            MarketCache(ttl=0)
+
+    async def test_refreshes_are_scheduled(self):
+        """Test background refreshes go through the scheduler, by exchange."""
+        scheduled = []
+
+        async def schedule(exchange_id, call):
+            scheduled.append(exchange_id)
+            return await call()
+
+        cache = MarketCache(ttl=60, schedule=schedule)
+        await cache.get(TEST_KEY, self.fetch)
+        await cache.refresh(TEST_KEY)
+        assert scheduled == ["lyra"]
+        assert await cache.get(TEST_KEY, self.fetch) == "markets-2"
+
+    async def test_invalidate(self):
+        """Test invalidated entries are fetched again."""
+        cache = MarketCache(ttl=60)
+        await cache.get(TEST_KEY, self.fetch)
+        cache.invalidate("lyra")
+        assert TEST_KEY not in cache
+        assert await cache.get(TEST_KEY, self.fetch) == "markets-2"
+
+    async def test_invalidate_cancels_refreshes(self):
+        """Test a refresh running when its entry is invalidated does not store the markets it fetched."""
+        fetched = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fetch():
+            fetched.set()
+            await release.wait()
+            return "stale-markets"
+
+        cache = MarketCache(ttl=60)
+        refresh = cache.warm(TEST_KEY, fetch)
+        await fetched.wait()
+        cache.invalidate("lyra")
+        release.set()
+        await asyncio.sleep(0)
+        assert refresh.cancelled()
+        assert TEST_KEY not in cache
+        assert await cache.get(TEST_KEY, self.fetch) == "markets-1"
@@ -0,0 +1,49 @@
+"""Test the metrics of the dcxt connection."""
+from packages.eightballer.connections.dcxt.metrics import ConnectionMetrics, Histogram
+
+
+class TestHistogram:
+    """Test the histogram."""
+
+    def test_cumulative_buckets(self):
+        """Test the buckets are cumulative, with every observation in +Inf."""
+        histogram = Histogram(buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.7, 5.0):
+            histogram.observe(value)
+
+        assert histogram.cumulative() == [("0.1", 1), ("1.0", 3), ("+Inf", 4)]
+        assert histogram.sum == 6.25
+
+
+class TestConnectionMetrics:
+    """Test the connection metrics."""
+
+    def setup_method(self):
+        """Set up the test."""
+        self.metrics = ConnectionMetrics(buckets=(0.1, 1.0))
+
+    def test_snapshot(self):
+        """Test requests, errors, order book updates and gauges are reported."""
+        self.metrics.observe_request("orders", "lyra", 0.05, error=False)
+        self.metrics.observe_request("orders", "lyra", 0.5, error=True)
+        self.metrics.observe_order_book_update("lyra", "ETH-PERP")
+        self.metrics.add_gauge("in_flight_requests", lambda: {"lyra": 2})
+
+        snapshot = self.metrics.snapshot()
+
+        assert snapshot["requests"]["orders/lyra"]["latency"]["count"] == 2
+        assert snapshot["requests"]["orders/lyra"]["errors"] == 1
+        assert snapshot["order_book_updates"]["lyra/ETH-PERP"]["total"] == 1
+        assert snapshot["gauges"] == {"in_flight_requests": {"lyra": 2}}
+
+    def test_render_prometheus(self):
+        """Test the metrics are rendered in the Prometheus text format."""
+        self.metrics.observe_request("orders", "lyra", 0.05, error=True)
+        self.metrics.add_gauge("outbound_queue_depth", lambda: {"": 3}, label=None)
+
+        lines = self.metrics.render_prometheus().splitlines()
+
+        assert 'dcxt_request_latency_seconds_bucket{interface="orders",exchange_id="lyra",le="0.1"} 1' in lines
+        assert 'dcxt_request_latency_seconds_count{interface="orders",exchange_id="lyra"} 1' in lines
+        assert 'dcxt_request_errors_total{interface="orders",exchange_id="lyra"} 1' in lines
+        assert "dcxt_outbound_queue_depth 3" in lines
@@ -0,0 +1,224 @@
+"""Test the order book engine of the dcxt connection."""
+import pytest
+
+from packages.eightballer.connections.dcxt.order_book_engine import (
+    BookDiffTracker,
+    BookOutOfSync,
+    L2OrderBook,
+    crc32_checksum,
+    watch_book_changes,
+)
+
+
+class TestL2OrderBook:
+    """Test the L2 order book."""
+
+    def setup_method(self):
+        """Set up the test."""
+        self.book = L2OrderBook("lyra", "ETH-PERP")
+        self.book.apply_snapshot(bids=[[99, 1], [100, 2]], asks=[[102, 1], [101, 3]], sequence=1)
+
+    def test_levels_are_sorted(self):
+        """Test bids are sorted descending and asks ascending."""
+        assert self.book.bids.levels() == [[100.0, 2.0], [99.0, 1.0]]
+        assert self.book.asks.levels() == [[101.0, 3.0], [102.0, 1.0]]
+        assert self.book.best_bid() == (100.0, 2.0)
+        assert self.book.best_ask() == (101.0, 3.0)
+
+    def test_apply_delta(self):
+        """Test a delta inserts, updates and removes levels."""
+        assert self.book.apply_delta(bids=[[100.5, 1], [99, 0]], asks=[[101, 4]], sequence=2)
+
+        assert self.book.bids.levels() == [[100.5, 1.0], [100.0, 2.0]]
+        assert self.book.asks.levels() == [[101.0, 4.0], [102.0, 1.0]]
+        assert self.book.sequence == 2
+
+    def test_unchanged_and_stale_deltas(self):
+        """Test deltas which do not move the book, or were already applied, are reported as unchanged."""
+        assert not self.book.apply_delta(bids=[[100, 2], [98, 0]], asks=[], sequence=2)
+        assert not self.book.apply_delta(bids=[[100, 5]], asks=[], sequence=2)
+        assert self.book.best_bid() == (100.0, 2.0)
+
+    def test_deltas_before_snapshot_are_dropped(self):
+        """Test a book only accepts deltas once it has a snapshot."""
+        book = L2OrderBook("lyra", "ETH-PERP")
+
+        assert not book.apply_delta(bids=[[100, 1]], asks=[], sequence=1)
+        assert not book.bids.levels()
+
+    def test_sequence_gap(self):
+        """Test a delta which does not follow the last one applied leaves the book waiting for a snapshot."""
+        with pytest.raises(BookOutOfSync):
+            self.book.apply_delta(bids=[[100, 5]], asks=[], sequence=3)
+
+        assert not self.book.synced
+        assert not self.book.apply_delta(bids=[[100, 5]], asks=[], sequence=4)
+
+    def test_previous_sequence(self):
+        """Test deltas numbered with gaps are chained by the sequence of the delta before them."""
+        assert self.book.apply_delta(bids=[[100, 5]], asks=[], sequence=10, previous_sequence=1)
+        with pytest.raises(BookOutOfSync):
+            self.book.apply_delta(bids=[[100, 6]], asks=[], sequence=20, previous_sequence=11)
+
+    def test_checksum(self):
+        """Test the book is checked against the checksum of its top levels."""
+        self.book.verify_checksum(crc32_checksum([[100.0, 2.0], [99.0, 1.0]], [[101.0, 3.0], [102.0, 1.0]]))
+
+        with pytest.raises(BookOutOfSync):
+            self.book.verify_checksum(crc32_checksum([[100.0, 2.0]], [[101.0, 3.0]]))
+        assert not self.book.synced
+
+
+def test_crc32_checksum_interleaves_levels():
+    """Test the checksum is the signed CRC32 of the levels, interleaved bid then ask."""
+    assert crc32_checksum([[3366.1, 7.0]], [[3366.8, 9.0]]) == -2058547290
+    assert crc32_checksum([[1.5, 0.25]], []) == crc32_checksum([[1.5, 0.25]], [], depth=1)
+
+
+class SnapshotExchange:
+    """Exchange streaming full snapshots."""
+
+    def __init__(self, snapshots):
+        """Initialise the exchange."""
+        self.snapshots = iter(snapshots)
+
+    async def watch_order_book(self, symbol):
+        """Get the next snapshot."""
+        del symbol
+        try:
+            return next(self.snapshots)
+        except StopIteration as error:
+            raise ConnectionError("stream closed") from error
+
+
+@pytest.mark.asyncio
+async def test_watch_book_changes_skips_unchanged_snapshots():
+    """Test only the snapshots which change the book are yielded."""
+    snapshot = {"bids": [[100, 1]], "asks": [[101, 1]]}
+    exchange = SnapshotExchange([snapshot, snapshot, {"bids": [[100, 2]], "asks": [[101, 1]]}])
+    book = L2OrderBook("lyra", "ETH-PERP")
+    best_bids = []
+
+    with pytest.raises(ConnectionError):
+        async for update in watch_book_changes(exchange, "ETH-PERP", book):
+            best_bids.append(update.best_bid())
+
+    assert best_bids == [(100.0, 1.0), (100.0, 2.0)]
+
+
+@pytest.mark.asyncio
+async def test_watch_book_changes_validates_snapshots():
+    """Test snapshots behind the book or failing their checksum are reported, the book resyncing from the next."""
+    exchange = SnapshotExchange(
+        [
+            {"bids": [[100, 1]], "asks": [[101, 1]], "nonce": 7},
+            {"bids": [[100, 2]], "asks": [[101, 1]], "nonce": 9},
+            # the numbering restarted, e.g. on a reconnection.
+            {"bids": [[100, 3]], "asks": [[101, 1]], "nonce": 2},
+            {"bids": [[100, 4]], "asks": [[101, 1]], "nonce": 3, "checksum": 0},
+            {"bids": [[100, 5]], "asks": [[101, 1]], "nonce": 4},
+        ]
+    )
+    book = L2OrderBook("lyra", "ETH-PERP")
+    best_bids, gaps = [], []
+
+    with pytest.raises(ConnectionError):
+        async for update in watch_book_changes(exchange, "ETH-PERP", book, gaps.append):
+            best_bids.append((update.best_bid(), update.epoch))
+
+    assert best_bids == [((100.0, 1.0), 0), ((100.0, 2.0), 0), ((100.0, 3.0), 1), ((100.0, 5.0), 2)]
+    assert len(gaps) == 2
+    assert all(isinstance(gap, BookOutOfSync) for gap in gaps)
+
+
+class DeltaExchange:
+    """Exchange streaming sequenced deltas."""
+
+    def __init__(self, updates):
+        """Initialise the exchange."""
+        self.updates = updates
+
+    async def watch_order_book_deltas(self, symbol):
+        """Stream the updates."""
+        del symbol
+        for update in self.updates:
+            yield update
+
+
+class ResyncingExchange(DeltaExchange):
+    """Exchange streaming sequenced deltas, and serving snapshots over REST."""
+
+    def __init__(self, updates, snapshot):
+        """Initialise the exchange."""
+        super().__init__(updates)
+        self.snapshot = snapshot
+
+    async def fetch_order_book(self, symbol):
+        """Get a snapshot."""
+        del symbol
+        return self.snapshot
+
+
+@pytest.mark.asyncio
+async def test_watch_book_changes_resyncs_on_gap():
+    """Test a missed delta is reported, and the book resynced from a snapshot."""
+    exchange = ResyncingExchange(
+        [
+            {"snapshot": True, "bids": [[100, 1]], "asks": [[101, 1]], "sequence": 1},
+            {"bids": [[100, 2]], "asks": [], "sequence": 3},
+            {"bids": [[100, 4]], "asks": [], "sequence": 6},
+        ],
+        snapshot={"bids": [[100, 3]], "asks": [[101, 1]], "nonce": 5},
+    )
+    book = L2OrderBook("lyra", "ETH-PERP")
+    gaps = []
+
+    best_bids = [update.best_bid() async for update in watch_book_changes(exchange, "ETH-PERP", book, gaps.append)]
+
+    assert best_bids == [(100.0, 1.0), (100.0, 3.0), (100.0, 4.0)]
+    assert len(gaps) == 1
+
+
+@pytest.mark.asyncio
+async def test_watch_book_changes_validates_checksums():
+    """Test a checksum mismatch ends the stream when the exchange cannot send a snapshot otherwise."""
+    checksum = crc32_checksum([[100, 1]], [[101, 1]])
+    exchange = DeltaExchange(
+        [
+            {"snapshot": True, "bids": [[100, 1]], "asks": [[101, 1]], "checksum": checksum},
+            {"bids": [[100, 2]], "asks": [], "checksum": checksum},
+        ]
+    )
+
+    with pytest.raises(BookOutOfSync):
+        async for _ in watch_book_changes(exchange, "ETH-PERP", L2OrderBook("lyra", "ETH-PERP")):
+            pass
+
+    """Test the diffs of the books delivered to a subscriber."""
+
+    def setup_method(self):
+        """Set up the test."""
+        self.book = L2OrderBook("lyra", "ETH-PERP")
+        self.book.apply_snapshot(bids=[[100, 1], [99, 2]], asks=[[101, 1]])
+        self.tracker = BookDiffTracker()
+
+    def test_snapshot_then_diffs(self):
+        """Test the book is sent in full once, then only its changed levels, numbered from 1."""
+        assert self.tracker.needs_snapshot(self.book)
+        assert self.tracker.snapshot(self.book).bids == [[100.0, 1.0], [99.0, 2.0]]
+        assert not self.tracker.needs_snapshot(self.book)
+
+        self.book.apply_delta(bids=[[100, 0], [99.5, 3]], asks=[[101, 2]])
+        diff = self.tracker.diff(self.book)
+
+        assert sorted(diff.bids) == [[99.5, 3.0], [100.0, 0.0]]
+        assert diff.asks == [[101.0, 2.0]]
+        assert self.tracker.sequence == 1
+        assert self.tracker.diff(self.book) is None
+
+    def test_resync_needs_snapshot(self):
+        """Test a snapshot is due again once the book was resynced."""
+        self.tracker.snapshot(self.book)
+        self.book.reset()
+
+        assert self.tracker.needs_snapshot(self.book)
@@ -0,0 +1,191 @@
+"""Test the position caches of the dcxt connection."""
+import asyncio
+
+import pytest
+from lyra.enums import Environment
+
+from packages.eightballer.connections.dcxt.dcxt.lyra_v2 import LyraClient
+from packages.eightballer.connections.dcxt.position_cache import PositionCache
+
+
+def position(symbol, amount, average_price):
+    """Make a raw position."""
+    return {
+        "instrument_name": symbol,
+        "symbol": symbol,
+        "amount": str(amount),
+        "average_price": str(average_price),
+        "realized_pnl": "0",
+    }
+
+
+def trade(symbol, direction, amount, price, timestamp=1):
+    """Make a raw trade."""
+    return {
+        "instrument_name": symbol,
+        "direction": direction,
+        "trade_amount": str(amount),
+        "trade_price": str(price),
+        "timestamp": timestamp,
+    }
+
+
+def convert(raw):
+    """Convert a raw position, keeping the fields the tests check."""
+    return {
+        "symbol": raw["instrument_name"],
+        "size": float(raw["amount"]),
+        "entry_price": float(raw["average_price"]),
+        "realized_pnl": float(raw["realized_pnl"]),
+    }
+
+
+async def next_update(subscription):
+    """Get the next positions pushed to a subscription."""
+    return await asyncio.wait_for(subscription.updates().__anext__(), timeout=1)
+
+
+@pytest.mark.asyncio
+class TestPositionCache:
+    """Test the position cache."""
+
+    def setup_method(self):
+        """Set up the test."""
+        self.cache = PositionCache(convert)
+        self.cache.load([position("ETH-PERP", 2, 100)])
+
+    async def test_trades_move_positions(self):
+        """Test trades grow and reduce positions, realising the pnl of what they close."""
+        self.cache.apply_trade(trade("ETH-PERP", "buy", 2, 110))
+        assert self.cache.items["ETH-PERP"]["entry_price"] == 105.0
+
+        self.cache.apply_trade(trade("ETH-PERP", "sell", 1, 115))
+        assert self.cache.items["ETH-PERP"] == {
+            "symbol": "ETH-PERP",
+            "size": 3.0,
+            "entry_price": 105.0,
+            "realized_pnl": 10.0,
+        }
+
+        self.cache.apply_trade(trade("BTC-PERP", "sell", 0.5, 65000))
+        assert self.cache.items["BTC-PERP"]["size"] == -0.5
+
+    async def test_trades_unset_the_fields_marked_to_market(self):
+        """Test the pnl and margins the exchange marks to market are unset by a trade, rather than left stale."""
+        self.cache.load([{**position("ETH-PERP", 2, 100), "unrealized_pnl": "20", "initial_margin": "50"}])
+        self.cache.apply_trade(trade("ETH-PERP", "buy", 2, 110))
+
+        assert self.cache.raw["ETH-PERP"]["unrealized_pnl"] is None
+        assert self.cache.raw["ETH-PERP"]["initial_margin"] is None
+
+    async def test_flip_and_close(self):
+        """Test a position flipping side reopens at the trade price, and a closed one is pushed once then dropped."""
+        subscription = self.cache.subscribe()
+        await next_update(subscription)
+
+        self.cache.apply_trade(trade("ETH-PERP", "sell", 3, 90))
+        assert self.cache.items["ETH-PERP"]["entry_price"] == 90.0
+        assert self.cache.items["ETH-PERP"]["realized_pnl"] == -20.0
+
+        self.cache.apply_trade(trade("ETH-PERP", "buy", 1, 95))
+        update = await next_update(subscription)
+
+        assert update == [{"symbol": "ETH-PERP", "size": 0.0, "entry_price": 0.0, "realized_pnl": -25.0}]
+        assert not self.cache.positions
+
+    async def test_snapshot_pushes_changes_only(self):
+        """Test a snapshot only pushes the positions which changed, and closes those missing from it."""
+        subscription = self.cache.subscribe(key="dialogue-1")
+        await next_update(subscription)
+
+        self.cache.load([position("ETH-PERP", 2, 100)])
+        self.cache.load([position("BTC-PERP", 1, 65000)])
+        update = await next_update(subscription)
+
+        assert [(item["symbol"], item["size"]) for item in update] == [("ETH-PERP", 0.0), ("BTC-PERP", 1.0)]
+        assert [item["symbol"] for item in self.cache.positions] == ["BTC-PERP"]
+
+
+class RecordingSocket:
+    """A websocket recording the methods sent over it."""
+
+    def __init__(self, sent):
+        """Initialise the socket."""
+        self.sent = sent
+
+    async def send_json(self, payload):
+        """Record the method of a payload."""
+        self.sent.append(payload["method"])
+
+
+def lyra_client(sent):
+    """Make a Lyra client whose snapshot of the positions is taken between the exchange times 100 and 110."""
+    client = LyraClient(auth={}, env=Environment.TEST, subaccount_id=5)
+    server_times = iter([100, 110])
+
+    async def get_positions():
+        sent.append("get_positions")
+        return [
+            {
+                **position("ETH-PERP", 1, 100),
+                **{name: "0" for name in ("unrealized_pnl", "initial_margin", "maintenance_margin", "mark_value")},
+                "mark_price": "100",
+                "leverage": None,
+                "liquidation_price": None,
+            }
+        ]
+
+    async def server_time():
+        return next(server_times)
+
+    client.client.get_positions = get_positions
+    client.client.sign_authentication_header = dict
+    client._server_time = server_time  # pylint: disable=protected-access
+    return client
+
+
+def trades_message(*trades):
+    """Make a message of the trades channel of the subaccount."""
+    return {"params": {"channel": "5.trades", "data": list(trades)}}
+
+
+@pytest.mark.asyncio
+async def test_lyra_skips_the_trades_its_snapshot_holds():
+    """Test Lyra subscribes to the trades, then loads its snapshot, only applying the trades made after it."""
+    sent = []
+    client = lyra_client(sent)
+
+    await client._connect_positions(RecordingSocket(sent))  # pylint: disable=protected-access
+    client._handle_position_message(  # pylint: disable=protected-access
+        trades_message(
+            trade("ETH-PERP", "buy", 1, 100, timestamp=99),
+            trade("ETH-PERP", "buy", 2, 100, timestamp=111),
+        )
+    )
+
+    assert sent == ["public/login", "subscribe", "get_positions"]
+    assert client.position_cache.raw["ETH-PERP"]["amount"] == "3.0"
+
+
+@pytest.mark.asyncio
+async def test_lyra_snapshots_again_for_a_trade_made_while_snapshotting():
+    """Test a trade made while the snapshot was taken, which it may not hold, fails the stream to snapshot again."""
+    sent = []
+    client = lyra_client(sent)
+
+    await client._connect_positions(RecordingSocket(sent))  # pylint: disable=protected-access
+    with pytest.raises(ConnectionError):
+        client._handle_position_message(  # pylint: disable=protected-access
+            trades_message(trade("ETH-PERP", "buy", 1, 100, timestamp=105))
+        )
+
+    assert client.position_cache.raw["ETH-PERP"]["amount"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_lyra_needs_a_subaccount_to_stream_positions():
+    """Test streaming the positions of a client without a subaccount fails, rather than subscribing to nothing."""
+    client = LyraClient(auth={}, env=Environment.TEST)
+
+    with pytest.raises(ValueError):
+        await client.watch_positions().__anext__()
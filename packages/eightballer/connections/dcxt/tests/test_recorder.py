@@ -0,0 +1,64 @@
+"""Test the market data recorder of the dcxt connection."""
+from packages.eightballer.connections.dcxt.recorder import MarketDataReader, MarketDataRecorder, RecordKind
+
+
+class TestMarketDataRecorder:
+    """Test the market data recorder."""
+
+    def setup_method(self):
+        """Set up the test."""
+        self.recorder = None
+
+    def teardown_method(self):
+        """Tear down the test."""
+        if self.recorder is not None:
+            self.recorder.stop()
+
+    def record(self, directory, **kwargs):
+        """Start a recorder."""
+        self.recorder = MarketDataRecorder(str(directory), **kwargs)
+        self.recorder.start()
+        return self.recorder
+
+    def test_round_trip(self, tmp_path):
+        """Test order books, tickers and candles are read back as recorded."""
+        recorder = self.record(tmp_path, depth=2)
+        recorder.record_order_book("lyra", "ETH-PERP", [[100, 1], [99, 2], [98, 3]], [[101, 1]], timestamp=5, nonce=7)
+        recorder.record_ticker("lyra", {"symbol": "ETH-PERP", "timestamp": 5, "bid": 100.0, "ask": 101.0})
+        candle = {"timestamp": 60000, "open": 1, "high": 2, "low": 0.5, "close": 1.5}
+        recorder.record_ohlcv("lyra", "ETH-PERP", 60, candle)
+        recorder.stop()
+
+        reader = MarketDataReader(str(tmp_path))
+        (book,) = reader.read(RecordKind.ORDER_BOOK)
+        (ticker,) = reader.read(RecordKind.TICKER)
+        (candle,) = reader.read(RecordKind.OHLCV)
+
+        assert (book["exchange_id"], book["symbol"], book["timestamp"], book["nonce"]) == ("lyra", "ETH-PERP", 5, 7)
+        assert book["bids"] == [[100.0, 1.0], [99.0, 2.0]]
+        assert book["asks"] == [[101.0, 1.0]]
+        assert (ticker["bid"], ticker["ask"], ticker["high"]) == (100.0, 101.0, None)
+        assert (candle["interval"], candle["close"]) == (60, 1.5)
+
+    def test_time_range_reads_across_segments(self, tmp_path):
+        """Test records are read by time range, across segment files."""
+        recorder = self.record(tmp_path, capacity=300)
+        for price in range(1000):
+            recorder.record_order_book("lyra", "ETH-PERP", [[price, 1]], [])
+        recorder.stop()
+        reader = MarketDataReader(str(tmp_path))
+        records = list(reader.read(RecordKind.ORDER_BOOK))
+
+        start, end = records[400]["received_at"], records[650]["received_at"]
+        selected = list(reader.read(RecordKind.ORDER_BOOK, start=start, end=end))
+
+        assert len(list(tmp_path.glob("order_book-*.seg"))) == 4
+        assert [record["bids"][0][0] for record in selected] == list(range(400, 651))
+
+    def test_drops_records_when_writer_falls_behind(self, tmp_path):
+        """Test recording never blocks, dropping records once too many are pending."""
+        recorder = MarketDataRecorder(str(tmp_path), max_pending=2)
+        for _ in range(5):
+            recorder.record_ticker("lyra", {"symbol": "ETH-PERP"})
+
+        assert recorder.dropped == 3
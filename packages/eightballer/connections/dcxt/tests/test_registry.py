@@ -0,0 +1,34 @@
+"""Test the lazy registry of the dcxt exchanges."""
+import subprocess
+import sys
+
+import pytest
+
+from packages.eightballer.connections.dcxt import dcxt
+
+EXCHANGE_MODULES = [
+    "packages.eightballer.connections.dcxt.dcxt.lyra_v2",
+    "packages.eightballer.connections.dcxt.dcxt.balancer",
+    "packages.eightballer.connections.dcxt.dcxt.hundred_x",
+    "packages.eightballer.connections.dcxt.dcxt.replay",
+]
+
+
+def test_registry_does_not_import_exchanges():
+    """Test importing the registry does not import any exchange client."""
+    code = f"import sys; import {dcxt.__name__}; print([m for m in {EXCHANGE_MODULES} if m in sys.modules])"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_resolves_exchange_by_name():
+    """Test exchange classes are resolved on demand."""
+    exchange_class = dcxt.get_exchange_class("hundred_x")
+    assert exchange_class.__name__ == "HundredXClient"
+    assert dcxt.hundred_x is exchange_class
+
+
+def test_unknown_exchange():
+    """Test looking up an unknown exchange fails."""
+    with pytest.raises(AttributeError):
+        dcxt.get_exchange_class("unknown")
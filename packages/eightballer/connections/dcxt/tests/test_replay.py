@@ -0,0 +1,77 @@
+"""Test the replay exchange of the dcxt connection."""
+import pytest
+
+from packages.eightballer.connections.dcxt import dcxt
+from packages.eightballer.connections.dcxt.dcxt.replay import ReplayFinished
+from packages.eightballer.connections.dcxt.recorder import MarketDataRecorder
+
+
+@pytest.fixture(name="recording")
+def fixture_recording(tmp_path):
+    """Record a few books and tickers."""
+    recorder = MarketDataRecorder(str(tmp_path))
+    recorder.start()
+    recorder.record_ticker("lyra", {"symbol": "ETH-PERP", "timestamp": 1, "bid": 100.0, "ask": 101.0})
+    for price in (100, 101, 102):
+        recorder.record_order_book("lyra", "ETH-PERP", [[price, 1]], [[price + 1, 1]], timestamp=price)
+    recorder.record_ticker("lyra", {"symbol": "ETH-PERP", "timestamp": 2, "bid": 102.0, "ask": 103.0})
+    recorder.stop()
+    return tmp_path
+
+
+def make_client(recording, **kwargs):
+    """Make a replay client of a recording."""
+    return dcxt.get_exchange_class("replay")(kwargs={"record_dir": str(recording), **kwargs})
+
+
+@pytest.mark.asyncio
+async def test_replays_books_in_order(recording):
+    """Test the books of a symbol are replayed in the order they were recorded, until the recording ends."""
+    client = make_client(recording, speed=0)
+    books = [await client.watch_order_book("ETH-PERP") for _ in range(3)]
+
+    assert [book.bids for book in books] == [[[100.0, 1.0]], [[101.0, 1.0]], [[102.0, 1.0]]]
+    with pytest.raises(ReplayFinished):
+        await client.watch_order_book("ETH-PERP")
+
+
+@pytest.mark.asyncio
+async def test_tickers_follow_the_replay_clock(recording):
+    """Test the tickers served are the last recorded up to the time of the replay."""
+    client = make_client(recording, speed=0)
+    assert [ticker.bid for ticker in (await client.fetch_tickers()).tickers] == [100.0]
+
+    for _ in range(3):
+        await client.watch_order_book("ETH-PERP")
+    # the books served did not reach the last ticker, so the fetch moves the clock on to it.
+    assert (await client.fetch_ticker("ETH-PERP"))["bid"] == 102.0
+
+
+@pytest.mark.asyncio
+async def test_tickers_alone_are_replayed(tmp_path):
+    """Test a recording of tickers alone is replayed, ticker by ticker, as fast as it is fetched."""
+    recorder = MarketDataRecorder(str(tmp_path))
+    recorder.start()
+    for bid in (100.0, 101.0):
+        recorder.record_tickers(
+            "lyra",
+            [{"symbol": symbol, "timestamp": 1, "bid": bid, "ask": bid + 1} for symbol in ("BTC-PERP", "ETH-PERP")],
+        )
+    recorder.stop()
+    client = make_client(tmp_path, speed=0)
+
+    rounds = [[ticker.bid for ticker in (await client.fetch_tickers()).tickers] for _ in range(3)]
+
+    assert rounds == [[100.0, 100.0], [101.0, 101.0], [101.0, 101.0]]
+
+
+@pytest.mark.asyncio
+async def test_markets_and_balances(recording):
+    """Test the markets are those recorded, and the balances those configured."""
+    client = make_client(recording, balances={"USDC": 1000})
+
+    markets = await client.fetch_markets()
+    balances = await client.fetch_balance()
+
+    assert [market.symbol for market in markets.markets] == ["ETH-PERP"]
+    assert [(balance.asset_id, balance.total) for balance in balances.balances] == [("USDC", 1000.0)]
@@ -0,0 +1,112 @@
+"""Test the request scheduler of the dcxt connection."""
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from packages.eightballer.connections.dcxt.scheduler import RequestScheduler, TokenBucket
+from packages.eightballer.connections.dcxt.tasks import TaskRegistry
+
+TEST_PROTOCOL = "eightballer/orders:0.1.0"
+
+
+def make_envelope(performative: str) -> MagicMock:
+    """Make a mock envelope carrying a message with the given performative."""
+    envelope = MagicMock()
+    envelope.message.performative.value = performative
+    envelope.message.protocol_id = TEST_PROTOCOL
+    return envelope
+
+
+@pytest.mark.asyncio
+class TestRequestScheduler:
+    """Test the request scheduler."""
+
+    async def test_token_bucket_limits_rate(self):
+        """Test the bucket hands out its burst, then waits for a refill."""
+        bucket = TokenBucket(rate=10, capacity=2)
+        await bucket.acquire()
+        await bucket.acquire()
+        assert bucket.wait_time() > 0
+
+    async def test_throttle_backs_off(self):
+        """Test repeated throttling grows the delay."""
+        bucket = TokenBucket()
+        first, second = bucket.throttle(), bucket.throttle()
+        assert second > first
+        assert bucket.wait_time() > 0
+
+    async def test_dispatches_by_priority(self):
+        """Test cancels jump ahead of creates, and creates ahead of queries."""
+        dispatched = []
+        scheduler = RequestScheduler(
+            dispatch=lambda envelope, *_: dispatched.append(envelope.message.performative.value),
+            registry=TaskRegistry(),
+        )
+        for performative in ["get_orders", "create_order", "get_orders", "cancel_order"]:
+            scheduler.submit(make_envelope(performative), "lyra")
+        while len(dispatched) < 4:
+            await asyncio.sleep(0)
+        scheduler.stop()
+
+        assert dispatched == ["cancel_order", "create_order", "get_orders", "get_orders"]
+
+    async def test_schedules_calls_within_the_rate_limit(self):
+        """Test calls made by the connection itself wait for a token of their exchange."""
+        scheduler = RequestScheduler(
+            dispatch=MagicMock(),
+            registry=TaskRegistry(),
+            rate_limits={"lyra": {"requests_per_second": 10, "burst": 1}},
+        )
+
+        async def call():
+            return "markets"
+
+        first = await scheduler.schedule("lyra", call)
+        assert first == "markets"
+        assert scheduler.bucket("lyra").wait_time() > 0
+        assert await scheduler.schedule("lyra", call) == "markets"
+        scheduler.stop()
+
+    async def test_batches_are_metered_by_their_calls(self):
+        """Test batches are dispatched as orders are, their exchange calls taking the tokens instead."""
+        dispatched = []
+        scheduler = RequestScheduler(
+            dispatch=lambda envelope, *_: dispatched.append(envelope.message.performative.value),
+            registry=TaskRegistry(),
+            rate_limits={"lyra": {"requests_per_second": 10, "burst": 1}},
+        )
+        for performative in ["get_orders", "create_orders", "cancel_all_orders"]:
+            scheduler.submit(make_envelope(performative), "lyra")
+        # the only token of the burst is left to the query, which would otherwise wait for a refill.
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert dispatched == ["cancel_all_orders", "create_orders", "get_orders"]
+        scheduler.stop()
+
+    async def test_batch_calls_do_not_wait_for_in_flight_slots(self):
+        """Test the calls of a batch holding the only in-flight slot run ahead of the envelopes waiting for it."""
+        registry = TaskRegistry(max_in_flight={"lyra": 1})
+        results = []
+
+        async def cancel():
+            return "cancelled"
+
+        def dispatch(envelope, exchange_id, metered):
+            async def handle():
+                if envelope.message.performative.value == "cancel_orders":
+                    results.append(await scheduler.schedule(exchange_id, cancel))
+                if metered:
+                    registry.release(exchange_id)
+
+            asyncio.ensure_future(handle())
+
+        scheduler = RequestScheduler(dispatch=dispatch, registry=registry)
+        for performative in ["cancel_orders", "get_all_balances"]:
+            scheduler.submit(make_envelope(performative), "lyra")
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert results == ["cancelled"]
+        scheduler.stop()
@@ -0,0 +1,49 @@
+"""Test the coalescing of identical requests."""
+import asyncio
+
+import pytest
+
+from packages.eightballer.connections.dcxt.single_flight import SingleFlight, make_key
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    """Test the single flight group."""
+
+    async def test_coalesces_identical_calls(self):
+        """Test concurrent identical calls share one call to the exchange."""
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"ETH": 1.0}
+
+        single_flight = SingleFlight()
+        key = make_key("lyra", "get_all_balances", {"currency": "ETH"})
+        results = await asyncio.gather(*[single_flight.run(key, fetch) for _ in range(5)])
+
+        assert len(calls) == 1
+        assert single_flight.coalesced == 4
+        assert all(result == {"ETH": 1.0} for result in results)
+        assert key not in single_flight
+
+    async def test_distinct_params_are_not_coalesced(self):
+        """Test requests with different params make their own calls."""
+        assert make_key("lyra", "get_all_tickers", {"currency": "ETH"}) != make_key(
+            "lyra", "get_all_tickers", {"currency": "BTC"}
+        )
+
+    async def test_errors_reach_every_caller(self):
+        """Test an exchange error is raised to every waiting caller."""
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise TimeoutError("timeout")
+
+        single_flight = SingleFlight()
+        results = await asyncio.gather(
+            *[single_flight.run("key", fetch) for _ in range(3)],
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, TimeoutError) for result in results)
@@ -0,0 +1,299 @@
+"""Test the order book subscriptions of the dcxt connection."""
+import asyncio
+
+import pytest
+from lyra.enums import Environment
+
+from packages.eightballer.connections.dcxt import subscriptions
+from packages.eightballer.connections.dcxt.dcxt.lyra_v2 import LyraClient
+from packages.eightballer.connections.dcxt.metrics import ConnectionMetrics
+from packages.eightballer.connections.dcxt.order_book_engine import BookOutOfSync
+from packages.eightballer.connections.dcxt.subscriptions import StaleBookError, SubscriptionManager, reconnect_delay
+
+
+class SingleSymbolExchange:
+    """Exchange streaming the book of one symbol per call."""
+
+    def __init__(self):
+        """Initialise the exchange."""
+        self.calls = []
+        self.books = asyncio.Queue()
+
+    async def watch_order_book(self, symbol):
+        """Get the next book of a symbol."""
+        self.calls.append(symbol)
+        book = await self.books.get()
+        if isinstance(book, Exception):
+            raise book
+        return book
+
+
+class MultiSymbolExchange:
+    """Exchange streaming the books of many symbols over one stream."""
+
+    def __init__(self):
+        """Initialise the exchange."""
+        self.calls = []
+        self.unwatched = []
+        self.books = asyncio.Queue()
+
+    async def watch_order_book_for_symbols(self, symbols):
+        """Get the next book of any of the symbols."""
+        self.calls.append(tuple(symbols))
+        return await self.books.get()
+
+    async def un_watch_order_book_for_symbols(self, symbols):
+        """Stop streaming the books of the symbols."""
+        self.unwatched.append(tuple(symbols))
+
+
+class DeltaExchange:
+    """Exchange streaming sequenced deltas, each stream starting with a snapshot."""
+
+    def __init__(self):
+        """Initialise the exchange."""
+        self.streams = 0
+        self.updates = asyncio.Queue()
+
+    async def watch_order_book_deltas(self, symbol):
+        """Stream the updates."""
+        del symbol
+        self.streams += 1
+        while True:
+            yield await self.updates.get()
+
+
+async def next_best_bid(subscription):
+    """Get the best bid of the next update of a subscription."""
+    book = await asyncio.wait_for(subscription.updates().__anext__(), timeout=1)
+    return book.best_bid()
+
+
+@pytest.mark.asyncio
+class TestSubscriptionManager:
+    """Test the subscription manager."""
+
+    def setup_method(self):
+        """Set up the test."""
+        self.manager = SubscriptionManager(max_reconnects=0)
+
+    def teardown_method(self):
+        """Tear down the test."""
+        self.manager.stop()
+
+    async def test_dialogues_share_a_stream(self):
+        """Test subscribers of a symbol share its stream and all receive its updates."""
+        exchange = SingleSymbolExchange()
+        first = self.manager.subscribe("lyra", exchange, "ETH-PERP")
+        second = self.manager.subscribe("lyra", exchange, "ETH-PERP")
+        await exchange.books.put({"bids": [[100, 1]], "asks": [[101, 1]]})
+
+        assert await next_best_bid(first) == (100.0, 1.0)
+        assert await next_best_bid(second) == (100.0, 1.0)
+        assert len(self.manager.feeds) == 1
+
+        self.manager.unsubscribe(first)
+        assert self.manager.feeds
+        self.manager.unsubscribe(second)
+        assert not self.manager.feeds
+
+    async def test_updates_counted_once(self):
+        """Test an update is counted once in the metrics, however many subscribers it reaches."""
+        metrics = self.manager.metrics = ConnectionMetrics()
+        exchange = SingleSymbolExchange()
+        first = self.manager.subscribe("lyra", exchange, "ETH-PERP")
+        second = self.manager.subscribe("lyra", exchange, "ETH-PERP")
+        await exchange.books.put({"bids": [[100, 1]], "asks": [[101, 1]]})
+        await next_best_bid(first)
+        await next_best_bid(second)
+
+        assert metrics.snapshot()["order_book_updates"]["lyra/ETH-PERP"]["total"] == 1
+
+    async def test_late_subscriber_gets_current_book(self):
+        """Test a subscriber joining a running stream starts from its current book."""
+        exchange = SingleSymbolExchange()
+        first = self.manager.subscribe("lyra", exchange, "ETH-PERP")
+        await exchange.books.put({"bids": [[100, 1]], "asks": [[101, 1]]})
+        await next_best_bid(first)
+
+        late = self.manager.subscribe("lyra", exchange, "ETH-PERP")
+
+        assert await next_best_bid(late) == (100.0, 1.0)
+
+    async def test_symbols_multiplexed_over_one_stream(self):
+        """Test the symbols of an exchange are streamed together, fanned out by symbol."""
+        exchange = MultiSymbolExchange()
+        eth = self.manager.subscribe("lyra", exchange, "ETH-PERP")
+        btc = self.manager.subscribe("lyra", exchange, "BTC-PERP")
+        await exchange.books.put({"symbol": "BTC-PERP", "bids": [[60000, 1]], "asks": [[60001, 1]]})
+        await exchange.books.put({"symbol": "ETH-PERP", "bids": [[3000, 1]], "asks": [[3001, 1]]})
+
+        assert await next_best_bid(btc) == (60000.0, 1.0)
+        assert await next_best_bid(eth) == (3000.0, 1.0)
+        assert exchange.calls[-1] == ("BTC-PERP", "ETH-PERP")
+        assert len(self.manager._exchange_tasks) == 1  # pylint: disable=protected-access
+
+        self.manager.unsubscribe(eth)
+        self.manager.unsubscribe(btc)
+        await asyncio.sleep(0)
+        assert exchange.unwatched == [("BTC-PERP",)]
+
+    async def test_stream_failure_ends_subscriptions(self):
+        """Test the subscribers of a failed stream get its error."""
+        exchange = SingleSymbolExchange()
+        subscription = self.manager.subscribe("lyra", exchange, "ETH-PERP")
+        await exchange.books.put(ConnectionError("stream closed"))
+
+        with pytest.raises(ConnectionError):
+            await next_best_bid(subscription)
+        assert not self.manager.feeds
+
+    async def test_unsubscribe_dialogue(self):
+        """Test a dialogue unsubscribing ends its subscription only."""
+        exchange = SingleSymbolExchange()
+        first = self.manager.subscribe("lyra", exchange, "ETH-PERP", key="dialogue-1")
+        self.manager.subscribe("lyra", exchange, "ETH-PERP", key="dialogue-2")
+
+        assert self.manager.unsubscribe_key("dialogue-1")
+        assert not self.manager.unsubscribe_key("dialogue-1")
+        assert [book async for book in first.updates()] == []
+        assert self.manager.feeds
+
+
+def test_reconnect_delay_is_jittered_and_capped():
+    """Test reconnection delays grow exponentially up to the cap, with full jitter."""
+    delays = [reconnect_delay(attempt, base=1, cap=8) for attempt in range(1, 10) for _ in range(20)]
+
+    assert all(0 <= delay <= 8 for delay in delays)
+    assert max(reconnect_delay(1, base=1, cap=8) for _ in range(20)) <= 1
+
+
+@pytest.mark.asyncio
+async def test_stream_reconnects_and_resyncs():
+    """Test a failed stream is reconnected, resyncing its book from the next snapshot."""
+    manager = SubscriptionManager(max_reconnects=3)
+    exchange = SingleSymbolExchange()
+    subscription = manager.subscribe("lyra", exchange, "ETH-PERP")
+    await exchange.books.put({"bids": [[100, 1]], "asks": [[101, 1]]})
+    assert await next_best_bid(subscription) == (100.0, 1.0)
+
+    await exchange.books.put(ConnectionError("connection reset"))
+    await exchange.books.put({"bids": [[99, 1]], "asks": [[101, 1]]})
+
+    assert await next_best_bid(subscription) == (99.0, 1.0)
+    assert manager.reconnects == {"lyra": 1}
+    manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_gap_restarts_stream(monkeypatch):
+    """Test a missed delta is counted, and the stream reconnected to resync from its snapshot."""
+    monkeypatch.setattr(subscriptions, "reconnect_delay", lambda attempt: 0)
+    manager = SubscriptionManager(max_reconnects=1)
+    exchange = DeltaExchange()
+    subscription = manager.subscribe("lyra", exchange, "ETH-PERP")
+    await exchange.updates.put({"snapshot": True, "bids": [[100, 1]], "asks": [[101, 1]], "sequence": 1})
+    assert await next_best_bid(subscription) == (100.0, 1.0)
+
+    await exchange.updates.put({"bids": [[100, 2]], "asks": [], "sequence": 3})
+    await exchange.updates.put({"snapshot": True, "bids": [[99, 1]], "asks": [[101, 1]], "sequence": 7})
+
+    assert await next_best_bid(subscription) == (99.0, 1.0)
+    assert manager.gaps == {"lyra": 1}
+    assert manager.reconnects == {"lyra": 1}
+    assert exchange.streams == 2
+    manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_repeated_gaps_end_subscriptions(monkeypatch):
+    """Test a stream falling out of sync after each snapshot is given up after `max_reconnects` attempts."""
+    monkeypatch.setattr(subscriptions, "reconnect_delay", lambda attempt: 0)
+    manager = SubscriptionManager(max_reconnects=2)
+    exchange = DeltaExchange()
+    subscription = manager.subscribe("lyra", exchange, "ETH-PERP")
+    for sequence in range(0, 9, 3):
+        await exchange.updates.put({"snapshot": True, "bids": [[100, 1]], "asks": [[101, 1]], "sequence": sequence})
+        await exchange.updates.put({"bids": [[100, 2]], "asks": [], "sequence": sequence + 2})
+
+    with pytest.raises(BookOutOfSync):
+        async for _ in subscription.updates():
+            pass
+    assert exchange.streams == 3
+    assert manager.gaps == {"lyra": 3}
+    assert not manager.feeds
+    manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_stale_book_ends_subscriptions():
+    """Test subscribers are told when their book stays silent, however many reconnects are allowed."""
+    manager = SubscriptionManager(stale_after=0.05, max_reconnects=None)
+    exchange = SingleSymbolExchange()
+    subscription = manager.subscribe("lyra", exchange, "ETH-PERP")
+    await exchange.books.put({"bids": [[100, 1]], "asks": [[101, 1]]})
+    assert await next_best_bid(subscription) == (100.0, 1.0)
+
+    with pytest.raises(StaleBookError):
+        await next_best_bid(subscription)
+    assert not manager.reconnects
+    assert not manager.feeds
+    manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_quiet_symbol_of_a_shared_stream_is_not_stale():
+    """Test staleness is judged by stream, a quiet symbol streamed along with a busy one being kept."""
+    manager = SubscriptionManager(stale_after=0.05)
+    exchange = MultiSymbolExchange()
+    quiet = manager.subscribe("lyra", exchange, "ETH-PERP")
+    manager.subscribe("lyra", exchange, "BTC-PERP")
+    for _ in range(6):
+        await exchange.books.put({"symbol": "BTC-PERP", "bids": [[60000, 1]], "asks": [[60001, 1]]})
+        await asyncio.sleep(0.02)
+
+    assert len(manager.feeds) == 2
+    assert not quiet._error  # pylint: disable=protected-access
+    manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_lyra_streams_books_of_many_symbols(monkeypatch):
+    """Test Lyra streams the books of every symbol over one websocket, subscribed to their channels."""
+    client = LyraClient(auth={}, env=Environment.TEST)
+    streams = []
+
+    async def stream(name, on_connect, on_message):
+        del on_connect, on_message
+        streams.append(name)
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(client, "_stream", stream)
+    update = asyncio.ensure_future(client.watch_order_book_for_symbols(["BTC-PERP", "ETH-PERP"]))
+    await asyncio.sleep(0)
+    client._handle_book_message(  # pylint: disable=protected-access
+        {
+            "params": {
+                "channel": "orderbook.ETH-PERP.1.100",
+                "data": {
+                    "instrument_name": "ETH-PERP",
+                    "bids": [["3000", "1.5"]],
+                    "asks": [["3001", "2"]],
+                    "timestamp": 1710000000000,
+                    "publish_id": 7,
+                },
+            }
+        }
+    )
+
+    assert await asyncio.wait_for(update, timeout=1) == {
+        "symbol": "ETH-PERP",
+        "bids": [[3000.0, 1.5]],
+        "asks": [[3001.0, 2.0]],
+        "timestamp": 1710000000000,
+        "nonce": 7,
+    }
+    assert streams == ["order book"]
+    assert client._book_channels == {"orderbook.BTC-PERP.1.100", "orderbook.ETH-PERP.1.100"}  # pylint: disable=W0212
+    await client.un_watch_order_book_for_symbols(["BTC-PERP", "ETH-PERP"])
+    assert client._book_task is None  # pylint: disable=protected-access
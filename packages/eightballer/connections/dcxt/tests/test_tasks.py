@@ -0,0 +1,50 @@
+"""Test the task registry of the dcxt connection."""
+import asyncio
+
+import pytest
+
+from packages.eightballer.connections.dcxt.tasks import TaskRegistry
+
+TEST_PROTOCOL = "eightballer/tickers:0.1.0"
+
+
+@pytest.mark.asyncio
+class TestTaskRegistry:
+    """Test the task registry."""
+
+    async def test_add_and_remove(self):
+        """Test tasks are counted by exchange and protocol."""
+        registry = TaskRegistry()
+        tasks = [asyncio.ensure_future(asyncio.sleep(0)) for _ in range(3)]
+        for task in tasks:
+            registry.add(task, "lyra", TEST_PROTOCOL)
+        assert len(registry) == 3
+        assert registry.in_flight == {"lyra": {TEST_PROTOCOL: 3}}
+
+        for task in tasks:
+            assert registry.remove(task) == ("lyra", TEST_PROTOCOL)
+        assert registry.remove(tasks[0]) is None
+        assert not registry.in_flight
+        await asyncio.gather(*tasks)
+
+    async def test_limits_in_flight_per_exchange(self):
+        """Test a saturated exchange does not hold up the others."""
+        registry = TaskRegistry(max_in_flight={"balancer": 1})
+        release = asyncio.Event()
+
+        async def hold(exchange_id):
+            async with registry.slot(exchange_id):
+                await release.wait()
+
+        first = asyncio.ensure_future(hold("balancer"))
+        second = asyncio.ensure_future(hold("balancer"))
+        other = asyncio.ensure_future(hold("lyra"))
+        await asyncio.sleep(0)
+
+        assert registry.running("balancer") == 1
+        assert registry.running("lyra") == 1
+        assert registry.saturated_exchanges == ["balancer"]
+
+        release.set()
+        await asyncio.gather(first, second, other)
+        assert registry.running("balancer") == 0
@@ -0,0 +1,68 @@
+"""Test the columnar tickers of the dcxt connection."""
+from packages.eightballer.connections.dcxt.recorder import MarketDataReader, MarketDataRecorder, RecordKind
+from packages.eightballer.connections.dcxt.ticker_columns import TickerColumns
+
+
+class TestTickerColumns:
+    """Test the columnar tickers."""
+
+    def setup_method(self):
+        """Set up the test."""
+        self.tickers = TickerColumns(
+            ["ETH-PERP", "BTC-PERP"],
+            [1000, 2000],
+            [
+                (
+                    "3582.35",
+                    "19.53",
+                    "3584.14",
+                    "19.53",
+                    "3584.45",
+                    "3582.84",
+                    "3673.83",
+                    "3530.19",
+                    "33.45",
+                    "0.00942",
+                    "550.16",
+                ),
+                ("65000", "1", "65010", "2", "65005", "65004", "66000", "64000", "-10", "-0.001", "12.5"),
+            ],
+        )
+
+    def test_columns(self):
+        """Test fields are read for every instrument at once."""
+        assert self.tickers.column("bid").tolist() == [3582.35, 65000.0]
+        assert self.tickers.column("index").tolist() == [3582.84, 65004.0]
+
+    def test_tickers_are_built_on_demand(self):
+        """Test tickers are only built when read, once."""
+        ticker = self.tickers.get("BTC-PERP")
+
+        assert (ticker.symbol, ticker.timestamp, ticker.bid, ticker.close) == ("BTC-PERP", 2000, 65000.0, 65005.0)
+        assert (ticker.markPrice, ticker.indexPrice) == (65005.0, 65004.0)
+        assert self.tickers[1] is ticker
+        assert self.tickers._tickers[0] is None  # pylint: disable=protected-access
+        assert [ticker.symbol for ticker in self.tickers] == ["ETH-PERP", "BTC-PERP"]
+        assert self.tickers.get("SOL-PERP") is None
+
+    def test_empty(self):
+        """Test an empty response."""
+        tickers = TickerColumns([], [], [])
+
+        assert not list(tickers)
+        assert tickers.column("ask").shape == (0,)
+
+    def test_recorded_from_columns(self, tmp_path):
+        """Test the columns are recorded without building the tickers."""
+        recorder = MarketDataRecorder(str(tmp_path))
+        recorder.start()
+        recorder.record_tickers("lyra", self.tickers)
+        recorder.stop()
+
+        records = list(MarketDataReader(str(tmp_path)).read(RecordKind.TICKER))
+
+        assert [(record["symbol"], record["bid"], record["last"]) for record in records] == [
+            ("ETH-PERP", 3582.35, 3584.45),
+            ("BTC-PERP", 65000.0, 65005.0),
+        ]
+        assert self.tickers._tickers == [None, None]  # pylint: disable=protected-access
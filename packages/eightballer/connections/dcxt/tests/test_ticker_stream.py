@@ -0,0 +1,58 @@
+"""Test the ticker tables of the dcxt connection."""
+import asyncio
+
+import pytest
+
+from packages.eightballer.connections.dcxt.ticker_stream import TickerTable
+
+
+def ticker(symbol, bid, ask=101.0, timestamp=1):
+    """Make a ticker."""
+    return {"symbol": symbol, "bid": bid, "bidVolume": 1.0, "ask": ask, "askVolume": 1.0, "timestamp": timestamp}
+
+
+async def next_update(subscription):
+    """Get the next tickers pushed to a subscription."""
+    return await asyncio.wait_for(subscription.updates().__anext__(), timeout=1)
+
+
+@pytest.mark.asyncio
+class TestTickerTable:
+    """Test the ticker table."""
+
+    def setup_method(self):
+        """Set up the test."""
+        self.table = TickerTable()
+
+    async def test_pushes_changed_tickers(self):
+        """Test only the tickers whose quotes changed are pushed, conflated by symbol."""
+        subscription = self.table.subscribe()
+        assert self.table.update(ticker("ETH-PERP", 100.0))
+        assert not self.table.update(ticker("ETH-PERP", 100.0, timestamp=2))
+        assert self.table.tickers["ETH-PERP"]["timestamp"] == 2
+        self.table.update(ticker("ETH-PERP", 100.5))
+        self.table.update(ticker("BTC-PERP", 65000.0))
+
+        update = await next_update(subscription)
+
+        assert [(item["symbol"], item["bid"]) for item in update] == [("ETH-PERP", 100.5), ("BTC-PERP", 65000.0)]
+
+    async def test_subscribers_filter_symbols(self):
+        """Test subscribers only get their symbols, starting from the tickers already held."""
+        self.table.update(ticker("ETH-PERP", 100.0))
+        subscription = self.table.subscribe(["ETH-PERP"], key="dialogue-1")
+        self.table.update(ticker("BTC-PERP", 65000.0))
+
+        assert [item["symbol"] for item in await next_update(subscription)] == ["ETH-PERP"]
+
+        assert self.table.unsubscribe_key("dialogue-1")
+        assert not self.table.subscribers
+        assert [update async for update in subscription.updates()] == []
+
+    async def test_fail(self):
+        """Test subscribers get the error of the stream."""
+        subscription = self.table.subscribe()
+        self.table.fail(ConnectionError("stream closed"))
+
+        with pytest.raises(ConnectionError):
+            await next_update(subscription)
@@ -0,0 +1,96 @@
+"""
+Tickers of many instruments held as NumPy columns, parsed in one pass over an exchange response.
+"""
+from typing import Dict, Iterator, List, Optional, Sequence, Union, overload
+
+import numpy as np
+
+from packages.eightballer.protocols.tickers.custom_types import Ticker
+
+COLUMNS = (
+    "bid",
+    "bidVolume",
+    "ask",
+    "askVolume",
+    "mark",
+    "index",
+    "high",
+    "low",
+    "change",
+    "percentage",
+    "baseVolume",
+)
+COLUMN_INDEX = {name: position for position, name in enumerate(COLUMNS)}
+
+
+class TickerColumns(Sequence[Ticker]):
+    """
+    The tickers of a set of instruments, one row per instrument and one column per field.
+
+    Every value is parsed once, as the whole response is converted to a float array,
+    and columns are read without building any ticker. The tickers themselves are only
+    built when indexed or iterated, and cached, so the tickers of a full options chain
+    cost nothing until a consumer reads them.
+    """
+
+    def __init__(self, symbols: List[str], timestamps: Sequence[int], rows: Sequence[Sequence[Union[str, float]]]):
+        """Initialise the columns, from the values of every instrument ordered as `COLUMNS`."""
+        self.symbols = symbols
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        self.values = np.array(rows, dtype=np.float64).reshape(len(symbols), len(COLUMNS))
+        self.positions: Dict[str, int] = {symbol: position for position, symbol in enumerate(symbols)}
+        self._tickers: List[Optional[Ticker]] = [None] * len(symbols)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @overload
+    def __getitem__(self, position: int) -> Ticker:
+        ...
+
+    @overload
+    def __getitem__(self, position: slice) -> List[Ticker]:
+        ...
+
+    def __getitem__(self, position):
+        """Get the ticker of an instrument, by position."""
+        if isinstance(position, slice):
+            return [self[index] for index in range(*position.indices(len(self)))]
+        ticker = self._tickers[position]
+        if ticker is None:
+            ticker = self._tickers[position] = self._build(position)
+        return ticker
+
+    def __iter__(self) -> Iterator[Ticker]:
+        return (self[position] for position in range(len(self)))
+
+    def column(self, name: str) -> np.ndarray:
+        """Get the values of a field for every instrument, i.e. `bid`."""
+        return self.values[:, COLUMN_INDEX[name]]
+
+    def get(self, symbol: str) -> Optional[Ticker]:
+        """Get the ticker of an instrument, by symbol."""
+        position = self.positions.get(symbol)
+        return None if position is None else self[position]
+
+    def _build(self, position: int) -> Ticker:
+        values = dict(zip(COLUMNS, self.values[position].tolist()))
+        timestamp = int(self.timestamps[position])
+        return Ticker(
+            symbol=self.symbols[position],
+            timestamp=timestamp,
+            datetime=timestamp,
+            high=values["high"],
+            low=values["low"],
+            bid=values["bid"],
+            bidVolume=values["bidVolume"],
+            ask=values["ask"],
+            askVolume=values["askVolume"],
+            close=values["mark"],
+            last=values["mark"],
+            change=values["change"],
+            percentage=values["percentage"],
+            baseVolume=values["baseVolume"],
+            markPrice=values["mark"],
+            indexPrice=values["index"],
+        )
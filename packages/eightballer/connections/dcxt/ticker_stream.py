@@ -0,0 +1,39 @@
+"""
+Tables of the latest tickers streamed from an exchange, pushing the tickers which changed to their subscribers.
+"""
+from typing import Any, Dict, Tuple
+
+from packages.eightballer.connections.dcxt.order_book_engine import get_field
+from packages.eightballer.connections.dcxt.symbol_table import SymbolTable
+
+QUOTE_FIELDS = ("bid", "bidVolume", "ask", "askVolume", "last")
+
+
+class TickerTable(SymbolTable):
+    """
+    The latest ticker of every symbol streamed from an exchange.
+
+    A ticker is only pushed to the subscribers when its quotes, i.e. its best prices,
+    sizes or last price, changed. New subscribers start from the tickers already held.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the table."""
+        super().__init__()
+        self._quotes: Dict[str, Tuple[Any, ...]] = {}
+
+    @property
+    def tickers(self) -> Dict[str, Any]:
+        """Get the latest ticker of every symbol."""
+        return self.items
+
+    def update(self, ticker: Any) -> bool:
+        """Store a ticker, returning whether its quotes changed."""
+        symbol = get_field(ticker, "symbol")
+        quote = tuple(get_field(ticker, name) for name in QUOTE_FIELDS)
+        if self._quotes.get(symbol) == quote:
+            self.items[symbol] = ticker
+            return False
+        self._quotes[symbol] = quote
+        self.publish(ticker)
+        return True
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+This module contains the support resources for the order_book protocol.
+
+It was created with protocol buffer compiler version `libprotoc 3.21.12` and aea protocol generator version `1.0.0`.
+"""
+
+from packages.eightballer.protocols.order_book.message import OrderBookMessage
+from packages.eightballer.protocols.order_book.serialization import OrderBookSerializer
+
+
+OrderBookMessage.serializer = OrderBookSerializer
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains class representations corresponding to every custom type in the protocol specification."""
+
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class OrderBook:
+    """This class represents an instance of OrderBook, its levels as [price, size] pairs, best first."""
+
+    exchange_id: str
+    symbol: str
+    bids: List[List[float]] = field(default_factory=list)
+    asks: List[List[float]] = field(default_factory=list)
+    timestamp: Optional[int] = None
+    datetime: Optional[str] = None
+    nonce: Optional[int] = None
+
+    @staticmethod
+    def encode(order_book_protobuf_object, order_book_object: "OrderBook") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the order_book_protobuf_object argument is matched with the instance of this
+        class in the 'order_book_object' argument.
+
+        :param order_book_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param order_book_object: an instance of this class to be encoded in the protocol buffer object.
+        """
+        order_book_protobuf_object.exchange_id = order_book_object.exchange_id
+        order_book_protobuf_object.symbol = order_book_object.symbol
+        for price, size in order_book_object.bids:
+            order_book_protobuf_object.bids.add(price=price, size=size)
+        for price, size in order_book_object.asks:
+            order_book_protobuf_object.asks.add(price=price, size=size)
+        if order_book_object.timestamp is not None:
+            order_book_protobuf_object.timestamp = int(order_book_object.timestamp)
+        if order_book_object.datetime is not None:
+            order_book_protobuf_object.datetime = str(order_book_object.datetime)
+        if order_book_object.nonce is not None:
+            order_book_protobuf_object.nonce = int(order_book_object.nonce)
+
+    @classmethod
+    def decode(cls, order_book_protobuf_object) -> "OrderBook":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the
+        'order_book_protobuf_object' argument.
+
+        :param order_book_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the
+        'order_book_protobuf_object' argument.
+        """
+        return cls(
+            exchange_id=order_book_protobuf_object.exchange_id,
+            symbol=order_book_protobuf_object.symbol,
+            bids=[[level.price, level.size] for level in order_book_protobuf_object.bids],
+            asks=[[level.price, level.size] for level in order_book_protobuf_object.asks],
+            timestamp=_optional(order_book_protobuf_object, "timestamp"),
+            datetime=_optional(order_book_protobuf_object, "datetime"),
+            nonce=_optional(order_book_protobuf_object, "nonce"),
+        )
+
+
+def _optional(protobuf_object, name: str):
+    """Get an optional field of a protocol buffer object, or None if it is not set."""
+    return getattr(protobuf_object, name) if protobuf_object.HasField(name) else None
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: order_book.proto
+"""Generated protocol buffer code."""
+
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
+    b'\n\x10order_book.proto\x12!aea.eightballer.order_book.v0_1_0"\xf7\x0c\n\x10OrderBookMessage\x12W\n\x05\x65rror\x18\x05 \x01(\x0b\x32\x46.aea.eightballer.order_book.v0_1_0.OrderBookMessage.Error_PerformativeH\x00\x12k\n\x0forder_book_diff\x18\x06 \x01(\x0b\x32P.aea.eightballer.order_book.v0_1_0.OrderBookMessage.Order_Book_Diff_PerformativeH\x00\x12o\n\x11order_book_update\x18\x07 \x01(\x0b\x32R.aea.eightballer.order_book.v0_1_0.OrderBookMessage.Order_Book_Update_PerformativeH\x00\x12_\n\tsubscribe\x18\x08 \x01(\x0b\x32J.aea.eightballer.order_book.v0_1_0.OrderBookMessage.Subscribe_PerformativeH\x00\x12\x63\n\x0bunsubscribe\x18\t \x01(\x0b\x32L.aea.eightballer.order_book.v0_1_0.OrderBookMessage.Unsubscribe_PerformativeH\x00\x12\x65\n\x0cunsubscribed\x18\n \x01(\x0b\x32M.aea.eightballer.order_book.v0_1_0.OrderBookMessage.Unsubscribed_PerformativeH\x00\x1a\xe4\x02\n\tOrderBook\x12\x13\n\x0b\x65xchange_id\x18\x01 \x01(\t\x12\x0e\n\x06symbol\x18\x02 \x01(\t\x12Q\n\x04\x62ids\x18\x03 \x03(\x0b\x32\x43.aea.eightballer.order_book.v0_1_0.OrderBookMessage.OrderBook.Level\x12Q\n\x04\x61sks\x18\x04 \x03(\x0b\x32\x43.aea.eightballer.order_book.v0_1_0.OrderBookMessage.OrderBook.Level\x12\x16\n\ttimestamp\x18\x05 \x01(\x03H\x00\x88\x01\x01\x12\x15\n\x08\x64\x61tetime\x18\x06 \x01(\tH\x01\x88\x01\x01\x12\x12\n\x05nonce\x18\x07 \x01(\x03H\x02\x88\x01\x01\x1a$\n\x05Level\x12\r\n\x05price\x18\x01 \x01(\x01\x12\x0c\n\x04size\x18\x02 \x01(\x01\x42\x0c\n\n_timestampB\x0b\n\t_datetimeB\x08\n\x06_nonce\x1a\xeb\x01\n\x16Subscribe_Performative\x12\x13\n\x0b\x65xchange_id\x18\x01 \x01(\t\x12\x0e\n\x06symbol\x18\x02 \x01(\t\x12\x66\n\x06params\x18\x03 \x03(\x0b\x32V.aea.eightballer.order_book.v0_1_0.OrderBookMessage.Subscribe_Performative.ParamsEntry\x12\x15\n\rparams_is_set\x18\x04 \x01(\x08\x1a-\n\x0bParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a?\n\x18Unsubscribe_Performative\x12\x13\n\x0b\x65xchange_id\x18\x01 \x01(\t\x12\x0e\n\x06symbol\x18\x02 \x01(\t\x1as\n\x1eOrder_Book_Update_Performative\x12Q\n\norder_book\x18\x01 \x01(\x0b\x32=.aea.eightballer.order_book.v0_1_0.OrderBookMessage.OrderBook\x1a\x83\x01\n\x1cOrder_Book_Diff_Performative\x12Q\n\norder_book\x18\x01 \x01(\x0b\x32=.aea.eightballer.order_book.v0_1_0.OrderBookMessage.OrderBook\x12\x10\n\x08sequence\x18\x02 \x01(\x05\x1a\x41\n\x12\x45rror_Performative\x12\x11\n\terror_msg\x18\x01 \x01(\t\x12\x18\n\x10\x65rror_msg_is_set\x18\x02 \x01(\x08\x1a\x1b\n\x19Unsubscribed_PerformativeB\x0e\n\x0cperformativeb\x06proto3'
+)
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, "order_book_pb2", globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+    DESCRIPTOR._options = None
+    _ORDERBOOKMESSAGE_SUBSCRIBE_PERFORMATIVE_PARAMSENTRY._options = None
+    _ORDERBOOKMESSAGE_SUBSCRIBE_PERFORMATIVE_PARAMSENTRY._serialized_options = b"8\001"
+    _ORDERBOOKMESSAGE._serialized_start = 56
+    _ORDERBOOKMESSAGE._serialized_end = 1711
+    _ORDERBOOKMESSAGE_ORDERBOOK._serialized_start = 689
+    _ORDERBOOKMESSAGE_ORDERBOOK._serialized_end = 1045
+    _ORDERBOOKMESSAGE_ORDERBOOK_LEVEL._serialized_start = 972
+    _ORDERBOOKMESSAGE_ORDERBOOK_LEVEL._serialized_end = 1008
+    _ORDERBOOKMESSAGE_SUBSCRIBE_PERFORMATIVE._serialized_start = 1048
+    _ORDERBOOKMESSAGE_SUBSCRIBE_PERFORMATIVE._serialized_end = 1283
+    _ORDERBOOKMESSAGE_SUBSCRIBE_PERFORMATIVE_PARAMSENTRY._serialized_start = 1238
+    _ORDERBOOKMESSAGE_SUBSCRIBE_PERFORMATIVE_PARAMSENTRY._serialized_end = 1283
+    _ORDERBOOKMESSAGE_UNSUBSCRIBE_PERFORMATIVE._serialized_start = 1285
+    _ORDERBOOKMESSAGE_UNSUBSCRIBE_PERFORMATIVE._serialized_end = 1348
+    _ORDERBOOKMESSAGE_ORDER_BOOK_UPDATE_PERFORMATIVE._serialized_start = 1350
+    _ORDERBOOKMESSAGE_ORDER_BOOK_UPDATE_PERFORMATIVE._serialized_end = 1465
+    _ORDERBOOKMESSAGE_ORDER_BOOK_DIFF_PERFORMATIVE._serialized_start = 1468
+    _ORDERBOOKMESSAGE_ORDER_BOOK_DIFF_PERFORMATIVE._serialized_end = 1599
+    _ORDERBOOKMESSAGE_ERROR_PERFORMATIVE._serialized_start = 1601
+    _ORDERBOOKMESSAGE_ERROR_PERFORMATIVE._serialized_end = 1666
+    _ORDERBOOKMESSAGE_UNSUBSCRIBED_PERFORMATIVE._serialized_start = 1668
+    _ORDERBOOKMESSAGE_UNSUBSCRIBED_PERFORMATIVE._serialized_end = 1695
+# @@protoc_insertion_point(module_scope)
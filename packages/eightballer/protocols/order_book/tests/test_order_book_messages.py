@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test messages module for order_book protocol."""
+
+# pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
+from typing import List
+
+from aea.test_tools.test_protocol import BaseProtocolMessagesTestCase
+
+from packages.eightballer.protocols.order_book.custom_types import OrderBook
+from packages.eightballer.protocols.order_book.message import OrderBookMessage
+
+ORDER_BOOK = OrderBook(
+    exchange_id="lyra",
+    symbol="ETH-PERP",
+    bids=[[99.5, 3.0], [99.0, 2.0]],
+    asks=[[100.5, 1.0]],
+    timestamp=1710755194000,
+    datetime="2024-03-18T09:46:34",
+    nonce=12,
+)
+
+
+class TestMessageOrderBook(BaseProtocolMessagesTestCase):
+    """Test for the 'order_book' protocol message."""
+
+    MESSAGE_CLASS = OrderBookMessage
+
+    def build_messages(self) -> List[OrderBookMessage]:  # type: ignore[override]
+        """Build the messages to be used for testing."""
+        return [
+            OrderBookMessage(
+                performative=OrderBookMessage.Performative.SUBSCRIBE,
+                exchange_id="some str",
+                symbol="some str",
+                params={"some str": b"some_bytes"},
+            ),
+            OrderBookMessage(
+                performative=OrderBookMessage.Performative.UNSUBSCRIBE,
+                exchange_id="some str",
+                symbol="some str",
+            ),
+            OrderBookMessage(
+                performative=OrderBookMessage.Performative.ORDER_BOOK_UPDATE,
+                order_book=ORDER_BOOK,
+            ),
+            OrderBookMessage(
+                performative=OrderBookMessage.Performative.ORDER_BOOK_DIFF,
+                order_book=OrderBook(exchange_id="lyra", symbol="ETH-PERP", bids=[[99.5, 0.0]], asks=[], nonce=13),
+                sequence=12,
+            ),
+            OrderBookMessage(
+                performative=OrderBookMessage.Performative.ERROR,
+                error_msg="some str",
+            ),
+            OrderBookMessage(
+                performative=OrderBookMessage.Performative.UNSUBSCRIBED,
+            ),
+        ]
+
+    def build_inconsistent(self) -> List[OrderBookMessage]:  # type: ignore[override]
+        """Build inconsistent messages to be used for testing."""
+        return [
+            OrderBookMessage(
+                performative=OrderBookMessage.Performative.SUBSCRIBE,
+                # skip content: exchange_id
+                symbol="some str",
+                params={"some str": b"some_bytes"},
+            ),
+            OrderBookMessage(
+                performative=OrderBookMessage.Performative.UNSUBSCRIBE,
+                # skip content: exchange_id
+                symbol="some str",
+            ),
+            OrderBookMessage(
+                performative=OrderBookMessage.Performative.ORDER_BOOK_UPDATE,
+                # skip content: order_book
+            ),
+            OrderBookMessage(
+                performative=OrderBookMessage.Performative.ORDER_BOOK_DIFF,
+                # skip content: order_book
+                sequence=12,
+            ),
+        ]
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains class representations corresponding to every custom type in the protocol specification."""
+
+import json
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Optional, Sequence
+
+STRING_FIELDS = ("id", "exchange_id", "client_order_id", "datetime", "symbol", "time_in_force")
+FLOAT_FIELDS = (
+    "timestamp",
+    "last_trade_timestamp",
+    "price",
+    "stop_price",
+    "trigger_price",
+    "cost",
+    "amount",
+    "filled",
+    "remaining",
+    "fee",
+    "average",
+    "last_update_timestamp",
+    "take_profit_price",
+    "stop_loss_price",
+)
+BOOL_FIELDS = ("post_only", "reduce_only")
+# the trades and fees of an order are lists of ccxt structures, carried as json.
+JSON_FIELDS = ("trades", "fees")
+
+
+class ErrorCode(Enum):
+    """This class represents an instance of ErrorCode."""
+
+    UNSUPPORTED_PROTOCOL = 0
+    DECODING_ERROR = 1
+    INVALID_MESSAGE = 2
+    UNSUPPORTED_SKILL = 3
+    INVALID_DIALOGUE = 4
+
+    @staticmethod
+    def encode(error_code_protobuf_object, error_code_object: "ErrorCode") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the error_code_protobuf_object argument is matched with the instance of this
+        class in the 'error_code_object' argument.
+
+        :param error_code_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param error_code_object: an instance of this class to be encoded in the protocol buffer object.
+        """
+        error_code_protobuf_object.error_code = error_code_object.value
+
+    @classmethod
+    def decode(cls, error_code_protobuf_object) -> "ErrorCode":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the
+        'error_code_protobuf_object' argument.
+
+        :param error_code_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the
+        'error_code_protobuf_object' argument.
+        """
+        return ErrorCode(error_code_protobuf_object.error_code)
+
+
+class OrderStatus(Enum):
+    """This class represents an instance of OrderStatus."""
+
+    OPEN = 0
+    FILLED = 1
+    CANCELLED = 2
+    CLOSED = 3
+    FAILED = 4
+    EXPIRED = 5
+
+
+class OrderSide(Enum):
+    """This class represents an instance of OrderSide."""
+
+    BUY = 0
+    SELL = 1
+
+
+class OrderType(Enum):
+    """This class represents an instance of OrderType."""
+
+    LIMIT = 0
+    MARKET = 1
+
+
+ENUM_FIELDS = {"status": OrderStatus, "side": OrderSide, "type": OrderType}
+
+
+@dataclass
+class Order:  # pylint: disable=too-many-instance-attributes
+    """
+    This class represents an instance of Order, named as the fields of a ccxt order in snake case.
+
+    The status, side and type may also be given by the names of their members, i.e. "OPEN".
+    """
+
+    id: Optional[str] = None
+    exchange_id: Optional[str] = None
+    client_order_id: Optional[str] = None
+    timestamp: Optional[float] = None
+    datetime: Optional[str] = None
+    last_trade_timestamp: Optional[float] = None
+    status: Optional[OrderStatus] = None
+    symbol: Optional[str] = None
+    type: Optional[OrderType] = None
+    time_in_force: Optional[str] = None
+    post_only: Optional[bool] = None
+    side: Optional[OrderSide] = None
+    price: Optional[float] = None
+    stop_price: Optional[float] = None
+    trigger_price: Optional[float] = None
+    cost: Optional[float] = None
+    amount: Optional[float] = None
+    filled: Optional[float] = None
+    remaining: Optional[float] = None
+    fee: Optional[float] = None
+    average: Optional[float] = None
+    trades: Optional[Any] = None
+    fees: Optional[Any] = None
+    last_update_timestamp: Optional[float] = None
+    reduce_only: Optional[bool] = None
+    take_profit_price: Optional[float] = None
+    stop_loss_price: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        """Convert the members of the enums given by name."""
+        for name, enum in ENUM_FIELDS.items():
+            value = getattr(self, name)
+            if isinstance(value, str):
+                setattr(self, name, enum[value.upper()])
+
+    @staticmethod
+    def encode(order_protobuf_object, order_object: "Order") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the order_protobuf_object argument is matched with the instance of this
+        class in the 'order_object' argument.
+
+        :param order_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param order_object: an instance of this class to be encoded in the protocol buffer object.
+        """
+        for name in STRING_FIELDS:
+            value = getattr(order_object, name)
+            if value is not None:
+                setattr(order_protobuf_object, name, value.isoformat() if hasattr(value, "isoformat") else str(value))
+        for name in FLOAT_FIELDS:
+            value = getattr(order_object, name)
+            # the fee of a ccxt order is a structure, of which only the cost is carried.
+            if isinstance(value, dict):
+                value = value.get("cost")
+            if value is not None:
+                setattr(order_protobuf_object, name, float(value))
+        for name in BOOL_FIELDS:
+            value = getattr(order_object, name)
+            if value is not None:
+                setattr(order_protobuf_object, name, bool(value))
+        for name in ENUM_FIELDS:
+            value = getattr(order_object, name)
+            if value is not None:
+                setattr(order_protobuf_object, name, value.value)
+        for name in JSON_FIELDS:
+            value = getattr(order_object, name)
+            if value is not None:
+                setattr(order_protobuf_object, name, value if isinstance(value, str) else json.dumps(value))
+
+    @classmethod
+    def decode(cls, order_protobuf_object) -> "Order":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the
+        'order_protobuf_object' argument.
+
+        :param order_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the
+        'order_protobuf_object' argument.
+        """
+        kwargs = {
+            name: _optional(order_protobuf_object, name) for name in (*STRING_FIELDS, *FLOAT_FIELDS, *BOOL_FIELDS)
+        }
+        for name, enum in ENUM_FIELDS.items():
+            value = _optional(order_protobuf_object, name)
+            kwargs[name] = None if value is None else enum(value)
+        for name in JSON_FIELDS:
+            value = _optional(order_protobuf_object, name)
+            kwargs[name] = None if value is None else json.loads(value)
+        return cls(**kwargs)
+
+
+@dataclass
+class Orders:
+    """This class represents an instance of Orders."""
+
+    orders: Sequence[Order] = field(default_factory=list)
+
+    @staticmethod
+    def encode(orders_protobuf_object, orders_object: "Orders") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the orders_protobuf_object argument is matched with the instance of this
+        class in the 'orders_object' argument.
+
+        :param orders_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param orders_object: an instance of this class to be encoded in the protocol buffer object.
+        """
+        for order in orders_object.orders:
+            Order.encode(orders_protobuf_object.orders.add(), order)
+
+    @classmethod
+    def decode(cls, orders_protobuf_object) -> "Orders":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the
+        'orders_protobuf_object' argument.
+
+        :param orders_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the
+        'orders_protobuf_object' argument.
+        """
+        return cls(orders=[Order.decode(order) for order in orders_protobuf_object.orders])
+
+
+def _optional(protobuf_object, name: str):
+    """Get an optional field of a protocol buffer object, or None if it is not set."""
+    return getattr(protobuf_object, name) if protobuf_object.HasField(name) else None
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: orders.proto
+"""Generated protocol buffer code."""
+
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
+    b'\n\x0corders.proto\x12\x1d\x61\x65\x61.eightballer.orders.v0_1_0"\x86*\n\rOrdersMessage\x12h\n\x11\x63\x61ncel_all_orders\x18\x05 \x01(\x0b\x32K.aea.eightballer.orders.v0_1_0.OrdersMessage.Cancel_All_Orders_PerformativeH\x00\x12^\n\x0c\x63\x61ncel_order\x18\x06 \x01(\x0b\x32\x46.aea.eightballer.orders.v0_1_0.OrdersMessage.Cancel_Order_PerformativeH\x00\x12`\n\rcancel_orders\x18\x07 \x01(\x0b\x32G.aea.eightballer.orders.v0_1_0.OrdersMessage.Cancel_Orders_PerformativeH\x00\x12^\n\x0c\x63reate_order\x18\x08 \x01(\x0b\x32\x46.aea.eightballer.orders.v0_1_0.OrdersMessage.Create_Order_PerformativeH\x00\x12`\n\rcreate_orders\x18\t \x01(\x0b\x32G.aea.eightballer.orders.v0_1_0.OrdersMessage.Create_Orders_PerformativeH\x00\x12P\n\x05\x65rror\x18\n \x01(\x0b\x32?.aea.eightballer.orders.v0_1_0.OrdersMessage.Error_PerformativeH\x00\x12X\n\tget_order\x18\x0b \x01(\x0b\x32\x43.aea.eightballer.orders.v0_1_0.OrdersMessage.Get_Order_PerformativeH\x00\x12Z\n\nget_orders\x18\x0c \x01(\x0b\x32\x44.aea.eightballer.orders.v0_1_0.OrdersMessage.Get_Orders_PerformativeH\x00\x12\x64\n\x0fget_settlements\x18\r \x01(\x0b\x32I.aea.eightballer.orders.v0_1_0.OrdersMessage.Get_Settlements_PerformativeH\x00\x12P\n\x05order\x18\x0e \x01(\x0b\x32?.aea.eightballer.orders.v0_1_0.OrdersMessage.Order_PerformativeH\x00\x12\x64\n\x0forder_cancelled\x18\x0f \x01(\x0b\x32I.aea.eightballer.orders.v0_1_0.OrdersMessage.Order_Cancelled_PerformativeH\x00\x12`\n\rorder_created\x18\x10 \x01(\x0b\x32G.aea.eightballer.orders.v0_1_0.OrdersMessage.Order_Created_PerformativeH\x00\x12R\n\x06orders\x18\x11 \x01(\x0b\x32@.aea.eightballer.orders.v0_1_0.OrdersMessage.Orders_PerformativeH\x00\x12\x66\n\x10orders_cancelled\x18\x12 \x01(\x0b\x32J.aea.eightballer.orders.v0_1_0.OrdersMessage.Orders_Cancelled_PerformativeH\x00\x12\x62\n\x0eorders_created\x18\x13 \x01(\x0b\x32H.aea.eightballer.orders.v0_1_0.OrdersMessage.Orders_Created_PerformativeH\x00\x1a\xe6\x01\n\tErrorCode\x12X\n\nerror_code\x18\x01 \x01(\x0e\x32\x44.aea.eightballer.orders.v0_1_0.OrdersMessage.ErrorCode.ErrorCodeEnum"\x7f\n\rErrorCodeEnum\x12\x18\n\x14UNSUPPORTED_PROTOCOL\x10\x00\x12\x12\n\x0e\x44\x45\x43ODING_ERROR\x10\x01\x12\x13\n\x0fINVALID_MESSAGE\x10\x02\x12\x15\n\x11UNSUPPORTED_SKILL\x10\x03\x12\x14\n\x10INVALID_DIALOGUE\x10\x04\x1a\xe4\n\n\x05Order\x12\x0f\n\x02id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x65xchange_id\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x1c\n\x0f\x63lient_order_id\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x16\n\ttimestamp\x18\x04 \x01(\x01H\x03\x88\x01\x01\x12\x15\n\x08\x64\x61tetime\x18\x05 \x01(\tH\x04\x88\x01\x01\x12!\n\x14last_trade_timestamp\x18\x06 \x01(\x01H\x05\x88\x01\x01\x12S\n\x06status\x18\x07 \x01(\x0e\x32>.aea.eightballer.orders.v0_1_0.OrdersMessage.Order.OrderStatusH\x06\x88\x01\x01\x12\x13\n\x06symbol\x18\x08 \x01(\tH\x07\x88\x01\x01\x12O\n\x04type\x18\t \x01(\x0e\x32<.aea.eightballer.orders.v0_1_0.OrdersMessage.Order.OrderTypeH\x08\x88\x01\x01\x12\x1a\n\rtime_in_force\x18\n \x01(\tH\t\x88\x01\x01\x12\x16\n\tpost_only\x18\x0b \x01(\x08H\n\x88\x01\x01\x12O\n\x04side\x18\x0c \x01(\x0e\x32<.aea.eightballer.orders.v0_1_0.OrdersMessage.Order.OrderSideH\x0b\x88\x01\x01\x12\x12\n\x05price\x18\r \x01(\x01H\x0c\x88\x01\x01\x12\x17\n\nstop_price\x18\x0e \x01(\x01H\r\x88\x01\x01\x12\x1a\n\rtrigger_price\x18\x0f \x01(\x01H\x0e\x88\x01\x01\x12\x11\n\x04\x63ost\x18\x10 \x01(\x01H\x0f\x88\x01\x01\x12\x13\n\x06\x61mount\x18\x11 \x01(\x01H\x10\x88\x01\x01\x12\x13\n\x06\x66illed\x18\x12 \x01(\x01H\x11\x88\x01\x01\x12\x16\n\tremaining\x18\x13 \x01(\x01H\x12\x88\x01\x01\x12\x10\n\x03\x66\x65\x65\x18\x14 \x01(\x01H\x13\x88\x01\x01\x12\x14\n\x07\x61verage\x18\x15 \x01(\x01H\x14\x88\x01\x01\x12\x13\n\x06trades\x18\x16 \x01(\tH\x15\x88\x01\x01\x12\x11\n\x04\x66\x65\x65s\x18\x17 \x01(\tH\x16\x88\x01\x01\x12"\n\x15last_update_timestamp\x18\x18 \x01(\x01H\x17\x88\x01\x01\x12\x18\n\x0breduce_only\x18\x19 \x01(\x08H\x18\x88\x01\x01\x12\x1e\n\x11take_profit_price\x18\x1a \x01(\x01H\x19\x88\x01\x01\x12\x1c\n\x0fstop_loss_price\x18\x1b \x01(\x01H\x1a\x88\x01\x01"W\n\x0bOrderStatus\x12\x08\n\x04OPEN\x10\x00\x12\n\n\x06\x46ILLED\x10\x01\x12\r\n\tCANCELLED\x10\x02\x12\n\n\x06\x43LOSED\x10\x03\x12\n\n\x06\x46\x41ILED\x10\x04\x12\x0b\n\x07\x45XPIRED\x10\x05"\x1e\n\tOrderSide\x12\x07\n\x03\x42UY\x10\x00\x12\x08\n\x04SELL\x10\x01""\n\tOrderType\x12\t\n\x05LIMIT\x10\x00\x12\n\n\x06MARKET\x10\x01\x42\x05\n\x03_idB\x0e\n\x0c_exchange_idB\x12\n\x10_client_order_idB\x0c\n\n_timestampB\x0b\n\t_datetimeB\x17\n\x15_last_trade_timestampB\t\n\x07_statusB\t\n\x07_symbolB\x07\n\x05_typeB\x10\n\x0e_time_in_forceB\x0c\n\n_post_onlyB\x07\n\x05_sideB\x08\n\x06_priceB\r\n\x0b_stop_priceB\x10\n\x0e_trigger_priceB\x07\n\x05_costB\t\n\x07_amountB\t\n\x07_filledB\x0c\n\n_remainingB\x06\n\x04_feeB\n\n\x08_averageB\t\n\x07_tradesB\x07\n\x05_feesB\x18\n\x16_last_update_timestampB\x0e\n\x0c_reduce_onlyB\x14\n\x12_take_profit_priceB\x12\n\x10_stop_loss_price\x1aL\n\x06Orders\x12\x42\n\x06orders\x18\x01 \x03(\x0b\x32\x32.aea.eightballer.orders.v0_1_0.OrdersMessage.Order\x1a^\n\x19\x43reate_Order_Performative\x12\x41\n\x05order\x18\x01 \x01(\x0b\x32\x32.aea.eightballer.orders.v0_1_0.OrdersMessage.Order\x1av\n\x1a\x43reate_Orders_Performative\x12\x43\n\x06orders\x18\x01 \x01(\x0b\x32\x33.aea.eightballer.orders.v0_1_0.OrdersMessage.Orders\x12\x13\n\x0b\x65xchange_id\x18\x02 \x01(\t\x1a_\n\x1aOrder_Created_Performative\x12\x41\n\x05order\x18\x01 \x01(\x0b\x32\x32.aea.eightballer.orders.v0_1_0.OrdersMessage.Order\x1a\xf7\x01\n\x1bOrders_Created_Performative\x12\x43\n\x06orders\x18\x01 \x01(\x0b\x32\x33.aea.eightballer.orders.v0_1_0.OrdersMessage.Orders\x12\x64\n\x06\x65rrors\x18\x02 \x03(\x0b\x32T.aea.eightballer.orders.v0_1_0.OrdersMessage.Orders_Created_Performative.ErrorsEntry\x1a-\n\x0b\x45rrorsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a^\n\x19\x43\x61ncel_Order_Performative\x12\x41\n\x05order\x18\x01 \x01(\x0b\x32\x32.aea.eightballer.orders.v0_1_0.OrdersMessage.Order\x1av\n\x1a\x43\x61ncel_Orders_Performative\x12\x43\n\x06orders\x18\x01 \x01(\x0b\x32\x33.aea.eightballer.orders.v0_1_0.OrdersMessage.Orders\x12\x13\n\x0b\x65xchange_id\x18\x02 \x01(\t\x1a\\\n\x1e\x43\x61ncel_All_Orders_Performative\x12\x13\n\x0b\x65xchange_id\x18\x01 \x01(\t\x12\x0e\n\x06symbol\x18\x02 \x01(\t\x12\x15\n\rsymbol_is_set\x18\x03 \x01(\x08\x1a\x61\n\x1cOrder_Cancelled_Performative\x12\x41\n\x05order\x18\x01 \x01(\x0b\x32\x32.aea.eightballer.orders.v0_1_0.OrdersMessage.Order\x1a\xfb\x01\n\x1dOrders_Cancelled_Performative\x12\x43\n\x06orders\x18\x01 \x01(\x0b\x32\x33.aea.eightballer.orders.v0_1_0.OrdersMessage.Orders\x12\x66\n\x06\x65rrors\x18\x02 \x03(\x0b\x32V.aea.eightballer.orders.v0_1_0.OrdersMessage.Orders_Cancelled_Performative.ErrorsEntry\x1a-\n\x0b\x45rrorsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\xf9\x01\n\x17Get_Orders_Performative\x12\x13\n\x0b\x65xchange_id\x18\x01 \x01(\t\x12\x0e\n\x06symbol\x18\x02 \x01(\t\x12\x15\n\rsymbol_is_set\x18\x03 \x01(\x08\x12\x10\n\x08\x63urrency\x18\x04 \x01(\t\x12\x17\n\x0f\x63urrency_is_set\x18\x05 \x01(\x08\x12\x12\n\norder_type\x18\x06 \x01(\t\x12\x19\n\x11order_type_is_set\x18\x07 \x01(\x08\x12\x0c\n\x04side\x18\x08 \x01(\t\x12\x13\n\x0bside_is_set\x18\t \x01(\x08\x12\x0e\n\x06status\x18\n \x01(\t\x12\x15\n\rstatus_is_set\x18\x0b \x01(\x08\x1a[\n\x16Get_Order_Performative\x12\x41\n\x05order\x18\x01 \x01(\x0b\x32\x32.aea.eightballer.orders.v0_1_0.OrdersMessage.Order\x1a\xcc\x01\n\x1cGet_Settlements_Performative\x12\x13\n\x0b\x65xchange_id\x18\x01 \x01(\t\x12\x10\n\x08\x63urrency\x18\x02 \x01(\t\x12\x17\n\x0f\x63urrency_is_set\x18\x03 \x01(\x08\x12\x15\n\rend_timestamp\x18\x04 \x01(\x01\x12\x1c\n\x14\x65nd_timestamp_is_set\x18\x05 \x01(\x08\x12\x17\n\x0fstart_timestamp\x18\x06 \x01(\x01\x12\x1e\n\x16start_timestamp_is_set\x18\x07 \x01(\x08\x1aW\n\x12Order_Performative\x12\x41\n\x05order\x18\x01 \x01(\x0b\x32\x32.aea.eightballer.orders.v0_1_0.OrdersMessage.Order\x1aZ\n\x13Orders_Performative\x12\x43\n\x06orders\x18\x01 \x01(\x0b\x32\x33.aea.eightballer.orders.v0_1_0.OrdersMessage.Orders\x1a\x89\x02\n\x12\x45rror_Performative\x12J\n\nerror_code\x18\x01 \x01(\x0b\x32\x36.aea.eightballer.orders.v0_1_0.OrdersMessage.ErrorCode\x12\x11\n\terror_msg\x18\x02 \x01(\t\x12\x62\n\nerror_data\x18\x03 \x03(\x0b\x32N.aea.eightballer.orders.v0_1_0.OrdersMessage.Error_Performative.ErrorDataEntry\x1a\x30\n\x0e\x45rrorDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x42\x0e\n\x0cperformativeb\x06proto3'
+)
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, "orders_pb2", globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+    DESCRIPTOR._options = None
+    _ORDERSMESSAGE_ORDERS_CREATED_PERFORMATIVE_ERRORSENTRY._options = None
+    _ORDERSMESSAGE_ORDERS_CREATED_PERFORMATIVE_ERRORSENTRY._serialized_options = (
+        b"8\001"
+    )
+    _ORDERSMESSAGE_ORDERS_CANCELLED_PERFORMATIVE_ERRORSENTRY._options = None
+    _ORDERSMESSAGE_ORDERS_CANCELLED_PERFORMATIVE_ERRORSENTRY._serialized_options = (
+        b"8\001"
+    )
+    _ORDERSMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY._options = None
+    _ORDERSMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY._serialized_options = b"8\001"
+    _ORDERSMESSAGE._serialized_start = 48
+    _ORDERSMESSAGE._serialized_end = 5430
+    _ORDERSMESSAGE_ERRORCODE._serialized_start = 1496
+    _ORDERSMESSAGE_ERRORCODE._serialized_end = 1726
+    _ORDERSMESSAGE_ERRORCODE_ERRORCODEENUM._serialized_start = 1599
+    _ORDERSMESSAGE_ERRORCODE_ERRORCODEENUM._serialized_end = 1726
+    _ORDERSMESSAGE_ORDER._serialized_start = 1729
+    _ORDERSMESSAGE_ORDER._serialized_end = 3109
+    _ORDERSMESSAGE_ORDER_ORDERSTATUS._serialized_start = 2575
+    _ORDERSMESSAGE_ORDER_ORDERSTATUS._serialized_end = 2662
+    _ORDERSMESSAGE_ORDER_ORDERSIDE._serialized_start = 2664
+    _ORDERSMESSAGE_ORDER_ORDERSIDE._serialized_end = 2694
+    _ORDERSMESSAGE_ORDER_ORDERTYPE._serialized_start = 2696
+    _ORDERSMESSAGE_ORDER_ORDERTYPE._serialized_end = 2730
+    _ORDERSMESSAGE_ORDERS._serialized_start = 3111
+    _ORDERSMESSAGE_ORDERS._serialized_end = 3187
+    _ORDERSMESSAGE_CREATE_ORDER_PERFORMATIVE._serialized_start = 3189
+    _ORDERSMESSAGE_CREATE_ORDER_PERFORMATIVE._serialized_end = 3283
+    _ORDERSMESSAGE_CREATE_ORDERS_PERFORMATIVE._serialized_start = 3285
+    _ORDERSMESSAGE_CREATE_ORDERS_PERFORMATIVE._serialized_end = 3403
+    _ORDERSMESSAGE_ORDER_CREATED_PERFORMATIVE._serialized_start = 3405
+    _ORDERSMESSAGE_ORDER_CREATED_PERFORMATIVE._serialized_end = 3500
+    _ORDERSMESSAGE_ORDERS_CREATED_PERFORMATIVE._serialized_start = 3503
+    _ORDERSMESSAGE_ORDERS_CREATED_PERFORMATIVE._serialized_end = 3750
+    _ORDERSMESSAGE_ORDERS_CREATED_PERFORMATIVE_ERRORSENTRY._serialized_start = 3705
+    _ORDERSMESSAGE_ORDERS_CREATED_PERFORMATIVE_ERRORSENTRY._serialized_end = 3750
+    _ORDERSMESSAGE_CANCEL_ORDER_PERFORMATIVE._serialized_start = 3752
+    _ORDERSMESSAGE_CANCEL_ORDER_PERFORMATIVE._serialized_end = 3846
+    _ORDERSMESSAGE_CANCEL_ORDERS_PERFORMATIVE._serialized_start = 3848
+    _ORDERSMESSAGE_CANCEL_ORDERS_PERFORMATIVE._serialized_end = 3966
+    _ORDERSMESSAGE_CANCEL_ALL_ORDERS_PERFORMATIVE._serialized_start = 3968
+    _ORDERSMESSAGE_CANCEL_ALL_ORDERS_PERFORMATIVE._serialized_end = 4060
+    _ORDERSMESSAGE_ORDER_CANCELLED_PERFORMATIVE._serialized_start = 4062
+    _ORDERSMESSAGE_ORDER_CANCELLED_PERFORMATIVE._serialized_end = 4159
+    _ORDERSMESSAGE_ORDERS_CANCELLED_PERFORMATIVE._serialized_start = 4162
+    _ORDERSMESSAGE_ORDERS_CANCELLED_PERFORMATIVE._serialized_end = 4413
+    _ORDERSMESSAGE_ORDERS_CANCELLED_PERFORMATIVE_ERRORSENTRY._serialized_start = 3705
+    _ORDERSMESSAGE_ORDERS_CANCELLED_PERFORMATIVE_ERRORSENTRY._serialized_end = 3750
+    _ORDERSMESSAGE_GET_ORDERS_PERFORMATIVE._serialized_start = 4416
+    _ORDERSMESSAGE_GET_ORDERS_PERFORMATIVE._serialized_end = 4665
+    _ORDERSMESSAGE_GET_ORDER_PERFORMATIVE._serialized_start = 4667
+    _ORDERSMESSAGE_GET_ORDER_PERFORMATIVE._serialized_end = 4758
+    _ORDERSMESSAGE_GET_SETTLEMENTS_PERFORMATIVE._serialized_start = 4761
+    _ORDERSMESSAGE_GET_SETTLEMENTS_PERFORMATIVE._serialized_end = 4965
+    _ORDERSMESSAGE_ORDER_PERFORMATIVE._serialized_start = 4967
+    _ORDERSMESSAGE_ORDER_PERFORMATIVE._serialized_end = 5054
+    _ORDERSMESSAGE_ORDERS_PERFORMATIVE._serialized_start = 5056
+    _ORDERSMESSAGE_ORDERS_PERFORMATIVE._serialized_end = 5146
+    _ORDERSMESSAGE_ERROR_PERFORMATIVE._serialized_start = 5149
+    _ORDERSMESSAGE_ERROR_PERFORMATIVE._serialized_end = 5414
+    _ORDERSMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY._serialized_start = 5366
+    _ORDERSMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY._serialized_end = 5414
+# @@protoc_insertion_point(module_scope)
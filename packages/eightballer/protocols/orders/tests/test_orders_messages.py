@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test messages module for orders protocol."""
+
+# pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
+from typing import List
+
+from aea.test_tools.test_protocol import BaseProtocolMessagesTestCase
+
+from packages.eightballer.protocols.orders.custom_types import (
+    ErrorCode,
+    Order,
+    Orders,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+)
+from packages.eightballer.protocols.orders.message import OrdersMessage
+
+ORDER = Order(
+    id="fff6bf6d-4fc2-42d3-be76-da209e7ca1eb",
+    exchange_id="lyra",
+    client_order_id="order-1",
+    timestamp=1710616517152,
+    datetime="2024-03-16T19:15:17",
+    status=OrderStatus.OPEN,
+    symbol="ETH-PERP",
+    type=OrderType.LIMIT,
+    time_in_force="gtc",
+    post_only=False,
+    side=OrderSide.SELL,
+    price=3600.5,
+    amount=6.3,
+    filled=0.0,
+    remaining=6.3,
+    trades=[],
+    reduce_only=False,
+)
+
+
+class TestMessageOrders(BaseProtocolMessagesTestCase):
+    """Test for the 'orders' protocol message."""
+
+    MESSAGE_CLASS = OrdersMessage
+
+    def build_messages(self) -> List[OrdersMessage]:  # type: ignore[override]
+        """Build the messages to be used for testing."""
+        return [
+            OrdersMessage(
+                performative=OrdersMessage.Performative.CREATE_ORDER,
+                order=ORDER,
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.CREATE_ORDERS,
+                orders=Orders(orders=[ORDER, Order(exchange_id="lyra", client_order_id="order-2")]),
+                exchange_id="some str",
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ORDER_CREATED,
+                order=ORDER,
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ORDERS_CREATED,
+                orders=Orders(orders=[ORDER, Order(exchange_id="lyra", client_order_id="order-2")]),
+                errors={"some str": "some str"},
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.CANCEL_ORDER,
+                order=ORDER,
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.CANCEL_ORDERS,
+                orders=Orders(orders=[ORDER, Order(exchange_id="lyra", client_order_id="order-2")]),
+                exchange_id="some str",
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.CANCEL_ALL_ORDERS,
+                exchange_id="some str",
+                symbol="some str",
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ORDER_CANCELLED,
+                order=ORDER,
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ORDERS_CANCELLED,
+                orders=Orders(orders=[ORDER, Order(exchange_id="lyra", client_order_id="order-2")]),
+                errors={"some str": "some str"},
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.GET_ORDERS,
+                exchange_id="some str",
+                symbol="some str",
+                currency="some str",
+                order_type="some str",
+                side="some str",
+                status="some str",
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.GET_ORDER,
+                order=ORDER,
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.GET_SETTLEMENTS,
+                exchange_id="some str",
+                currency="some str",
+                end_timestamp=1.0,
+                start_timestamp=1.0,
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ORDER,
+                order=ORDER,
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ORDERS,
+                orders=Orders(orders=[ORDER, Order(exchange_id="lyra", client_order_id="order-2")]),
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ERROR,
+                error_code=ErrorCode.INVALID_MESSAGE,
+                error_msg="some str",
+                error_data={"some str": b"some_bytes"},
+            ),
+        ]
+
+    def build_inconsistent(self) -> List[OrdersMessage]:  # type: ignore[override]
+        """Build inconsistent messages to be used for testing."""
+        return [
+            OrdersMessage(
+                performative=OrdersMessage.Performative.CREATE_ORDER,
+                # skip content: order
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.CREATE_ORDERS,
+                # skip content: orders
+                exchange_id="some str",
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ORDER_CREATED,
+                # skip content: order
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ORDERS_CREATED,
+                # skip content: orders
+                errors={"some str": "some str"},
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.CANCEL_ORDER,
+                # skip content: order
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.CANCEL_ORDERS,
+                # skip content: orders
+                exchange_id="some str",
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.CANCEL_ALL_ORDERS,
+                # skip content: exchange_id
+                symbol="some str",
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ORDER_CANCELLED,
+                # skip content: order
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ORDERS_CANCELLED,
+                # skip content: orders
+                errors={"some str": "some str"},
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.GET_ORDERS,
+                # skip content: exchange_id
+                symbol="some str",
+                currency="some str",
+                order_type="some str",
+                side="some str",
+                status="some str",
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.GET_ORDER,
+                # skip content: order
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.GET_SETTLEMENTS,
+                # skip content: exchange_id
+                currency="some str",
+                end_timestamp=1.0,
+                start_timestamp=1.0,
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ORDER,
+                # skip content: order
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ORDERS,
+                # skip content: orders
+            ),
+            OrdersMessage(
+                performative=OrdersMessage.Performative.ERROR,
+                # skip content: error_code
+                error_msg="some str",
+                error_data={"some str": b"some_bytes"},
+            ),
+        ]
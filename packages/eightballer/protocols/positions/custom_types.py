@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains class representations corresponding to every custom type in the protocol specification."""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional, Sequence
+
+FLOAT_FIELDS = (
+    "size",
+    "entry_price",
+    "mark_price",
+    "notional",
+    "leverage",
+    "liquidation_price",
+    "initial_margin",
+    "maintenance_margin",
+    "realized_pnl",
+    "unrealized_pnl",
+)
+# the fields of a ccxt position, by the name of the field of the protocol they are read into.
+CCXT_FIELDS = {
+    "entry_price": "entryPrice",
+    "mark_price": "markPrice",
+    "notional": "notional",
+    "leverage": "leverage",
+    "liquidation_price": "liquidationPrice",
+    "initial_margin": "initialMargin",
+    "maintenance_margin": "maintenanceMargin",
+    "realized_pnl": "realizedPnl",
+    "unrealized_pnl": "unrealizedPnl",
+}
+
+
+class ErrorCode(Enum):
+    """This class represents an instance of ErrorCode."""
+
+    UNKNOWN_EXCHANGE = 0
+    UNKNOWN_POSITION = 1
+    API_ERROR = 2
+
+    @staticmethod
+    def encode(error_code_protobuf_object, error_code_object: "ErrorCode") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the error_code_protobuf_object argument is matched with the instance of this
+        class in the 'error_code_object' argument.
+
+        :param error_code_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param error_code_object: an instance of this class to be encoded in the protocol buffer object.
+        """
+        error_code_protobuf_object.error_code = error_code_object.value
+
+    @classmethod
+    def decode(cls, error_code_protobuf_object) -> "ErrorCode":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the
+        'error_code_protobuf_object' argument.
+
+        :param error_code_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the
+        'error_code_protobuf_object' argument.
+        """
+        return ErrorCode(error_code_protobuf_object.error_code)
+
+
+@dataclass
+class Position:
+    """This class represents an instance of Position, its size signed, negative when short."""
+
+    id: str
+    symbol: str
+    exchange_id: str = ""
+    timestamp: Optional[int] = None
+    datetime: Optional[str] = None
+    size: Optional[float] = None
+    entry_price: Optional[float] = None
+    mark_price: Optional[float] = None
+    notional: Optional[float] = None
+    leverage: Optional[float] = None
+    liquidation_price: Optional[float] = None
+    initial_margin: Optional[float] = None
+    maintenance_margin: Optional[float] = None
+    realized_pnl: Optional[float] = None
+    unrealized_pnl: Optional[float] = None
+    side: Optional[str] = None
+
+    @classmethod
+    def from_api_call(cls, api_call: Dict[str, Any], exchange_id: str = "") -> "Position":
+        """
+        Create a position from a ccxt position.
+
+        ccxt holds the size of a position unsigned, in `contracts`, with its side; a `size`
+        already set on the position, i.e. read from the raw response, is kept as it is.
+        """
+        size = api_call.get("size")
+        if size is None and api_call.get("contracts") is not None:
+            size = -api_call["contracts"] if api_call.get("side") == "short" else api_call["contracts"]
+        return cls(
+            id=str(api_call.get("id") or api_call["symbol"]),
+            symbol=api_call["symbol"],
+            exchange_id=exchange_id,
+            timestamp=api_call.get("timestamp"),
+            datetime=api_call.get("datetime"),
+            size=size,
+            side=api_call.get("side"),
+            **{name: api_call.get(key) for name, key in CCXT_FIELDS.items()},
+        )
+
+    @staticmethod
+    def encode(position_protobuf_object, position_object: "Position") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the position_protobuf_object argument is matched with the instance of this
+        class in the 'position_object' argument.
+
+        :param position_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param position_object: an instance of this class to be encoded in the protocol buffer object.
+        """
+        position_protobuf_object.id = position_object.id
+        position_protobuf_object.symbol = position_object.symbol
+        position_protobuf_object.exchange_id = position_object.exchange_id
+        if position_object.timestamp is not None:
+            position_protobuf_object.timestamp = int(position_object.timestamp)
+        if position_object.datetime is not None:
+            position_protobuf_object.datetime = str(position_object.datetime)
+        if position_object.side is not None:
+            position_protobuf_object.side = position_object.side
+        for name in FLOAT_FIELDS:
+            value = getattr(position_object, name)
+            if value is not None:
+                setattr(position_protobuf_object, name, float(value))
+
+    @classmethod
+    def decode(cls, position_protobuf_object) -> "Position":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the
+        'position_protobuf_object' argument.
+
+        :param position_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the
+        'position_protobuf_object' argument.
+        """
+        return cls(
+            id=position_protobuf_object.id,
+            symbol=position_protobuf_object.symbol,
+            exchange_id=position_protobuf_object.exchange_id,
+            **{
+                name: _optional(position_protobuf_object, name)
+                for name in ("timestamp", "datetime", "side", *FLOAT_FIELDS)
+            },
+        )
+
+
+@dataclass
+class Positions:
+    """This class represents an instance of Positions."""
+
+    positions: Sequence[Position] = field(default_factory=list)
+
+    @staticmethod
+    def encode(positions_protobuf_object, positions_object: "Positions") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the positions_protobuf_object argument is matched with the instance of this
+        class in the 'positions_object' argument.
+
+        :param positions_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param positions_object: an instance of this class to be encoded in the protocol buffer object.
+        """
+        for position in positions_object.positions:
+            Position.encode(positions_protobuf_object.positions.add(), position)
+
+    @classmethod
+    def decode(cls, positions_protobuf_object) -> "Positions":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the
+        'positions_protobuf_object' argument.
+
+        :param positions_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the
+        'positions_protobuf_object' argument.
+        """
+        return cls(positions=[Position.decode(position) for position in positions_protobuf_object.positions])
+
+
+def _optional(protobuf_object, name: str):
+    """Get an optional field of a protocol buffer object, or None if it is not set."""
+    return getattr(protobuf_object, name) if protobuf_object.HasField(name) else None
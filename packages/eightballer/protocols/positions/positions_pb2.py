@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: positions.proto
+"""Generated protocol buffer code."""
+
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
+    b'\n\x0fpositions.proto\x12 aea.eightballer.positions.v0_1_0"\xfd\x16\n\x10PositionsMessage\x12\x66\n\rall_positions\x18\x05 \x01(\x0b\x32M.aea.eightballer.positions.v0_1_0.PositionsMessage.All_Positions_PerformativeH\x00\x12V\n\x05\x65rror\x18\x06 \x01(\x0b\x32\x45.aea.eightballer.positions.v0_1_0.PositionsMessage.Error_PerformativeH\x00\x12n\n\x11get_all_positions\x18\x07 \x01(\x0b\x32Q.aea.eightballer.positions.v0_1_0.PositionsMessage.Get_All_Positions_PerformativeH\x00\x12\x64\n\x0cget_position\x18\x08 \x01(\x0b\x32L.aea.eightballer.positions.v0_1_0.PositionsMessage.Get_Position_PerformativeH\x00\x12\\\n\x08position\x18\t \x01(\x0b\x32H.aea.eightballer.positions.v0_1_0.PositionsMessage.Position_PerformativeH\x00\x12l\n\x10positions_update\x18\n \x01(\x0b\x32P.aea.eightballer.positions.v0_1_0.PositionsMessage.Positions_Update_PerformativeH\x00\x12^\n\tsubscribe\x18\x0b \x01(\x0b\x32I.aea.eightballer.positions.v0_1_0.PositionsMessage.Subscribe_PerformativeH\x00\x12\x62\n\x0bunsubscribe\x18\x0c \x01(\x0b\x32K.aea.eightballer.positions.v0_1_0.PositionsMessage.Unsubscribe_PerformativeH\x00\x12\x64\n\x0cunsubscribed\x18\r \x01(\x0b\x32L.aea.eightballer.positions.v0_1_0.PositionsMessage.Unsubscribed_PerformativeH\x00\x1a\xb7\x01\n\tErrorCode\x12^\n\nerror_code\x18\x01 \x01(\x0e\x32J.aea.eightballer.positions.v0_1_0.PositionsMessage.ErrorCode.ErrorCodeEnum"J\n\rErrorCodeEnum\x12\x14\n\x10UNKNOWN_EXCHANGE\x10\x00\x12\x14\n\x10UNKNOWN_POSITION\x10\x01\x12\r\n\tAPI_ERROR\x10\x02\x1a\xd1\x04\n\x08Position\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0e\n\x06symbol\x18\x02 \x01(\t\x12\x16\n\ttimestamp\x18\x03 \x01(\x03H\x00\x88\x01\x01\x12\x15\n\x08\x64\x61tetime\x18\x04 \x01(\tH\x01\x88\x01\x01\x12\x11\n\x04size\x18\x05 \x01(\x01H\x02\x88\x01\x01\x12\x18\n\x0b\x65ntry_price\x18\x06 \x01(\x01H\x03\x88\x01\x01\x12\x17\n\nmark_price\x18\x07 \x01(\x01H\x04\x88\x01\x01\x12\x15\n\x08notional\x18\x08 \x01(\x01H\x05\x88\x01\x01\x12\x15\n\x08leverage\x18\t \x01(\x01H\x06\x88\x01\x01\x12\x1e\n\x11liquidation_price\x18\n \x01(\x01H\x07\x88\x01\x01\x12\x1b\n\x0einitial_margin\x18\x0b \x01(\x01H\x08\x88\x01\x01\x12\x1f\n\x12maintenance_margin\x18\x0c \x01(\x01H\t\x88\x01\x01\x12\x19\n\x0crealized_pnl\x18\r \x01(\x01H\n\x88\x01\x01\x12\x1b\n\x0eunrealized_pnl\x18\x0e \x01(\x01H\x0b\x88\x01\x01\x12\x11\n\x04side\x18\x0f \x01(\tH\x0c\x88\x01\x01\x12\x13\n\x0b\x65xchange_id\x18\x10 \x01(\tB\x0c\n\n_timestampB\x0b\n\t_datetimeB\x07\n\x05_sizeB\x0e\n\x0c_entry_priceB\r\n\x0b_mark_priceB\x0b\n\t_notionalB\x0b\n\t_leverageB\x14\n\x12_liquidation_priceB\x11\n\x0f_initial_marginB\x15\n\x13_maintenance_marginB\x0f\n\r_realized_pnlB\x11\n\x0f_unrealized_pnlB\x07\n\x05_side\x1a[\n\tPositions\x12N\n\tpositions\x18\x01 \x03(\x0b\x32;.aea.eightballer.positions.v0_1_0.PositionsMessage.Position\x1a\xea\x01\n\x1eGet_All_Positions_Performative\x12\x13\n\x0b\x65xchange_id\x18\x01 \x01(\t\x12m\n\x06params\x18\x02 \x03(\x0b\x32].aea.eightballer.positions.v0_1_0.PositionsMessage.Get_All_Positions_Performative.ParamsEntry\x12\x15\n\rparams_is_set\x18\x03 \x01(\x08\x1a-\n\x0bParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a\x45\n\x19Get_Position_Performative\x12\x13\n\x0bposition_id\x18\x01 \x01(\t\x12\x13\n\x0b\x65xchange_id\x18\x02 \x01(\t\x1a\xda\x01\n\x16Subscribe_Performative\x12\x13\n\x0b\x65xchange_id\x18\x01 \x01(\t\x12\x65\n\x06params\x18\x02 \x03(\x0b\x32U.aea.eightballer.positions.v0_1_0.PositionsMessage.Subscribe_Performative.ParamsEntry\x12\x15\n\rparams_is_set\x18\x03 \x01(\x08\x1a-\n\x0bParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a/\n\x18Unsubscribe_Performative\x12\x13\n\x0b\x65xchange_id\x18\x01 \x01(\t\x1a\x82\x01\n\x1a\x41ll_Positions_Performative\x12O\n\tpositions\x18\x01 \x01(\x0b\x32<.aea.eightballer.positions.v0_1_0.PositionsMessage.Positions\x12\x13\n\x0b\x65xchange_id\x18\x02 \x01(\t\x1a{\n\x15Position_Performative\x12M\n\x08position\x18\x01 \x01(\x0b\x32;.aea.eightballer.positions.v0_1_0.PositionsMessage.Position\x12\x13\n\x0b\x65xchange_id\x18\x02 \x01(\t\x1a\x85\x01\n\x1dPositions_Update_Performative\x12O\n\tpositions\x18\x01 \x01(\x0b\x32<.aea.eightballer.positions.v0_1_0.PositionsMessage.Positions\x12\x13\n\x0b\x65xchange_id\x18\x02 \x01(\t\x1ay\n\x12\x45rror_Performative\x12P\n\nerror_code\x18\x01 \x01(\x0b\x32<.aea.eightballer.positions.v0_1_0.PositionsMessage.ErrorCode\x12\x11\n\terror_msg\x18\x02 \x01(\t\x1a\x1b\n\x19Unsubscribed_PerformativeB\x0e\n\x0cperformativeb\x06proto3'
+)
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, "positions_pb2", globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+    DESCRIPTOR._options = None
+    _POSITIONSMESSAGE_GET_ALL_POSITIONS_PERFORMATIVE_PARAMSENTRY._options = None
+    _POSITIONSMESSAGE_GET_ALL_POSITIONS_PERFORMATIVE_PARAMSENTRY._serialized_options = (
+        b"8\001"
+    )
+    _POSITIONSMESSAGE_SUBSCRIBE_PERFORMATIVE_PARAMSENTRY._options = None
+    _POSITIONSMESSAGE_SUBSCRIBE_PERFORMATIVE_PARAMSENTRY._serialized_options = b"8\001"
+    _POSITIONSMESSAGE._serialized_start = 54
+    _POSITIONSMESSAGE._serialized_end = 2995
+    _POSITIONSMESSAGE_ERRORCODE._serialized_start = 983
+    _POSITIONSMESSAGE_ERRORCODE._serialized_end = 1166
+    _POSITIONSMESSAGE_ERRORCODE_ERRORCODEENUM._serialized_start = 1092
+    _POSITIONSMESSAGE_ERRORCODE_ERRORCODEENUM._serialized_end = 1166
+    _POSITIONSMESSAGE_POSITION._serialized_start = 1169
+    _POSITIONSMESSAGE_POSITION._serialized_end = 1762
+    _POSITIONSMESSAGE_POSITIONS._serialized_start = 1764
+    _POSITIONSMESSAGE_POSITIONS._serialized_end = 1855
+    _POSITIONSMESSAGE_GET_ALL_POSITIONS_PERFORMATIVE._serialized_start = 1858
+    _POSITIONSMESSAGE_GET_ALL_POSITIONS_PERFORMATIVE._serialized_end = 2092
+    _POSITIONSMESSAGE_GET_ALL_POSITIONS_PERFORMATIVE_PARAMSENTRY._serialized_start = (
+        2047
+    )
+    _POSITIONSMESSAGE_GET_ALL_POSITIONS_PERFORMATIVE_PARAMSENTRY._serialized_end = 2092
+    _POSITIONSMESSAGE_GET_POSITION_PERFORMATIVE._serialized_start = 2094
+    _POSITIONSMESSAGE_GET_POSITION_PERFORMATIVE._serialized_end = 2163
+    _POSITIONSMESSAGE_SUBSCRIBE_PERFORMATIVE._serialized_start = 2166
+    _POSITIONSMESSAGE_SUBSCRIBE_PERFORMATIVE._serialized_end = 2384
+    _POSITIONSMESSAGE_SUBSCRIBE_PERFORMATIVE_PARAMSENTRY._serialized_start = 2047
+    _POSITIONSMESSAGE_SUBSCRIBE_PERFORMATIVE_PARAMSENTRY._serialized_end = 2092
+    _POSITIONSMESSAGE_UNSUBSCRIBE_PERFORMATIVE._serialized_start = 2386
+    _POSITIONSMESSAGE_UNSUBSCRIBE_PERFORMATIVE._serialized_end = 2433
+    _POSITIONSMESSAGE_ALL_POSITIONS_PERFORMATIVE._serialized_start = 2436
+    _POSITIONSMESSAGE_ALL_POSITIONS_PERFORMATIVE._serialized_end = 2566
+    _POSITIONSMESSAGE_POSITION_PERFORMATIVE._serialized_start = 2568
+    _POSITIONSMESSAGE_POSITION_PERFORMATIVE._serialized_end = 2691
+    _POSITIONSMESSAGE_POSITIONS_UPDATE_PERFORMATIVE._serialized_start = 2694
+    _POSITIONSMESSAGE_POSITIONS_UPDATE_PERFORMATIVE._serialized_end = 2827
+    _POSITIONSMESSAGE_ERROR_PERFORMATIVE._serialized_start = 2829
+    _POSITIONSMESSAGE_ERROR_PERFORMATIVE._serialized_end = 2950
+    _POSITIONSMESSAGE_UNSUBSCRIBED_PERFORMATIVE._serialized_start = 2952
+    _POSITIONSMESSAGE_UNSUBSCRIBED_PERFORMATIVE._serialized_end = 2979
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test messages module for positions protocol."""
+
+# pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
+from typing import List
+
+from aea.test_tools.test_protocol import BaseProtocolMessagesTestCase
+
+from packages.eightballer.protocols.positions.custom_types import (
+    ErrorCode,
+    Position,
+    Positions,
+)
+from packages.eightballer.protocols.positions.message import PositionsMessage
+
+POSITION = Position(
+    id="ETH-PERP",
+    symbol="ETH-PERP",
+    exchange_id="lyra",
+    timestamp=1710434366705,
+    size=-1.5,
+    entry_price=3600.5,
+    mark_price=3610.0,
+    notional=-5415.0,
+    leverage=0.83,
+    initial_margin=-8669.87,
+    maintenance_margin=-7379.01,
+    realized_pnl=0.0,
+    unrealized_pnl=-14.25,
+    side="short",
+)
+BTC_POSITION = Position(id="BTC-PERP", symbol="BTC-PERP", exchange_id="lyra")
+
+
+class TestMessagePositions(BaseProtocolMessagesTestCase):
+    """Test for the 'positions' protocol message."""
+
+    MESSAGE_CLASS = PositionsMessage
+
+    def build_messages(self) -> List[PositionsMessage]:  # type: ignore[override]
+        """Build the messages to be used for testing."""
+        return [
+            PositionsMessage(
+                performative=PositionsMessage.Performative.GET_ALL_POSITIONS,
+                exchange_id="some str",
+                params={"some str": b"some_bytes"},
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.GET_POSITION,
+                position_id="some str",
+                exchange_id="some str",
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.SUBSCRIBE,
+                exchange_id="some str",
+                params={"some str": b"some_bytes"},
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.UNSUBSCRIBE,
+                exchange_id="some str",
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.ALL_POSITIONS,
+                positions=Positions(positions=[POSITION, BTC_POSITION]),
+                exchange_id="some str",
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.POSITION,
+                position=POSITION,
+                exchange_id="some str",
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.POSITIONS_UPDATE,
+                positions=Positions(positions=[POSITION, BTC_POSITION]),
+                exchange_id="some str",
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.ERROR,
+                error_code=ErrorCode.UNKNOWN_POSITION,
+                error_msg="some str",
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.UNSUBSCRIBED,
+            ),
+        ]
+
+    def build_inconsistent(self) -> List[PositionsMessage]:  # type: ignore[override]
+        """Build inconsistent messages to be used for testing."""
+        return [
+            PositionsMessage(
+                performative=PositionsMessage.Performative.GET_ALL_POSITIONS,
+                # skip content: exchange_id
+                params={"some str": b"some_bytes"},
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.GET_POSITION,
+                # skip content: position_id
+                exchange_id="some str",
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.SUBSCRIBE,
+                # skip content: exchange_id
+                params={"some str": b"some_bytes"},
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.UNSUBSCRIBE,
+                # skip content: exchange_id
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.ALL_POSITIONS,
+                # skip content: positions
+                exchange_id="some str",
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.POSITION,
+                # skip content: position
+                exchange_id="some str",
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.POSITIONS_UPDATE,
+                # skip content: positions
+                exchange_id="some str",
+            ),
+            PositionsMessage(
+                performative=PositionsMessage.Performative.ERROR,
+                # skip content: error_code
+                error_msg="some str",
+            ),
+        ]
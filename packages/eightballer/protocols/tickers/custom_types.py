@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains class representations corresponding to every custom type in the protocol specification."""
+
+# pylint: disable=invalid-name
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional, Sequence
+
+PRICE_FIELDS = (
+    "high",
+    "low",
+    "bid",
+    "bidVolume",
+    "ask",
+    "askVolume",
+    "vwap",
+    "open",
+    "close",
+    "last",
+    "previousClose",
+    "change",
+    "percentage",
+    "average",
+    "baseVolume",
+    "quoteVolume",
+)
+
+
+class ErrorCode(Enum):
+    """This class represents an instance of ErrorCode."""
+
+    UNKNOWN_EXCHANGE = 0
+    UNKNOWN_SYMBOL = 1
+    API_ERROR = 2
+
+    @staticmethod
+    def encode(error_code_protobuf_object, error_code_object: "ErrorCode") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the error_code_protobuf_object argument is matched with the instance of this
+        class in the 'error_code_object' argument.
+
+        :param error_code_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param error_code_object: an instance of this class to be encoded in the protocol buffer object.
+        """
+        error_code_protobuf_object.error_code = error_code_object.value
+
+    @classmethod
+    def decode(cls, error_code_protobuf_object) -> "ErrorCode":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the
+        'error_code_protobuf_object' argument.
+
+        :param error_code_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the
+        'error_code_protobuf_object' argument.
+        """
+        return ErrorCode(error_code_protobuf_object.error_code)
+
+
+@dataclass
+class Ticker:
+    """
+    This class represents an instance of Ticker, named as the fields of a ccxt ticker.
+
+    A ccxt ticker can be unpacked into it as it is; its index and mark prices and its
+    raw `info` are kept on the instance, but are not carried by the protocol.
+    """
+
+    symbol: str
+    timestamp: Optional[int] = None
+    datetime: Optional[str] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    bid: Optional[float] = None
+    bidVolume: Optional[float] = None
+    ask: Optional[float] = None
+    askVolume: Optional[float] = None
+    vwap: Optional[float] = None
+    open: Optional[float] = None
+    close: Optional[float] = None
+    last: Optional[float] = None
+    previousClose: Optional[float] = None
+    change: Optional[float] = None
+    percentage: Optional[float] = None
+    average: Optional[float] = None
+    baseVolume: Optional[float] = None
+    quoteVolume: Optional[float] = None
+    indexPrice: Optional[float] = field(default=None, compare=False)
+    markPrice: Optional[float] = field(default=None, compare=False)
+    info: Optional[Dict[str, Any]] = field(default=None, compare=False, repr=False)
+
+    @staticmethod
+    def encode(ticker_protobuf_object, ticker_object: "Ticker") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the ticker_protobuf_object argument is matched with the instance of this
+        class in the 'ticker_object' argument.
+
+        :param ticker_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param ticker_object: an instance of this class to be encoded in the protocol buffer object.
+        """
+        ticker_protobuf_object.symbol = ticker_object.symbol
+        if ticker_object.timestamp is not None:
+            ticker_protobuf_object.timestamp = int(ticker_object.timestamp)
+        if ticker_object.datetime is not None:
+            ticker_protobuf_object.datetime = str(ticker_object.datetime)
+        for name in PRICE_FIELDS:
+            value = getattr(ticker_object, name)
+            if value is not None:
+                setattr(ticker_protobuf_object, name, float(value))
+
+    @classmethod
+    def decode(cls, ticker_protobuf_object) -> "Ticker":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the
+        'ticker_protobuf_object' argument.
+
+        :param ticker_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the
+        'ticker_protobuf_object' argument.
+        """
+        return cls(
+            symbol=ticker_protobuf_object.symbol,
+            **{
+                name: _optional(ticker_protobuf_object, name)
+                for name in ("timestamp", "datetime", *PRICE_FIELDS)
+            },
+        )
+
+
+@dataclass
+class Tickers:
+    """This class represents an instance of Tickers."""
+
+    tickers: Sequence[Ticker] = field(default_factory=list)
+
+    @staticmethod
+    def encode(tickers_protobuf_object, tickers_object: "Tickers") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the tickers_protobuf_object argument is matched with the instance of this
+        class in the 'tickers_object' argument.
+
+        :param tickers_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param tickers_object: an instance of this class to be encoded in the protocol buffer object.
+        """
+        for ticker in tickers_object.tickers:
+            Ticker.encode(tickers_protobuf_object.tickers.add(), ticker)
+
+    @classmethod
+    def decode(cls, tickers_protobuf_object) -> "Tickers":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the
+        'tickers_protobuf_object' argument.
+
+        :param tickers_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the
+        'tickers_protobuf_object' argument.
+        """
+        return cls(tickers=[Ticker.decode(ticker) for ticker in tickers_protobuf_object.tickers])
+
+
+def _optional(protobuf_object, name: str):
+    """Get an optional field of a protocol buffer object, or None if it is not set."""
+    return getattr(protobuf_object, name) if protobuf_object.HasField(name) else None
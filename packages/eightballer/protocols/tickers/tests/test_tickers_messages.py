@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test messages module for tickers protocol."""
+
+# pylint: disable=too-many-statements,too-many-locals,no-member,too-few-public-methods,redefined-builtin
+from typing import List
+
+from aea.test_tools.test_protocol import BaseProtocolMessagesTestCase
+
+from packages.eightballer.protocols.tickers.custom_types import (
+    ErrorCode,
+    Ticker,
+    Tickers,
+)
+from packages.eightballer.protocols.tickers.message import TickersMessage
+
+TICKER = Ticker(
+    symbol="ETH-PERP",
+    timestamp=1710755194000,
+    datetime="2024-03-18T09:46:34",
+    high=3673.83,
+    low=3530.19,
+    bid=3600.5,
+    bidVolume=2.0,
+    ask=3601.0,
+    askVolume=1.5,
+    close=3600.75,
+    last=3600.75,
+    change=33.45,
+    percentage=0.00942,
+    baseVolume=1234.0,
+)
+
+
+class TestMessageTickers(BaseProtocolMessagesTestCase):
+    """Test for the 'tickers' protocol message."""
+
+    MESSAGE_CLASS = TickersMessage
+
+    def build_messages(self) -> List[TickersMessage]:  # type: ignore[override]
+        """Build the messages to be used for testing."""
+        return [
+            TickersMessage(
+                performative=TickersMessage.Performative.GET_ALL_TICKERS,
+                exchange_id="some str",
+                params={"some str": b"some_bytes"},
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.GET_TICKER,
+                symbol="some str",
+                exchange_id="some str",
+                params={"some str": b"some_bytes"},
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.SUBSCRIBE,
+                exchange_id="some str",
+                symbols=("some str",),
+                params={"some str": b"some_bytes"},
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.UNSUBSCRIBE,
+                exchange_id="some str",
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.TICKER,
+                ticker=TICKER,
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.ALL_TICKERS,
+                tickers=Tickers(tickers=[TICKER, Ticker(symbol="BTC-PERP")]),
+                exchange_id="some str",
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.TICKERS_UPDATE,
+                tickers=Tickers(tickers=[TICKER, Ticker(symbol="BTC-PERP")]),
+                exchange_id="some str",
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.ERROR,
+                error_code=ErrorCode.API_ERROR,
+                error_msg="some str",
+                error_data={"some str": b"some_bytes"},
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.UNSUBSCRIBED,
+            ),
+        ]
+
+    def build_inconsistent(self) -> List[TickersMessage]:  # type: ignore[override]
+        """Build inconsistent messages to be used for testing."""
+        return [
+            TickersMessage(
+                performative=TickersMessage.Performative.GET_ALL_TICKERS,
+                # skip content: exchange_id
+                params={"some str": b"some_bytes"},
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.GET_TICKER,
+                # skip content: symbol
+                exchange_id="some str",
+                params={"some str": b"some_bytes"},
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.SUBSCRIBE,
+                # skip content: exchange_id
+                symbols=("some str",),
+                params={"some str": b"some_bytes"},
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.UNSUBSCRIBE,
+                # skip content: exchange_id
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.TICKER,
+                # skip content: ticker
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.ALL_TICKERS,
+                # skip content: tickers
+                exchange_id="some str",
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.TICKERS_UPDATE,
+                # skip content: tickers
+                exchange_id="some str",
+            ),
+            TickersMessage(
+                performative=TickersMessage.Performative.ERROR,
+                # skip content: error_code
+                error_msg="some str",
+                error_data={"some str": b"some_bytes"},
+            ),
+        ]
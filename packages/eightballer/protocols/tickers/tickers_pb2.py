@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: tickers.proto
+"""Generated protocol buffer code."""
+
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
+    b'\n\rtickers.proto\x12\x1e\x61\x65\x61.eightballer.tickers.v0_1_0"\xf7\x18\n\x0eTickersMessage\x12^\n\x0b\x61ll_tickers\x18\x05 \x01(\x0b\x32G.aea.eightballer.tickers.v0_1_0.TickersMessage.All_Tickers_PerformativeH\x00\x12R\n\x05\x65rror\x18\x06 \x01(\x0b\x32\x41.aea.eightballer.tickers.v0_1_0.TickersMessage.Error_PerformativeH\x00\x12\x66\n\x0fget_all_tickers\x18\x07 \x01(\x0b\x32K.aea.eightballer.tickers.v0_1_0.TickersMessage.Get_All_Tickers_PerformativeH\x00\x12\\\n\nget_ticker\x18\x08 \x01(\x0b\x32\x46.aea.eightballer.tickers.v0_1_0.TickersMessage.Get_Ticker_PerformativeH\x00\x12Z\n\tsubscribe\x18\t \x01(\x0b\x32\x45.aea.eightballer.tickers.v0_1_0.TickersMessage.Subscribe_PerformativeH\x00\x12T\n\x06ticker\x18\n \x01(\x0b\x32\x42.aea.eightballer.tickers.v0_1_0.TickersMessage.Ticker_PerformativeH\x00\x12\x64\n\x0etickers_update\x18\x0b \x01(\x0b\x32J.aea.eightballer.tickers.v0_1_0.TickersMessage.Tickers_Update_PerformativeH\x00\x12^\n\x0bunsubscribe\x18\x0c \x01(\x0b\x32G.aea.eightballer.tickers.v0_1_0.TickersMessage.Unsubscribe_PerformativeH\x00\x12`\n\x0cunsubscribed\x18\r \x01(\x0b\x32H.aea.eightballer.tickers.v0_1_0.TickersMessage.Unsubscribed_PerformativeH\x00\x1a\xb1\x01\n\tErrorCode\x12Z\n\nerror_code\x18\x01 \x01(\x0e\x32\x46.aea.eightballer.tickers.v0_1_0.TickersMessage.ErrorCode.ErrorCodeEnum"H\n\rErrorCodeEnum\x12\x14\n\x10UNKNOWN_EXCHANGE\x10\x00\x12\x12\n\x0eUNKNOWN_SYMBOL\x10\x01\x12\r\n\tAPI_ERROR\x10\x02\x1a\xf4\x04\n\x06Ticker\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x16\n\ttimestamp\x18\x02 \x01(\x03H\x00\x88\x01\x01\x12\x15\n\x08\x64\x61tetime\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\x04high\x18\x04 \x01(\x01H\x02\x88\x01\x01\x12\x10\n\x03low\x18\x05 \x01(\x01H\x03\x88\x01\x01\x12\x10\n\x03\x62id\x18\x06 \x01(\x01H\x04\x88\x01\x01\x12\x16\n\tbidVolume\x18\x07 \x01(\x01H\x05\x88\x01\x01\x12\x10\n\x03\x61sk\x18\x08 \x01(\x01H\x06\x88\x01\x01\x12\x16\n\taskVolume\x18\t \x01(\x01H\x07\x88\x01\x01\x12\x11\n\x04vwap\x18\n \x01(\x01H\x08\x88\x01\x01\x12\x11\n\x04open\x18\x0b \x01(\x01H\t\x88\x01\x01\x12\x12\n\x05\x63lose\x18\x0c \x01(\x01H\n\x88\x01\x01\x12\x11\n\x04last\x18\r \x01(\x01H\x0b\x88\x01\x01\x12\x1a\n\rpreviousClose\x18\x0e \x01(\x01H\x0c\x88\x01\x01\x12\x13\n\x06\x63hange\x18\x0f \x01(\x01H\r\x88\x01\x01\x12\x17\n\npercentage\x18\x10 \x01(\x01H\x0e\x88\x01\x01\x12\x14\n\x07\x61verage\x18\x11 \x01(\x01H\x0f\x88\x01\x01\x12\x17\n\nbaseVolume\x18\x12 \x01(\x01H\x10\x88\x01\x01\x12\x18\n\x0bquoteVolume\x18\x13 \x01(\x01H\x11\x88\x01\x01\x42\x0c\n\n_timestampB\x0b\n\t_datetimeB\x07\n\x05_highB\x06\n\x04_lowB\x06\n\x04_bidB\x0c\n\n_bidVolumeB\x06\n\x04_askB\x0c\n\n_askVolumeB\x07\n\x05_vwapB\x07\n\x05_openB\x08\n\x06_closeB\x07\n\x05_lastB\x10\n\x0e_previousCloseB\t\n\x07_changeB\r\n\x0b_percentageB\n\n\x08_averageB\r\n\x0b_baseVolumeB\x0e\n\x0c_quoteVolume\x1aQ\n\x07Tickers\x12\x46\n\x07tickers\x18\x01 \x03(\x0b\x32\x35.aea.eightballer.tickers.v0_1_0.TickersMessage.Ticker\x1a\xe2\x01\n\x1cGet_All_Tickers_Performative\x12\x13\n\x0b\x65xchange_id\x18\x01 \x01(\t\x12g\n\x06params\x18\x02 \x03(\x0b\x32W.aea.eightballer.tickers.v0_1_0.TickersMessage.Get_All_Tickers_Performative.ParamsEntry\x12\x15\n\rparams_is_set\x18\x03 \x01(\x08\x1a-\n\x0bParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a\xe8\x01\n\x17Get_Ticker_Performative\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x13\n\x0b\x65xchange_id\x18\x02 \x01(\t\x12\x62\n\x06params\x18\x03 \x03(\x0b\x32R.aea.eightballer.tickers.v0_1_0.TickersMessage.Get_Ticker_Performative.ParamsEntry\x12\x15\n\rparams_is_set\x18\x04 \x01(\x08\x1a-\n\x0bParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a\xff\x01\n\x16Subscribe_Performative\x12\x13\n\x0b\x65xchange_id\x18\x01 \x01(\t\x12\x0f\n\x07symbols\x18\x02 \x03(\t\x12\x16\n\x0esymbols_is_set\x18\x03 \x01(\x08\x12\x61\n\x06params\x18\x04 \x03(\x0b\x32Q.aea.eightballer.tickers.v0_1_0.TickersMessage.Subscribe_Performative.ParamsEntry\x12\x15\n\rparams_is_set\x18\x05 \x01(\x08\x1a-\n\x0bParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a/\n\x18Unsubscribe_Performative\x12\x13\n\x0b\x65xchange_id\x18\x01 \x01(\t\x1a\\\n\x13Ticker_Performative\x12\x45\n\x06ticker\x18\x01 \x01(\x0b\x32\x35.aea.eightballer.tickers.v0_1_0.TickersMessage.Ticker\x1ax\n\x18\x41ll_Tickers_Performative\x12G\n\x07tickers\x18\x01 \x01(\x0b\x32\x36.aea.eightballer.tickers.v0_1_0.TickersMessage.Tickers\x12\x13\n\x0b\x65xchange_id\x18\x02 \x01(\t\x1a{\n\x1bTickers_Update_Performative\x12G\n\x07tickers\x18\x01 \x01(\x0b\x32\x36.aea.eightballer.tickers.v0_1_0.TickersMessage.Tickers\x12\x13\n\x0b\x65xchange_id\x18\x02 \x01(\t\x1a\x8d\x02\n\x12\x45rror_Performative\x12L\n\nerror_code\x18\x01 \x01(\x0b\x32\x38.aea.eightballer.tickers.v0_1_0.TickersMessage.ErrorCode\x12\x11\n\terror_msg\x18\x02 \x01(\t\x12\x64\n\nerror_data\x18\x03 \x03(\x0b\x32P.aea.eightballer.tickers.v0_1_0.TickersMessage.Error_Performative.ErrorDataEntry\x1a\x30\n\x0e\x45rrorDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a\x1b\n\x19Unsubscribed_PerformativeB\x0e\n\x0cperformativeb\x06proto3'
+)
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, "tickers_pb2", globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+    DESCRIPTOR._options = None
+    _TICKERSMESSAGE_GET_ALL_TICKERS_PERFORMATIVE_PARAMSENTRY._options = None
+    _TICKERSMESSAGE_GET_ALL_TICKERS_PERFORMATIVE_PARAMSENTRY._serialized_options = (
+        b"8\001"
+    )
+    _TICKERSMESSAGE_GET_TICKER_PERFORMATIVE_PARAMSENTRY._options = None
+    _TICKERSMESSAGE_GET_TICKER_PERFORMATIVE_PARAMSENTRY._serialized_options = b"8\001"
+    _TICKERSMESSAGE_SUBSCRIBE_PERFORMATIVE_PARAMSENTRY._options = None
+    _TICKERSMESSAGE_SUBSCRIBE_PERFORMATIVE_PARAMSENTRY._serialized_options = b"8\001"
+    _TICKERSMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY._options = None
+    _TICKERSMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY._serialized_options = b"8\001"
+    _TICKERSMESSAGE._serialized_start = 50
+    _TICKERSMESSAGE._serialized_end = 3241
+    _TICKERSMESSAGE_ERRORCODE._serialized_start = 921
+    _TICKERSMESSAGE_ERRORCODE._serialized_end = 1098
+    _TICKERSMESSAGE_ERRORCODE_ERRORCODEENUM._serialized_start = 1026
+    _TICKERSMESSAGE_ERRORCODE_ERRORCODEENUM._serialized_end = 1098
+    _TICKERSMESSAGE_TICKER._serialized_start = 1101
+    _TICKERSMESSAGE_TICKER._serialized_end = 1729
+    _TICKERSMESSAGE_TICKERS._serialized_start = 1731
+    _TICKERSMESSAGE_TICKERS._serialized_end = 1812
+    _TICKERSMESSAGE_GET_ALL_TICKERS_PERFORMATIVE._serialized_start = 1815
+    _TICKERSMESSAGE_GET_ALL_TICKERS_PERFORMATIVE._serialized_end = 2041
+    _TICKERSMESSAGE_GET_ALL_TICKERS_PERFORMATIVE_PARAMSENTRY._serialized_start = 1996
+    _TICKERSMESSAGE_GET_ALL_TICKERS_PERFORMATIVE_PARAMSENTRY._serialized_end = 2041
+    _TICKERSMESSAGE_GET_TICKER_PERFORMATIVE._serialized_start = 2044
+    _TICKERSMESSAGE_GET_TICKER_PERFORMATIVE._serialized_end = 2276
+    _TICKERSMESSAGE_GET_TICKER_PERFORMATIVE_PARAMSENTRY._serialized_start = 1996
+    _TICKERSMESSAGE_GET_TICKER_PERFORMATIVE_PARAMSENTRY._serialized_end = 2041
+    _TICKERSMESSAGE_SUBSCRIBE_PERFORMATIVE._serialized_start = 2279
+    _TICKERSMESSAGE_SUBSCRIBE_PERFORMATIVE._serialized_end = 2534
+    _TICKERSMESSAGE_SUBSCRIBE_PERFORMATIVE_PARAMSENTRY._serialized_start = 1996
+    _TICKERSMESSAGE_SUBSCRIBE_PERFORMATIVE_PARAMSENTRY._serialized_end = 2041
+    _TICKERSMESSAGE_UNSUBSCRIBE_PERFORMATIVE._serialized_start = 2536
+    _TICKERSMESSAGE_UNSUBSCRIBE_PERFORMATIVE._serialized_end = 2583
+    _TICKERSMESSAGE_TICKER_PERFORMATIVE._serialized_start = 2585
+    _TICKERSMESSAGE_TICKER_PERFORMATIVE._serialized_end = 2677
+    _TICKERSMESSAGE_ALL_TICKERS_PERFORMATIVE._serialized_start = 2679
+    _TICKERSMESSAGE_ALL_TICKERS_PERFORMATIVE._serialized_end = 2799
+    _TICKERSMESSAGE_TICKERS_UPDATE_PERFORMATIVE._serialized_start = 2801
+    _TICKERSMESSAGE_TICKERS_UPDATE_PERFORMATIVE._serialized_end = 2924
+    _TICKERSMESSAGE_ERROR_PERFORMATIVE._serialized_start = 2927
+    _TICKERSMESSAGE_ERROR_PERFORMATIVE._serialized_end = 3196
+    _TICKERSMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY._serialized_start = 3148
+    _TICKERSMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY._serialized_end = 3196
+    _TICKERSMESSAGE_UNSUBSCRIBED_PERFORMATIVE._serialized_start = 3198
+    _TICKERSMESSAGE_UNSUBSCRIBED_PERFORMATIVE._serialized_end = 3225
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the order books consolidated across venues, used as the input of the solver."""
+
+import heapq
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from packages.eightballer.skills.qs_solver_abci.order_books import LocalOrderBook
+
+
+class VenueLevel(NamedTuple):
+    """A level of a consolidated book, with its price once the taker fee of its venue is paid."""
+
+    adjusted_price: float
+    price: float
+    size: float
+    venue: str
+
+
+def normalise_symbol(symbol: str) -> str:
+    """Normalise a symbol, i.e. `eth-usdc` and `ETH_USDC` to `ETH/USDC`."""
+    return symbol.upper().replace("-", "/").replace("_", "/")
+
+
+class ConsolidatedOrderBook:
+    """
+    The book of a symbol across venues.
+
+    The levels of each venue are held sorted by fee adjusted price, best first, and
+    replaced only when that venue ticks. The merged levels are rebuilt lazily, with a
+    k-way merge of the venues, and the best prices are read from the venues directly.
+    """
+
+    def __init__(self, symbol: str) -> None:
+        """Initialise the book."""
+        self.symbol = symbol
+        self.bids: Dict[str, List[VenueLevel]] = {}
+        self.asks: Dict[str, List[VenueLevel]] = {}
+        self._merged: Dict[str, Optional[List[VenueLevel]]] = {"bids": None, "asks": None}
+
+    def update(self, venue: str, bids: Iterable[Any], asks: Iterable[Any], fee: float = 0.0) -> None:
+        """Replace the levels of a venue."""
+        self.bids[venue] = sorted(
+            (
+                VenueLevel(float(price) * (1 - fee), float(price), float(size), venue)
+                for price, size, *_ in bids
+                if float(size) > 0
+            ),
+            reverse=True,
+        )
+        self.asks[venue] = sorted(
+            VenueLevel(float(price) * (1 + fee), float(price), float(size), venue)
+            for price, size, *_ in asks
+            if float(size) > 0
+        )
+        self._merged = {"bids": None, "asks": None}
+
+    def remove(self, venue: str) -> None:
+        """Remove the levels of a venue."""
+        self.bids.pop(venue, None)
+        self.asks.pop(venue, None)
+        self._merged = {"bids": None, "asks": None}
+
+    def _levels(self, side: str) -> List[VenueLevel]:
+        merged = self._merged[side]
+        if merged is None:
+            venues = getattr(self, side).values()
+            merged = list(heapq.merge(*venues, reverse=side == "bids"))
+            self._merged[side] = merged
+        return merged
+
+    def bid_levels(self, depth: Optional[int] = None) -> List[VenueLevel]:
+        """Get the bids of every venue, highest fee adjusted price first."""
+        return self._levels("bids")[:depth]
+
+    def ask_levels(self, depth: Optional[int] = None) -> List[VenueLevel]:
+        """Get the asks of every venue, lowest fee adjusted price first."""
+        return self._levels("asks")[:depth]
+
+    def best_bid(self) -> Optional[VenueLevel]:
+        """Get the best bid across venues."""
+        return max((levels[0] for levels in self.bids.values() if levels), default=None)
+
+    def best_ask(self) -> Optional[VenueLevel]:
+        """Get the best ask across venues."""
+        return min((levels[0] for levels in self.asks.values() if levels), default=None)
+
+    def is_crossed(self) -> bool:
+        """Check whether buying on one venue and selling on another is profitable after fees."""
+        bid, ask = self.best_bid(), self.best_ask()
+        return bid is not None and ask is not None and bid.venue != ask.venue and bid.adjusted_price > ask.adjusted_price
+
+
+class ConsolidatedOrderBooks:
+    """
+    The books of every venue, consolidated by normalised symbol.
+
+    Venues are named after their exchange, and their symbols are normalised with
+    `normalise_symbol` unless mapped explicitly in `symbols`, keyed by venue and symbol.
+    """
+
+    def __init__(
+        self,
+        fees: Optional[Dict[str, float]] = None,
+        symbols: Optional[Dict[Tuple[str, str], str]] = None,
+    ) -> None:
+        """Initialise the books."""
+        self.fees = fees or {}
+        self.symbols = symbols or {}
+        self.books: Dict[str, ConsolidatedOrderBook] = {}
+
+    def normalise(self, venue: str, symbol: str) -> str:
+        """Get the normalised symbol of a venue symbol."""
+        return self.symbols.get((venue, symbol)) or normalise_symbol(symbol)
+
+    def get(self, symbol: str) -> Optional[ConsolidatedOrderBook]:
+        """Get the consolidated book of a normalised symbol."""
+        return self.books.get(symbol)
+
+    def update(self, venue: str, symbol: str, bids: Iterable[Any], asks: Iterable[Any]) -> ConsolidatedOrderBook:
+        """Replace the levels of a venue in the book of its symbol."""
+        normalised = self.normalise(venue, symbol)
+        book = self.books.get(normalised)
+        if book is None:
+            book = self.books[normalised] = ConsolidatedOrderBook(normalised)
+        book.update(venue, bids, asks, fee=self.fees.get(venue, 0.0))
+        return book
+
+    def update_from(self, book: LocalOrderBook) -> ConsolidatedOrderBook:
+        """Replace the levels of a venue with those of its local book."""
+        return self.update(book.exchange_id, book.symbol, book.bids.items(), book.asks.items())
+
+    def crossed(self) -> List[ConsolidatedOrderBook]:
+        """Get the books crossed across venues, after fees."""
+        return [book for book in self.books.values() if book.is_crossed()]
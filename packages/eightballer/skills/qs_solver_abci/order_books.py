@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the local order books of the skill, kept up to date from the order_book protocol."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from packages.eightballer.protocols.order_book.custom_types import OrderBook
+from packages.eightballer.protocols.order_book.message import OrderBookMessage
+
+
+class OrderBookOutOfSync(Exception):
+    """A diff does not follow the last update applied to the book, which must be resubscribed."""
+
+
+def _apply_levels(side: Dict[float, float], levels: List[Any]) -> None:
+    for price, size, *_ in levels:
+        if float(size) > 0:
+            side[float(price)] = float(size)
+        else:
+            side.pop(float(price), None)
+
+
+class LocalOrderBook:
+    """An order book rebuilt from a snapshot and the diffs which follow it."""
+
+    def __init__(self, exchange_id: str, symbol: str) -> None:
+        """Initialise the book."""
+        self.exchange_id = exchange_id
+        self.symbol = symbol
+        self.bids: Dict[float, float] = {}
+        self.asks: Dict[float, float] = {}
+        self.sequence: Optional[int] = None
+        self.timestamp: Optional[int] = None
+
+    def apply_snapshot(self, order_book: OrderBook) -> None:
+        """Replace the book with a snapshot."""
+        self.bids, self.asks = {}, {}
+        _apply_levels(self.bids, order_book.bids)
+        _apply_levels(self.asks, order_book.asks)
+        self.sequence = 0
+        self.timestamp = order_book.timestamp
+
+    def apply_diff(self, order_book: OrderBook, sequence: int) -> None:
+        """Apply the changed levels of a diff, a zero size removing a level."""
+        if self.sequence is None or sequence != self.sequence + 1:
+            raise OrderBookOutOfSync(
+                f"Diff {sequence} of {self.exchange_id} {self.symbol} does not follow {self.sequence}"
+            )
+        _apply_levels(self.bids, order_book.bids)
+        _apply_levels(self.asks, order_book.asks)
+        self.sequence = sequence
+        self.timestamp = order_book.timestamp
+
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        """Get the best bid."""
+        if not self.bids:
+            return None
+        price = max(self.bids)
+        return price, self.bids[price]
+
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        """Get the best ask."""
+        if not self.asks:
+            return None
+        price = min(self.asks)
+        return price, self.asks[price]
+
+    def to_order_book(self) -> OrderBook:
+        """Get the book, sorted best first."""
+        return OrderBook(
+            exchange_id=self.exchange_id,
+            symbol=self.symbol,
+            bids=[[price, self.bids[price]] for price in sorted(self.bids, reverse=True)],
+            asks=[[price, self.asks[price]] for price in sorted(self.asks)],
+            timestamp=self.timestamp,
+        )
+
+
+class LocalOrderBooks:
+    """The local order books of the skill, by exchange and symbol."""
+
+    def __init__(self) -> None:
+        """Initialise the books."""
+        self.books: Dict[Tuple[str, str], LocalOrderBook] = {}
+
+    def get(self, exchange_id: str, symbol: str) -> Optional[LocalOrderBook]:
+        """Get the book of a symbol."""
+        return self.books.get((exchange_id, symbol))
+
+    def handle(self, message: OrderBookMessage) -> LocalOrderBook:
+        """Apply an order book update or diff, raising `OrderBookOutOfSync` if a diff was missed."""
+        order_book = message.order_book
+        key = (order_book.exchange_id, order_book.symbol)
+        book = self.books.get(key)
+        if book is None:
+            book = self.books[key] = LocalOrderBook(*key)
+        if message.performative == OrderBookMessage.Performative.ORDER_BOOK_DIFF:
+            book.apply_diff(order_book, message.sequence)
+        else:
+            book.apply_snapshot(order_book)
+        return book
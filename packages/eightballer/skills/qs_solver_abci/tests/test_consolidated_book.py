@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the consolidated_book.py module of the QSSolver."""
+
+import pytest
+
+from packages.eightballer.skills.qs_solver_abci.consolidated_book import ConsolidatedOrderBooks, VenueLevel
+from packages.eightballer.skills.qs_solver_abci.order_books import LocalOrderBook
+
+
+class TestConsolidatedOrderBooks:
+    """Test ConsolidatedOrderBooks of QSSolver."""
+
+    def setup_method(self) -> None:
+        """Set up the test."""
+        self.books = ConsolidatedOrderBooks(
+            fees={"lyra": 0.001, "binance": 0.0},
+            symbols={("lyra", "ETH-PERP"): "ETH/USD"},
+        )
+        self.books.update("lyra", "ETH-PERP", bids=[[100, 1], [99, 2]], asks=[[101, 1]])
+        self.books.update("binance", "eth/usd", bids=[[100.05, 3]], asks=[[100.5, 1], [102, 0]])
+
+    def test_levels_are_merged_by_fee_adjusted_price(self) -> None:
+        """Test the levels of every venue are merged, keeping their venue and fee adjusted price."""
+        book = self.books.get("ETH/USD")
+
+        assert [level.venue for level in book.bid_levels()] == ["binance", "lyra", "lyra"]
+        assert book.bid_levels(1) == [VenueLevel(100.05, 100.05, 3.0, "binance")]
+        assert book.ask_levels()[1].adjusted_price == pytest.approx(101.101)
+        assert len(book.ask_levels()) == 2
+
+    def test_venue_tick_updates_its_levels_only(self) -> None:
+        """Test a venue ticking replaces its own levels."""
+        local = LocalOrderBook("lyra", "ETH-PERP")
+        local.bids, local.asks = {100.2: 1.0}, {100.3: 1.0}
+        book = self.books.update_from(local)
+
+        assert book.best_bid() == VenueLevel(pytest.approx(100.0998), 100.2, 1.0, "lyra")
+        assert book.best_ask().venue == "lyra"
+        assert len(book.bid_levels()) == 2
+
+    def test_crossed_books(self) -> None:
+        """Test books are only crossed across venues once fees are paid."""
+        assert not self.books.crossed()
+
+        self.books.update("binance", "ETH/USD", bids=[[101.5, 1]], asks=[[103, 1]])
+
+        assert [book.symbol for book in self.books.crossed()] == ["ETH/USD"]
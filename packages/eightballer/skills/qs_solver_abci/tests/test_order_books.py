@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the order_books.py module of the QSSolver."""
+
+import pytest
+
+from packages.eightballer.protocols.order_book.custom_types import OrderBook
+from packages.eightballer.skills.qs_solver_abci.order_books import LocalOrderBook, OrderBookOutOfSync
+
+
+def make_order_book(bids, asks) -> OrderBook:
+    """Make an order book."""
+    return OrderBook(exchange_id="lyra", symbol="ETH-PERP", bids=bids, asks=asks, timestamp=None, nonce=None)
+
+
+class TestLocalOrderBook:
+    """Test LocalOrderBook of QSSolver."""
+
+    def setup_method(self) -> None:
+        """Set up the test."""
+        self.book = LocalOrderBook("lyra", "ETH-PERP")
+        self.book.apply_snapshot(make_order_book(bids=[[100, 1], [99, 2]], asks=[[101, 1]]))
+
+    def test_apply_diff(self) -> None:
+        """Test diffs update and remove levels."""
+        self.book.apply_diff(make_order_book(bids=[[100, 0], [99.5, 3]], asks=[[101, 2]]), sequence=1)
+
+        assert self.book.best_bid() == (99.5, 3.0)
+        assert self.book.best_ask() == (101.0, 2.0)
+        assert self.book.to_order_book().bids == [[99.5, 3.0], [99.0, 2.0]]
+
+    def test_missed_diff(self) -> None:
+        """Test a diff which does not follow the last one is refused."""
+        with pytest.raises(OrderBookOutOfSync):
+            self.book.apply_diff(make_order_book(bids=[[100, 2]], asks=[]), sequence=2)
+        assert self.book.best_bid() == (100.0, 1.0)
+
+    def test_diff_before_snapshot(self) -> None:
+        """Test a diff is refused until a snapshot was applied."""
+        with pytest.raises(OrderBookOutOfSync):
+            LocalOrderBook("lyra", "ETH-PERP").apply_diff(make_order_book(bids=[], asks=[]), sequence=1)
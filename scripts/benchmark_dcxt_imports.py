@@ -0,0 +1,61 @@
+"""
+Benchmark the import time of the dcxt exchange registry and of each exchange client.
+
+Each import is timed in a fresh interpreter, run from the root of the repository:
+
+    python scripts/benchmark_dcxt_imports.py --runs 5
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+REGISTRY = "packages.eightballer.connections.dcxt.dcxt"
+
+TIMER = """
+import time
+start = time.perf_counter()
+import {module}
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def time_import(statement: str, runs: int) -> float:
+    """Time importing the registry and running a statement, in milliseconds."""
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", TIMER.format(module=REGISTRY, statement=statement)],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        timings.append(float(result.stdout.strip().splitlines()[-1]) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    from packages.eightballer.connections.dcxt.dcxt import (  # pylint: disable=import-outside-toplevel
+        EXCHANGE_REGISTRY,
+    )
+
+    print(f"{'import':<24}{'median (ms)':>12}")
+    print(f"{'registry':<24}{time_import('', args.runs):>12.1f}")
+    for exchange_id in EXCHANGE_REGISTRY:
+        statement = f"{REGISTRY}.get_exchange_class({exchange_id!r})"
+        try:
+            timing = time_import(statement, args.runs)
+        except subprocess.CalledProcessError:
+            print(f"{exchange_id:<24}{'failed':>12}")
+            continue
+        print(f"{exchange_id:<24}{timing:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()